@@ -1,23 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import sys
+from typing import Any
 
 import click
 from click.types import Path
+from dependency_injector.wiring import Provide, inject
 from textual.app import App
 from textual.keys import Keys
 from textual.reactive import Reactive
-from textual.widgets import NodeID, TreeNode
 
 from . import __version__
 from .config import APP_NAME, CLI_HELP, get_config
 from .containers import Container
+from .executor import BackgroundExecutor
+from .jenkins import Jenkins
+from .scheduler import Scheduler
 from .views import CustomScrollView, HomeView, SideBarView
 from .widgets import (
     FlashWidget,
     HelpWidget,
     NavWidget,
     ScrollBarWidget,
+    SearchResultsWidget,
     SearchWidget,
     ShowFlashNotification,
 )
@@ -27,11 +33,35 @@ class JenkinsTUI(App):
     """This is the base class for Jenkins TUI."""
 
     search_node: Reactive[int] = Reactive(0)
-    searchable_nodes: Reactive[dict[NodeID, TreeNode]] = Reactive({})
     show_help = Reactive(False)
     show_search = Reactive(False)
     nav_title: Reactive[str] = Reactive("")
 
+    @inject
+    def __init__(
+        self,
+        *args: Any,
+        client: Jenkins = Provide[Container.client],
+        executor: BackgroundExecutor = Provide[Container.executor],
+        scheduler: Scheduler = Provide[Container.scheduler],
+        **kwargs: Any,
+    ) -> None:
+        """This is the base class for Jenkins TUI.
+
+        Args:
+            *args (Any): Positional arguments that are passed to App().
+            **kwargs (Any): Keyword arguments that are passed to App().
+
+        # noqa: DAR101 client
+        # noqa: DAR101 executor
+        # noqa: DAR101 scheduler
+        """
+
+        super().__init__(*args, **kwargs)
+        self.client = client
+        self.executor = executor
+        self.scheduler = scheduler
+
     async def on_load(self) -> None:
         """Overrides on_load from App()"""
 
@@ -42,6 +72,16 @@ class JenkinsTUI(App):
     async def on_mount(self) -> None:
         """Overrides on_mount from App()"""
 
+        # The connection is tested while the rest of the ui is mounted
+        connection = asyncio.ensure_future(self.client.test_connection())
+
+        # Event loop lag is sampled for the lifetime of the app and written to the debug log
+        self.lag_monitor = asyncio.ensure_future(self.executor.monitor_lag())
+        self.set_interval(30, self.log_stats)
+
+        # Every poller in the app is run by the scheduler
+        self.scheduler.start(log=self.log)
+
         self.side_bar = SideBarView()
         await self.view.dock(self.side_bar, edge="left", size=40, name="sidebar")
 
@@ -51,6 +91,11 @@ class JenkinsTUI(App):
         self.search = SearchWidget()
         await self.view.dock(self.search, edge="top", size=3, name="search")
 
+        self.search_results = SearchResultsWidget()
+        await self.view.dock(
+            self.search_results, edge="top", size=12, name="search_results"
+        )
+
         self.container = CustomScrollView(
             intial_view=HomeView(), name="ContentScrollView"
         )
@@ -63,6 +108,20 @@ class JenkinsTUI(App):
         self.help = HelpWidget()
         await self.view.dock(self.help, edge="left", size=40, z=1)
 
+        await connection
+
+    def log_stats(self) -> None:
+        """Write the event loop lag, background executor counters, poller state, request counters, cache stats and tree label cache stats to the debug log."""
+
+        self.log(f"Event loop lag: {self.executor.lag_info}")
+        self.log(f"Scheduler: {self.scheduler.info}")
+        self.log(f"Client: {self.client.coalesce_info} {self.client.probe_info}")
+        if self.client.cache is not None:
+            self.log(f"Response cache: {self.client.cache.info}")
+        if self.client.builds is not None:
+            self.log(f"Build cache: {self.client.builds.info}")
+        self.log(f"Label cache: {self.side_bar.tree.label_cache_info}")
+
     async def watch_show_help(self, show_help: bool) -> None:
         """Watch show_help and update widget visibility.
 
@@ -81,6 +140,9 @@ class JenkinsTUI(App):
 
         self.search.visible = show_search
 
+        if not show_search:
+            self.search_results.update_results([])
+
     async def action_toggle_help(self) -> None:
         """Toggle the help widget."""
 
@@ -114,6 +176,15 @@ class JenkinsTUI(App):
 
             await self.side_bar.set_tree_focus()
 
+    async def action_quit(self) -> None:
+        """Overrides action_quit from App() so that pooled connections are closed and background work is stopped before exiting."""
+
+        self.lag_monitor.cancel()
+        self.scheduler.stop()
+        self.executor.shutdown()
+        await self.client.close()
+        await super().action_quit()
+
     async def handle_show_flash_notification(
         self, message: ShowFlashNotification
     ) -> None:
@@ -140,13 +211,25 @@ class JenkinsTUI(App):
     is_flag=True,
     help="Enable debug mode.",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Don't load or save a snapshot of the job tree or the completed builds.",
+)
+@click.option(
+    "--clear-cache",
+    is_flag=True,
+    help="Remove the snapshot of the job tree and the completed builds before starting.",
+)
 @click.version_option(__version__)
-def run(config: str | None, debug: bool) -> None:
+def run(config: str | None, debug: bool, no_cache: bool, clear_cache: bool) -> None:
     """The entry point.
 
     Args:
         config (str | None): The config file to use.
         debug (bool): Enable debug mode.
+        no_cache (bool): Disable the job tree snapshot and saving completed builds.
+        clear_cache (bool): Remove the job tree snapshot and the saved builds before starting.
     """
 
     # set up di
@@ -155,6 +238,15 @@ def run(config: str | None, debug: bool) -> None:
     conf = get_config(config=config)
     container = Container()
     container.config.from_dict(dict(conf))
+
+    if no_cache:
+        container.config.snapshot.from_value(False)
+        container.config.build_cache_persist.from_value(False)
+
+    if clear_cache:
+        container.snapshot().clear()
+        container.build_cache().clear()
+
     container.init_resources()
     container.wire(modules=[sys.modules[__name__], widgets, views, tree])
 
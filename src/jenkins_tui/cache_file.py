@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any
+
+from .executor import BackgroundExecutor, Superseded
+
+
+class CacheFile:
+    """A json file in the cache directory that is kept per Jenkins server and user, and is read and written away from the event loop."""
+
+    def __init__(
+        self,
+        url: str,
+        version: int,
+        username: str | None = None,
+        kind: str | None = None,
+        directory: str | None = None,
+        executor: BackgroundExecutor | None = None,
+    ) -> None:
+        """A json file in the cache directory that is kept per Jenkins server and user, and is read and written away from the event loop.
+
+        The file is kept under $XDG_CACHE_HOME/jenkins-tui, or ~/.cache/jenkins-tui when it isn't set. It is ignored when it was written for another version or server url.
+        Reading and writing is only an optimisation for the classes that use the file, so a missing or unusable file reads as None and failed writes are ignored.
+
+        Args:
+            url (str): The url of the Jenkins server.
+            version (int): The version of the format of the file.
+            username (str | None): The user that the contents were requested by. Defaults to None.
+            kind (str | None): Tells the files of the same server apart, such as builds. Defaults to None.
+            directory (str | None): Overrides the directory that the file is kept in. Defaults to None.
+            executor (BackgroundExecutor | None): Reads and writes the file away from the event loop. Defaults to None, which uses the default executor of the event loop.
+        """
+
+        self.url = url
+        self.version = version
+        self.executor = executor
+
+        if directory is None:
+            cache_home = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+            directory = os.path.join(cache_home, "jenkins-tui")
+
+        key = hashlib.sha1(f"{username or ''}@{url}".encode()).hexdigest()
+        self.directory = directory
+        self.path = os.path.join(
+            directory, f"{key}.{kind}.json" if kind else f"{key}.json"
+        )
+
+    def read(self) -> dict[str, Any] | None:
+        """Read the file.
+
+        Returns:
+            dict[str, Any] | None: The values that were written, or None when there isn't a usable file.
+        """
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if saved.get("version") != self.version or saved.get("url") != self.url:
+            return None
+
+        return saved
+
+    def write(self, values: dict[str, Any]) -> None:
+        """Write the file. Each write goes to its own temporary file that then replaces the file atomically, so that a partial file is never read and concurrent writes don't interfere.
+
+        Args:
+            values (dict[str, Any]): The values to write, along with the version and url.
+        """
+
+        saved = {
+            "version": self.version,
+            "url": self.url,
+            "saved": time.time(),
+            **values,
+        }
+
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.directory,
+            prefix=f"{os.path.basename(self.path)}.",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            temp_path = f.name
+            try:
+                json.dump(saved, f, separators=(",", ":"))
+            except BaseException:
+                f.close()
+                os.remove(temp_path)
+                raise
+
+        try:
+            os.replace(temp_path, self.path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+
+    async def load(self) -> dict[str, Any] | None:
+        """Read the file without blocking the event loop.
+
+        Returns:
+            dict[str, Any] | None: The values that were written, or None when there isn't a usable file.
+        """
+
+        if self.executor is not None:
+            return await self.executor.run(self.read)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.read)
+
+    async def save(self, values: dict[str, Any]) -> None:
+        """Write the file without blocking the event loop. Errors are ignored.
+
+        Args:
+            values (dict[str, Any]): The values to write.
+        """
+
+        loop = asyncio.get_running_loop()
+        try:
+            if self.executor is not None:
+                # A newer save supersedes one that hasn't started yet
+                await self.executor.run(self.write, values, key=self.path)
+            else:
+                await loop.run_in_executor(None, self.write, values)
+        except (OSError, Superseded):
+            pass
+
+    def clear(self) -> None:
+        """Remove the file if it exists."""
+
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -1,6 +1,10 @@
 from dependency_injector import containers, providers
 
-from .jenkins import Jenkins
+from .executor import BackgroundExecutor
+from .jenkins import BuildCache, Jenkins, ResponseCache
+from .scheduler import Scheduler
+from .search import FullTextIndex, SearchIndex
+from .snapshot import Snapshot
 
 
 class Container(containers.DeclarativeContainer):
@@ -8,6 +12,62 @@ class Container(containers.DeclarativeContainer):
 
     config = providers.Configuration()
 
-    client = providers.Factory(
-        Jenkins, url=config.url, username=config.username, password=config.password
+    executor = providers.Singleton(
+        BackgroundExecutor,
+        max_workers=config.executor_workers,
+        process_workers=config.executor_processes,
+        process_threshold=config.executor_process_threshold,
+    )
+
+    response_cache = providers.Singleton(
+        ResponseCache,
+        max_bytes=config.response_cache_size,
+        ttls=config.response_cache_ttls,
+        enabled=config.response_cache,
+    )
+
+    build_cache = providers.Singleton(
+        BuildCache,
+        url=config.url,
+        username=config.username,
+        enabled=config.build_cache,
+        persist=config.build_cache_persist,
+        max_jobs=config.build_cache_jobs,
+        executor=executor,
+    )
+
+    client = providers.Singleton(
+        Jenkins,
+        url=config.url,
+        username=config.username,
+        password=config.password,
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+        http2=config.http2,
+        executor=executor,
+        cache=response_cache,
+        builds=build_cache,
+    )
+
+    scheduler = providers.Singleton(
+        Scheduler,
+        budget=config.poll_budget,
+        jitter=config.poll_jitter,
+    )
+
+    search_index = providers.Singleton(SearchIndex)
+
+    full_text_index = providers.Singleton(
+        FullTextIndex,
+        enabled=config.full_text_search,
+        max_jobs=config.full_text_jobs,
+    )
+
+    snapshot = providers.Singleton(
+        Snapshot,
+        url=config.url,
+        username=config.username,
+        enabled=config.snapshot,
+        executor=executor,
     )
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+ResultType = TypeVar("ResultType")
+
+
+class Superseded(Exception):
+    """Raised when background work is replaced by newer work with the same key before it finishes."""
+
+
+class BackgroundExecutor:
+    """Runs CPU heavy work on a shared pool of threads, or processes, so that the event loop stays responsive."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        process_workers: int | None = None,
+        process_threshold: int | None = None,
+    ) -> None:
+        """Runs CPU heavy work on a shared pool of threads, or processes, so that the event loop stays responsive.
+
+        Args:
+            max_workers (int | None): The number of threads in the pool. Defaults to the number of cpus, up to 4.
+            process_workers (int | None): The number of processes in the process pool. The process pool is disabled when this is 0. Defaults to 0.
+            process_threshold (int | None): The size in bytes above which a response is decoded in the process pool. Defaults to 4 MiB.
+        """
+
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.process_workers = process_workers or 0
+        self.process_threshold = process_threshold or 4 * 1024 * 1024
+
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+
+        self.submitted = 0
+        self.superseded = 0
+        self.lag: deque[float] = deque(maxlen=600)
+
+    @property
+    def threads(self) -> ThreadPoolExecutor:
+        """The thread pool. It is created when it is first used.
+
+        Returns:
+            ThreadPoolExecutor: The thread pool.
+        """
+
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="jenkins-tui"
+            )
+
+        return self._threads
+
+    @property
+    def processes(self) -> ProcessPoolExecutor | None:
+        """The process pool. It is created when it is first used.
+
+        Returns:
+            ProcessPoolExecutor | None: The process pool, or None when it is disabled.
+        """
+
+        if self.process_workers <= 0:
+            return None
+
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.process_workers)
+
+        return self._processes
+
+    def use_process(self, size: int) -> bool:
+        """Check whether work on a payload should be sent to the process pool.
+
+        Args:
+            size (int): The size of the payload in bytes.
+
+        Returns:
+            bool: True if the process pool is enabled and the payload is above the process threshold.
+        """
+
+        return self.process_workers > 0 and size >= self.process_threshold
+
+    async def run(
+        self,
+        fn: Callable[..., ResultType],
+        *args: Any,
+        key: str | None = None,
+        process: bool = False,
+    ) -> ResultType:
+        """Run a function in the background and wait for the result.
+
+        When a key is given, any work with the same key that hasn't finished yet is superseded: it is cancelled if it hasn't started and its caller gets a Superseded exception instead of the stale result.
+
+        Args:
+            fn (Callable[..., ResultType]): The function to run.
+            *args (Any): Positional arguments that are passed to the function.
+            key (str | None): Identifies work that supersedes earlier work with the same key. Defaults to None.
+            process (bool): Run the function in the process pool when it is enabled. The function and its arguments must be picklable. Defaults to False.
+
+        Returns:
+            ResultType: The result of the function.
+
+        Raises:
+            Superseded: When newer work with the same key was started before this work finished.
+        """
+
+        pool: Executor = self.threads
+        if process and self.processes is not None:
+            pool = self.processes
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(pool, partial(fn, *args))
+        self.submitted += 1
+
+        if key is not None:
+            previous = self._pending.get(key)
+            if previous is not None and not previous.done():
+                previous.cancel()
+                self.superseded += 1
+            self._pending[key] = future
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # A cancelled caller is told apart from superseded work so that only stale results are dropped
+            if key is not None and self._pending.get(key) is not future:
+                raise Superseded(key) from None
+            raise
+        finally:
+            if key is not None and self._pending.get(key) is future:
+                del self._pending[key]
+
+    async def monitor_lag(self, interval: float = 0.1) -> None:
+        """Measure how late the event loop wakes up from a sleep. The samples are kept in self.lag.
+
+        Args:
+            interval (float): Seconds between samples. Defaults to 0.1.
+        """
+
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval)
+            self.lag.append(max(0.0, loop.time() - start - interval))
+
+    @property
+    def lag_info(self) -> str:
+        """A summary of the event loop lag and background work that is written to the debug log.
+
+        Returns:
+            str: The median, 99th percentile and maximum lag of the recent samples.
+        """
+
+        samples = sorted(self.lag)
+        if samples:
+            p50 = samples[len(samples) // 2]
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+            lag = f"p50={p50 * 1000:.1f}ms p99={p99 * 1000:.1f}ms max={samples[-1] * 1000:.1f}ms"
+        else:
+            lag = "no samples"
+
+        return f"{lag} submitted={self.submitted} superseded={self.superseded}"
+
+    def shutdown(self) -> None:
+        """Stop the pools without waiting for running work to finish."""
+
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        self._threads = None
+        self._processes = None
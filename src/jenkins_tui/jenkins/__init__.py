@@ -1,3 +1,5 @@
 from .api import Jenkins
+from .builds import BuildCache
+from .cache import ResponseCache
 
-__all__ = "Jenkins"
+__all__ = ("BuildCache", "Jenkins", "ResponseCache")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import socket
 from typing import Any
 from urllib.parse import urlencode
@@ -7,16 +9,50 @@ from urllib.parse import urlencode
 import httpx
 from httpx._auth import BasicAuth
 
+from ..executor import BackgroundExecutor
+from .builds import BuildCache
+from .cache import ResponseCache
+from .query import (
+    ALL_BUILD_DETAILS,
+    ALL_BUILD_SUMMARY,
+    BUILD_CHANGES,
+    BUILD_DETAILS,
+    BUILD_SUMMARY,
+    JOB_DETAILS,
+    JOB_STATUS,
+    NODE_EXECUTORS,
+    QUEUE_ITEMS,
+    Field,
+    job_tree,
+    tree,
+)
+
+# The fields of a job that change when a build starts or finishes
+JOB_STATUS_FIELDS = ("nextBuildNumber", "color", "lastBuild")
+
+# The statuses of a pipeline run or stage that can still change, see the pipeline stage api
+PIPELINE_RUNNING = ("IN_PROGRESS", "PAUSED_PENDING_INPUT", "QUEUED", "NOT_EXECUTED")
+
 
 class Jenkins:
     "A basic Jenkins HTTP client with async support"
 
+    # Responses larger than this are decoded by the background executor
+    decode_threshold = 256 * 1024
+
     def __init__(
         self,
         url: str,
         username: str,
         password: str,
         timeout: float | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+        executor: BackgroundExecutor | None = None,
+        cache: ResponseCache | None = None,
+        builds: BuildCache | None = None,
     ) -> None:
         """Create a Jenkins instance.
 
@@ -25,26 +61,114 @@ class Jenkins:
             username (str): [description]. The username of the user permitted to access the Jenkins server.
             password (str): [description]. The password of the user permitted to access the Jenkins server.
             timeout (float | None): The request timeout. Defaults to socket._GLOBAL_DEFAULT_TIMEOUT.
+            max_connections (int | None): The maximum number of connections in the pool. Defaults to 10.
+            max_keepalive_connections (int | None): The maximum number of idle connections kept alive in the pool. Defaults to 5.
+            keepalive_expiry (float | None): Time in seconds an idle connection is kept alive for. Defaults to 30.
+            http2 (bool | None): Enable HTTP/2 multiplexing. Requires the h2 package. Defaults to False.
+            executor (BackgroundExecutor | None): Decodes large responses away from the event loop. Defaults to None, which decodes every response in place.
+            cache (ResponseCache | None): Caches decoded GET responses. Defaults to None, which disables caching.
+            builds (BuildCache | None): Keeps completed builds so that only new and running builds are fetched. Defaults to None, which fetches every build on every call.
         """
         self.url = url.strip("/") if url.endswith("/") else url
         self.timeout = timeout if timeout else socket.getdefaulttimeout()
         self.auth = BasicAuth(username.encode("utf-8"), password.encode("utf-8"))
+        self.limits = httpx.Limits(
+            max_connections=max_connections or 10,
+            max_keepalive_connections=max_keepalive_connections or 5,
+            keepalive_expiry=keepalive_expiry or 30.0,
+        )
+        self.http2 = bool(http2)
+        self.executor = executor
+        self.cache = cache
+        self.builds = builds
         self.version = ""
         self.description = ""
+        self._client: httpx.AsyncClient | None = None
+        self._crumb: dict[str, str] | None = None
+        self._connection: asyncio.Future[None] | None = None
+
+        # Identical GET requests that are made while one is in flight share its result
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self.requests = 0
+        self.coalesced = 0
+        self.probes = 0
+        self.unchanged_probes = 0
+
+    async def test_connection(self) -> None:
+        """Test the connection to the Jenkins server. The test only runs once and the server version and description are cached on the instance."""
+
+        if self._connection is None:
+            self._connection = asyncio.ensure_future(self._test_connection())
+
+        # Shielded so that a cancelled caller doesn't cancel the check for everyone else
+        await asyncio.shield(self._connection)
+
+    async def _test_connection(self) -> None:
+        """Make the request that tests the connection to the Jenkins server."""
+
+        response = await self.client.request(
+            method="GET", url="/api/json?tree=description"
+        )
+        response.raise_for_status()
+
+        self.version = response.headers["X-Jenkins"]
+        self.description = response.json().get("description") or ""
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled http client that is shared by all requests made by this instance.
 
-        self.test_connection()
+        Returns:
+            httpx.AsyncClient: A long lived httpx.AsyncClient instance.
+        """
+
+        if self._client is None or self._client.is_closed:
+            # Crumbs are bound to the session cookie so a new client needs a new crumb
+            self._crumb = None
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                auth=self.auth,
+                base_url=self.url,
+                limits=self.limits,
+                http2=self.http2,
+            )
+
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled http client and release all open connections."""
 
-    def test_connection(self) -> None:
-        """Test the connection to the Jenkins server."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._crumb = None
 
-        with httpx.Client(
-            timeout=self.timeout, auth=self.auth, base_url=self.url
-        ) as client:
-            response = client.request(method="GET", url="/api/json")
-            response.raise_for_status()
+    async def _get_crumb(self, refresh: bool = False) -> dict[str, str]:
+        """Get the CSRF crumb header for the current session. The crumb is cached until it is rejected by the server.
 
-            self.version = response.headers["X-Jenkins"]
-            self.description = response.json().get("description", "")
+        Args:
+            refresh (bool): Ignore the cached crumb and request a new one. Defaults to False.
+
+        Returns:
+            dict[str, str]: A header containing the crumb or an empty dict if the server doesn't issue crumbs.
+        """
+
+        if self._crumb is None or refresh:
+            crumb_issuer_enderpoint = "crumbIssuer/api/json"
+            response = await self.client.request(
+                method="GET", url=crumb_issuer_enderpoint
+            )
+
+            # CSRF protection is disabled on the server
+            if response.status_code == 404:
+                self._crumb = {}
+            else:
+                response.raise_for_status()
+                crumb = response.json()
+                field = crumb.get("crumbRequestField", "Jenkins-Crumb")
+                self._crumb = {field: crumb["crumb"]}
+
+        return self._crumb
 
     async def _request_async(
         self, endpoint: str, method: str = "GET"
@@ -58,80 +182,466 @@ class Jenkins:
         Returns:
             requests.Response: A requests.Response instance.
         """
-        async with httpx.AsyncClient(
-            timeout=self.timeout, auth=self.auth, base_url=self.url
-        ) as client:
+        client = self.client
+        headers = {}
 
-            headers = {}
+        if method != "GET":
+            headers.update(await self._get_crumb())
 
-            if method != "GET":
-                crumb_issuer_enderpoint = "crumbIssuer/api/json"
-                crumb_response = await client.request(
-                    method="GET", url=crumb_issuer_enderpoint
-                )
-                headers["Jenkins-Crumb"] = crumb_response.json()["crumb"]
+        response = await client.request(method=method, url=endpoint, headers=headers)
 
+        # The cached crumb has expired with the session so get a new one and try once more
+        if (
+            method != "GET"
+            and response.status_code == 403
+            and "No valid crumb" in response.text
+        ):
+            headers.update(await self._get_crumb(refresh=True))
             response = await client.request(
                 method=method, url=endpoint, headers=headers
             )
 
-            response.raise_for_status()
-            return response
+        response.raise_for_status()
+        return response
 
-    async def get_nodes(self) -> list[dict[Any, Any]]:
-        """Get a list of nodes from the server
+    async def _decode(self, response: httpx.Response) -> Any:
+        """Decode the json body of a response. Large bodies are decoded by the background executor so that the event loop isn't blocked, and very large bodies use its process pool when it is enabled.
+
+        Args:
+            response (httpx.Response): A response with a json body.
 
         Returns:
-            list[dict[Any, Any]]: A list of node dicts.
+            Any: The decoded body.
         """
-        endpoint = (
-            "computer/api/json?tree=*,computer[*,executors[*,currentExecutable[*]]]"
+
+        content = response.content
+        if self.executor is None or len(content) < self.decode_threshold:
+            return response.json()
+
+        return await self.executor.run(
+            json.loads, content, process=self.executor.use_process(len(content))
         )
+
+    async def _get(self, endpoint: str, allow_stale: bool = False) -> Any:
+        """Send a GET request and decode the json response. Concurrent calls for the same endpoint share one request and its result, which must not be modified.
+        A fresh response from the cache is returned without a request.
+
+        Args:
+            endpoint (str): The api endpoint.
+            allow_stale (bool): Return an expired response from the cache straight away and refresh it in the background. Defaults to False.
+
+        Returns:
+            Any: The decoded response.
+        """
+
+        if self.cache is not None:
+            entry = self.cache.get(endpoint, allow_stale=allow_stale)
+            if entry is not None:
+                if not entry.fresh:
+                    self._fetch(endpoint)
+                return entry.value
+
+        # Shielded so that a cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(self._fetch(endpoint))
+
+    def _fetch(self, endpoint: str) -> asyncio.Future[Any]:
+        """Start a GET request, or join the request for the same endpoint that is already in flight.
+
+        Args:
+            endpoint (str): The api endpoint.
+
+        Returns:
+            asyncio.Future[Any]: The request, which resolves to the decoded response.
+        """
+
+        future = self._in_flight.get(endpoint)
+        if future is None:
+            future = asyncio.ensure_future(self._get_uncoalesced(endpoint))
+            future.add_done_callback(lambda done: self._forget(endpoint, done))
+            self._in_flight[endpoint] = future
+            self.requests += 1
+        else:
+            self.coalesced += 1
+
+        return future
+
+    async def _get_uncoalesced(self, endpoint: str) -> Any:
+        """Send a GET request and decode the json response.
+
+        Args:
+            endpoint (str): The api endpoint.
+
+        Returns:
+            Any: The decoded response.
+        """
+
         response = await self._request_async(endpoint=endpoint)
-        return response.json()["computer"]
+        value = await self._decode(response)
 
-    async def get_job(self, path: str | None = None, limit: int = 20) -> dict[Any, Any]:
+        if self.cache is not None:
+            self.cache.put(endpoint, value, len(response.content))
+
+        return value
+
+    def _forget(self, endpoint: str, future: asyncio.Future[Any]) -> None:
+        """Stop sharing a request once it has finished.
+
+        Args:
+            endpoint (str): The api endpoint.
+            future (asyncio.Future[Any]): The finished request.
+        """
+
+        if self._in_flight.get(endpoint) is future:
+            del self._in_flight[endpoint]
+
+        # The error has been passed to every caller, retrieving it stops asyncio warning when they were all cancelled
+        if not future.cancelled():
+            future.exception()
+
+    @property
+    def coalesce_info(self) -> str:
+        """A summary of coalesced requests that is written to the debug log.
+
+        Returns:
+            str: The number of GET requests sent and the number of calls that shared one.
+        """
+
+        return f"requests={self.requests} coalesced={self.coalesced} in_flight={len(self._in_flight)}"
+
+    @property
+    def probe_info(self) -> str:
+        """A summary of job status probes that is written to the debug log.
+
+        Returns:
+            str: The number of probes and the number of full job fetches they avoided.
+        """
+
+        return f"probes={self.probes} avoided={self.unchanged_probes}"
+
+    async def get_nodes(self, fields: Field = NODE_EXECUTORS) -> list[dict[Any, Any]]:
+        """Get a list of nodes from the server
+
+        Args:
+            fields (Field): The computer field with the fields to request from each node. Defaults to the fields that get_running_builds reads.
+
+        Returns:
+            list[dict[Any, Any]]: A list of node dicts.
+        """
+        endpoint = f"computer/api/json?tree={tree(fields)}"
+        return (await self._get(endpoint))["computer"]
+
+    async def get_job(
+        self, path: str | None = None, limit: int = 20, allow_stale: bool = False
+    ) -> dict[Any, Any]:
         """Get a job and it's details.
 
         Args:
             path (str | None): The path to the job.
             limit (int): The maximum number of builds that will be returned with the job. Defaults to 20.
+            allow_stale (bool): Return an expired response from the cache straight away and refresh it in the background. Defaults to False.
 
         Returns:
             list[dict[Any, Any]]: [description]
         """
-        _limit = f"{{0,{limit}}}"
-        endpoint = f"{path}api/json?tree=name,displayName,description,actions[parameterDefinitions[*]],property[parameterDefinitions[*,defaultParameterValue[*]]],healthReport[description],builds[number,status,description,timestamp,id,result,duration,changeSets[*[*]]{_limit}]"
-        response = await self._request_async(endpoint=endpoint)
-        return response.json()
+        job_fields = tree(*JOB_DETAILS, *JOB_STATUS)
+
+        if self.builds is None or not self.builds.enabled:
+            endpoint = f"{path}api/json?tree={job_fields},{BUILD_DETAILS[0:limit]}"
+            return await self._get(endpoint, allow_stale=allow_stale)
+
+        # Only the number and result of each build is requested with the job. The details of a build are fetched while it is running or missing from the build cache, and never again once it has completed
+        await self.builds.load()
+        endpoint = f"{path}api/json?tree={job_fields},{BUILD_SUMMARY[0:limit]}"
+        job = await self._get(endpoint, allow_stale=allow_stale)
+
+        builds = await self._complete_builds(
+            path, job.get("builds") or [], BUILD_DETAILS, allow_stale=allow_stale
+        )
+        return {**job, "builds": builds}
+
+    async def get_builds(
+        self, path: str | None = None, start: int = 0, end: int = 20
+    ) -> list[dict[Any, Any]]:
+        """Get a page of the build history of a job. Unlike get_job this can go past the 100 most recent builds.
+
+        Args:
+            path (str | None): The path to the job.
+            start (int): The index of the first build, where 0 is the most recent build. Defaults to 0.
+            end (int): The index after the last build. Defaults to 20.
+
+        Returns:
+            list[dict[Any, Any]]: A list of build dicts, newest first. It is shorter than the page when the history runs out.
+        """
+
+        if self.builds is None or not self.builds.enabled:
+            endpoint = f"{path}api/json?tree={ALL_BUILD_DETAILS[start:end]}"
+            return (await self._get(endpoint)).get("allBuilds") or []
+
+        await self.builds.load()
+        endpoint = f"{path}api/json?tree={ALL_BUILD_SUMMARY[start:end]}"
+        summaries = (await self._get(endpoint)).get("allBuilds") or []
+        return await self._complete_builds(
+            path, summaries, ALL_BUILD_DETAILS, start=start
+        )
+
+    async def get_build_changes(
+        self, path: str | None = None, number: int = 0
+    ) -> dict[str, Any]:
+        """Get the commits and culprits of a build. They are cached once the build has completed, because they don't change after that.
+
+        Args:
+            path (str | None): The path to the job.
+            number (int): The build number.
+
+        Returns:
+            dict[str, Any]: The change sets of the build in changeSets, each with their commits in items, and the users whose commits are in the build in culprits.
+        """
+
+        if self.builds is not None:
+            changes = self.builds.get_detail("changes", path or "", number)
+            if changes is not None:
+                return changes
+
+        endpoint = f"{path}{number}/api/json?tree={tree(*BUILD_CHANGES)}"
+        build = await self._get(endpoint)
+
+        change_sets = build.get("changeSets") or []
+        if build.get("changeSet"):
+            change_sets = [build["changeSet"], *change_sets]
+
+        changes = {"changeSets": change_sets, "culprits": build.get("culprits") or []}
+        if self.builds is not None and build.get("result") is not None:
+            self.builds.add_detail("changes", path or "", number, changes)
+
+        return changes
+
+    @staticmethod
+    def pipeline_running(
+        value: dict[str, Any], run: dict[str, Any] | None = None
+    ) -> bool:
+        """Whether a pipeline run or stage can still change.
+
+        Args:
+            value (dict[str, Any]): A run or stage from the pipeline stage api.
+            run (dict[str, Any] | None): The run that the stage belongs to. Defaults to None, which treats a stage that hasn't been executed as running.
+
+        Returns:
+            bool: True if it hasn't completed.
+        """
+
+        # A stage that hasn't been executed, such as one that was skipped, can only still run while its run hasn't completed
+        if value.get("status") == "NOT_EXECUTED" and run is not None:
+            return Jenkins.pipeline_running(run)
+
+        return value.get("status") in PIPELINE_RUNNING
+
+    async def get_pipeline_run(
+        self, path: str | None = None, number: int = 0
+    ) -> dict[str, Any] | None:
+        """Get the stages of a pipeline build from the pipeline stage api. The run is cached once the build has completed, because it doesn't change after that.
+
+        Args:
+            path (str | None): The path to the job.
+            number (int): The build number.
+
+        Returns:
+            dict[str, Any] | None: The status, start time and duration of the build, with the same for each of its stages in stages. None if the job isn't a pipeline.
+        """
+
+        if self.builds is not None:
+            run = self.builds.get_detail("run", path or "", number)
+            if run is not None:
+                return run
+
+        try:
+            run = await self._get(f"{path}{number}/wfapi/describe")
+        except httpx.HTTPStatusError as e:
+            # Only pipelines have the stage api
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        if self.builds is not None and not self.pipeline_running(run):
+            self.builds.add_detail("run", path or "", number, run)
+
+        return run
+
+    async def get_pipeline_stage(
+        self,
+        path: str | None = None,
+        number: int = 0,
+        stage_id: str = "",
+        run: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Get a stage of a pipeline build with its steps from the pipeline stage api. The stage is cached once it has completed.
+
+        Args:
+            path (str | None): The path to the job.
+            number (int): The build number.
+            stage_id (str): The id of the stage, see Jenkins.get_pipeline_run.
+            run (dict[str, Any] | None): The run that the stage belongs to, so that a stage that wasn't executed is cached once the run has completed. Defaults to None.
+
+        Returns:
+            dict[str, Any]: The status, start time and duration of the stage, with the same for each of its steps in stageFlowNodes.
+        """
+
+        if self.builds is not None:
+            stage = self.builds.get_detail("stage", path or "", number, stage_id)
+            if stage is not None:
+                return stage
+
+        stage = await self._get(
+            f"{path}{number}/execution/node/{stage_id}/wfapi/describe"
+        )
+
+        if self.builds is not None and not self.pipeline_running(stage, run):
+            self.builds.add_detail("stage", path or "", number, stage, key=stage_id)
+
+        return stage
+
+    async def _complete_builds(
+        self,
+        path: str | None,
+        summaries: list[dict[Any, Any]],
+        details: Field,
+        start: int = 0,
+        allow_stale: bool = False,
+    ) -> list[dict[Any, Any]]:
+        """Replace the number and result of each build with its details, from the build cache or from a request for the builds that aren't cached.
+
+        Args:
+            path (str | None): The path to the job.
+            summaries (list[dict[Any, Any]]): The number and result of each build, newest first.
+            details (Field): The builds field that the details are requested with.
+            start (int): The index of the first build. Defaults to 0.
+            allow_stale (bool): Use an expired response from the response cache while it is refreshed. Defaults to False.
+
+        Returns:
+            list[dict[Any, Any]]: The details of each build. Builds whose details couldn't be requested are left out.
+        """
+
+        assert self.builds is not None
+
+        cached = self.builds.get(path or "")
+        missing = [
+            index
+            for index, build in enumerate(summaries)
+            if build["number"] not in cached
+        ]
+
+        fetched: dict[int, dict[Any, Any]] = {}
+        if missing:
+            # Builds are listed newest first, so one range covers every missing build
+            builds_range = details[start + missing[0] : start + missing[-1] + 1]
+            endpoint = f"{path}api/json?tree={builds_range}"
+            response = await self._get(endpoint, allow_stale=allow_stale)
+            fetched = {
+                build["number"]: build for build in response.get(details.name) or []
+            }
+
+            # A build that started between the two requests shifts the range, so the builds that fell out of it are requested by number
+            unmatched = [
+                summaries[index]["number"]
+                for index in missing
+                if summaries[index]["number"] not in fetched
+            ]
+            results = await asyncio.gather(
+                *(
+                    self._get(f"{path}{number}/api/json?tree={tree(*details.fields)}")
+                    for number in unmatched
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    continue
+                fetched[result["number"]] = result
+
+            if self.builds.add(path or "", list(fetched.values())):
+                asyncio.ensure_future(self.builds.save())
+
+        self.builds.hits += len(summaries) - len(missing)
+        self.builds.fetched += len(missing)
+
+        # A build whose details couldn't be requested, such as one that was deleted in the meantime, is left out until the next call
+        completed = (
+            fetched.get(build["number"]) or cached.get(build["number"])
+            for build in summaries
+        )
+        return [build for build in completed if build is not None]
+
+    @staticmethod
+    def job_status(job: dict[Any, Any]) -> dict[Any, Any]:
+        """Get the status of a job from a job response, see get_job_status.
+
+        Args:
+            job (dict[Any, Any]): A job dict, see get_job.
+
+        Returns:
+            dict[Any, Any]: The status of the job.
+        """
+
+        return {key: job.get(key) for key in JOB_STATUS_FIELDS}
+
+    async def get_job_status(self, path: str | None = None) -> dict[Any, Any]:
+        """Get the fields of a job that change when a build starts or finishes. This is a fraction of the size of get_job.
+
+        Args:
+            path (str | None): The path to the job.
+
+        Returns:
+            dict[Any, Any]: The next build number, the color and the number and result of the last build.
+        """
+
+        endpoint = f"{path}api/json?tree={tree(*JOB_STATUS)}"
+        return self.job_status(await self._get(endpoint))
+
+    async def job_changed(
+        self, path: str | None = None, status: dict[Any, Any] | None = None
+    ) -> bool:
+        """Probe whether a job may have changed since its status was taken, so that an unchanged job isn't fetched again.
+
+        Args:
+            path (str | None): The path to the job.
+            status (dict[Any, Any] | None): The status of the job when it was last fetched, see job_status. Defaults to None, which always counts as changed.
+
+        Returns:
+            bool: True if the job should be fetched again.
+        """
+
+        if status is None:
+            return True
+
+        self.probes += 1
+        if await self.get_job_status(path=path) != status:
+            return True
+
+        self.unchanged_probes += 1
+        return False
 
     async def get_jobs(
         self,
-        path: str = None,
+        path: str | None = None,
         recursive: bool = False,
         folder_depth: int = 10,
     ) -> list[dict[Any, Any]]:
         """Return a list of jobs starting from the root of the server.
 
         Args:
-            path (str): The path to node that has nested jobs. Defaults to None.
+            path (str | None): The path to node that has nested jobs. Defaults to None.
             recursive (bool): If true the method will recursively build the query up to folder_depth. Defaults to False.
             folder_depth (int): The maximum level of recursion while gathering nested jobs. Has no impact if recursive is False. Defaults to 10.
 
         Returns:
             list[dict[Any, Any]]: [description]
         """
-        if recursive:
-            jobs_query = "jobs"
-            for _ in range(folder_depth):
-                jobs_query = f"jobs[url,color,name,{jobs_query}]"
-            base = f"api/json?tree={jobs_query}"
-        else:
-            base = "api/json?tree=jobs[url,color,name]"
-        endpoint = f"{path}/{base}" if path else f"/{base}"
+        jobs = job_tree(folder_depth if recursive else 0)
+        base = f"api/json?tree={tree(jobs)}"
+        endpoint = f"{path.rstrip('/')}/{base}" if path else f"/{base}"
 
-        response = await self._request_async(endpoint=endpoint)
-        return response.json()["jobs"]
+        return (await self._get(endpoint))["jobs"]
 
     async def get_running_builds(self) -> list[dict[Any, Any]]:
         """Get a list of running builds on the server.
@@ -166,9 +676,8 @@ class Jenkins:
             list[dict[Any, Any]]: A list of jobs that are currently queued.
         """
 
-        endpoint = "/queue/api/json?tree=items[*,task[*]]"
-        response = await self._request_async(endpoint=endpoint)
-        return response.json()["items"]
+        endpoint = f"/queue/api/json?tree={tree(QUEUE_ITEMS)}"
+        return (await self._get(endpoint))["items"]
 
     async def build(self, path: str, parameters: dict[str, str] | None = None) -> int:
         """Build a job.
@@ -188,6 +697,10 @@ class Jenkins:
 
         response = await self._request_async(endpoint=endpoint, method="POST")
 
+        # The job, the queue and the executors are about to change
+        if self.cache is not None:
+            self.cache.invalidate(path, "queue/", "computer/")
+
         location = response.headers["Location"]
         if location.endswith("/"):
             location = location[:-1]
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+from ..cache_file import CacheFile
+from ..executor import BackgroundExecutor
+
+
+class BuildCache:
+    """Keeps the details of completed builds, which don't change, so that each build is only fetched once."""
+
+    version = 2
+
+    # The maximum number of changes, pipeline runs and pipeline stages that are kept in memory
+    max_details = 5000
+
+    def __init__(
+        self,
+        url: str,
+        username: str | None = None,
+        enabled: bool | None = None,
+        persist: bool | None = None,
+        max_jobs: int | None = None,
+        max_builds: int | None = None,
+        directory: str | None = None,
+        executor: BackgroundExecutor | None = None,
+    ) -> None:
+        """Keeps the details of completed builds, which don't change, so that each build is only fetched once.
+
+        A build is cached once it has a result. Builds that are still running are never cached. When persist is enabled the cache is kept per server url and username so that it survives restarts, see CacheFile.
+        The changes and pipeline stages of completed builds are cached too, but only in memory because they are only loaded for the builds that are looked at.
+
+        Args:
+            url (str): The url of the Jenkins server.
+            username (str | None): The user that the builds were requested by. Defaults to None.
+            enabled (bool | None): Nothing is cached when False. Defaults to None, which enables the cache.
+            persist (bool | None): Load and save the cache to disk. Defaults to None, which persists the cache.
+            max_jobs (int | None): The maximum number of jobs whose builds are kept. The least recently used jobs are dropped first. Defaults to 200.
+            max_builds (int | None): The maximum number of builds that are kept per job. The oldest builds are dropped first. Defaults to 500.
+            directory (str | None): Overrides the directory that the cache is kept in. Defaults to None.
+            executor (BackgroundExecutor | None): Reads and writes the cache away from the event loop. Defaults to None, which uses the default executor of the event loop.
+        """
+
+        self.url = url
+        self.enabled = enabled is None or bool(enabled)
+        self.persist = self.enabled and (persist is None or bool(persist))
+        self.max_jobs = max_jobs or 200
+        self.max_builds = max_builds or 500
+        self.jobs: OrderedDict[str, dict[int, dict[str, Any]]] = OrderedDict()
+        self.details: OrderedDict[tuple[str, str, int, str], dict[str, Any]] = (
+            OrderedDict()
+        )
+        self.loaded = False
+        self.dirty = False
+
+        self.hits = 0
+        self.fetched = 0
+
+        self.file = CacheFile(
+            url=url,
+            version=self.version,
+            username=username,
+            kind="builds",
+            directory=directory,
+            executor=executor,
+        )
+        self.path = self.file.path
+
+    def __len__(self) -> int:
+        return sum(len(builds) for builds in self.jobs.values())
+
+    def get(self, path: str) -> dict[int, dict[str, Any]]:
+        """Get the cached builds of a job.
+
+        Args:
+            path (str): The path to the job.
+
+        Returns:
+            dict[int, dict[str, Any]]: The completed builds of the job by number. It must not be modified.
+        """
+
+        builds = self.jobs.get(path)
+        if builds is None:
+            return {}
+
+        self.jobs.move_to_end(path)
+        return builds
+
+    def add(self, path: str, builds: list[dict[str, Any]]) -> int:
+        """Cache the completed builds of a job.
+
+        Args:
+            path (str): The path to the job.
+            builds (list[dict[str, Any]]): A list of build dicts. Builds without a result are ignored.
+
+        Returns:
+            int: The number of builds that were added.
+        """
+
+        if not self.enabled:
+            return 0
+
+        cached = self.jobs.setdefault(path, {})
+        self.jobs.move_to_end(path)
+
+        added = 0
+        for build in builds:
+            number = build.get("number")
+            if number is None or build.get("result") is None or number in cached:
+                continue
+            cached[number] = build
+            added += 1
+
+        if not added:
+            return 0
+
+        for number in sorted(cached)[: -self.max_builds]:
+            del cached[number]
+
+        while len(self.jobs) > self.max_jobs:
+            self.jobs.popitem(last=False)
+
+        self.dirty = True
+        return added
+
+    def get_detail(
+        self, kind: str, path: str, number: int, key: str = ""
+    ) -> dict[str, Any] | None:
+        """Get a cached detail of a build, such as its changes or its pipeline stages.
+
+        Args:
+            kind (str): The kind of detail, such as changes, run or stage.
+            path (str): The path to the job.
+            number (int): The build number.
+            key (str): Tells details of the same kind apart, such as the id of a stage. Defaults to "".
+
+        Returns:
+            dict[str, Any] | None: The detail, or None if it isn't cached.
+        """
+
+        detail = self.details.get((kind, path, number, key))
+        if detail is not None:
+            self.details.move_to_end((kind, path, number, key))
+
+        return detail
+
+    def add_detail(
+        self,
+        kind: str,
+        path: str,
+        number: int,
+        detail: dict[str, Any],
+        key: str = "",
+    ) -> None:
+        """Cache a detail of a build that won't change again, because the build or the part of it that the detail describes has completed.
+
+        Args:
+            kind (str): The kind of detail, such as changes, run or stage.
+            path (str): The path to the job.
+            number (int): The build number.
+            detail (dict[str, Any]): The detail.
+            key (str): Tells details of the same kind apart, such as the id of a stage. Defaults to "".
+        """
+
+        if not self.enabled:
+            return
+
+        self.details[(kind, path, number, key)] = detail
+        while len(self.details) > self.max_details:
+            self.details.popitem(last=False)
+
+    async def load(self) -> None:
+        """Load the builds that were saved to disk without blocking the event loop. The cache is only loaded once, and builds that have been cached since are kept."""
+
+        if not self.persist or self.loaded:
+            return
+
+        self.loaded = True
+        saved = await self.file.load()
+        jobs = saved.get("jobs") if saved is not None else None
+
+        for path, builds in reversed(list((jobs or {}).items())):
+            cached = self.jobs.setdefault(path, {})
+            for build in builds:
+                cached.setdefault(build["number"], build)
+            self.jobs.move_to_end(path, last=False)
+
+        while len(self.jobs) > self.max_jobs:
+            self.jobs.popitem(last=False)
+
+    async def save(self) -> None:
+        """Save the builds to disk without blocking the event loop if any were added since the last save."""
+
+        if not self.persist or not self.dirty:
+            return
+
+        self.dirty = False
+        jobs = {path: list(builds.values()) for path, builds in self.jobs.items()}
+        await self.file.save({"jobs": jobs})
+
+    def clear(self) -> None:
+        """Remove the saved builds if they exist."""
+
+        self.file.clear()
+
+    @property
+    def info(self) -> str:
+        """A summary of the cache that is written to the debug log.
+
+        Returns:
+            str: The number of cached jobs and builds and how many builds were served from the cache.
+        """
+
+        return f"jobs={len(self.jobs)}/{self.max_jobs} builds={len(self)} details={len(self.details)} hits={self.hits} fetched={self.fetched}"
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# Seconds that a response stays fresh, by the first key that is part of the query of its endpoint. The query is used rather than the path so that the name of a job can't change its ttl
+DEFAULT_TTLS = {
+    "computer[": 2.0,
+    "items[": 2.0,
+    "builds[": 5.0,
+    "jobs[": 10.0,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response."""
+
+    value: Any
+    size: int
+    stored: float
+    ttl: float
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry is still within its ttl.
+
+        Returns:
+            bool: True if the entry is fresh.
+        """
+
+        return time.monotonic() - self.stored < self.ttl
+
+
+class ResponseCache:
+    """A cache of decoded api responses that is bounded by the size of the responses."""
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        ttls: dict[str, float] | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        """A cache of decoded api responses that is bounded by the size of the responses.
+
+        Each response has a ttl that depends on its endpoint. Responses are kept after they expire so that they can be shown while they are refreshed, until the least recently used responses are evicted to keep the total size of the responses under max_bytes.
+
+        Args:
+            max_bytes (int | None): The maximum total size in bytes of the cached responses. Defaults to 32 MiB.
+            ttls (dict[str, float] | None): Overrides the ttl in seconds of the endpoints whose query contains each key, see DEFAULT_TTLS. A ttl of 0 disables caching of the endpoint. Defaults to None.
+            enabled (bool | None): Nothing is cached when False. Defaults to None, which enables the cache.
+        """
+
+        self.max_bytes = max_bytes or 32 * 1024 * 1024
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.enabled = enabled is None or bool(enabled)
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.size = 0
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def ttl(self, endpoint: str) -> float:
+        """Get the ttl of an endpoint.
+
+        Args:
+            endpoint (str): The api endpoint.
+
+        Returns:
+            float: The ttl in seconds, 0 when the endpoint isn't cached.
+        """
+
+        query = endpoint.partition("?")[2]
+        for key, ttl in self.ttls.items():
+            if key in query:
+                return ttl
+
+        return 0.0
+
+    def get(self, endpoint: str, allow_stale: bool = False) -> CacheEntry | None:
+        """Get the cached response of an endpoint.
+
+        Args:
+            endpoint (str): The api endpoint.
+            allow_stale (bool): Return the response even if it has expired. Defaults to False.
+
+        Returns:
+            CacheEntry | None: The cached response, or None if there isn't a usable one.
+        """
+
+        entry = self.entries.get(endpoint)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.fresh:
+            self.hits += 1
+        elif allow_stale:
+            self.stale_hits += 1
+        else:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(endpoint)
+        return entry
+
+    def put(self, endpoint: str, value: Any, size: int) -> None:
+        """Cache the response of an endpoint, evicting the least recently used responses if the cache is full.
+
+        Args:
+            endpoint (str): The api endpoint.
+            value (Any): The decoded response.
+            size (int): The size of the response in bytes.
+        """
+
+        ttl = self.ttl(endpoint)
+        if not self.enabled or ttl <= 0 or size > self.max_bytes:
+            return
+
+        self.discard(endpoint)
+        self.entries[endpoint] = CacheEntry(value, size, time.monotonic(), ttl)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= evicted.size
+            self.evictions += 1
+
+    def discard(self, endpoint: str) -> None:
+        """Remove the cached response of an endpoint.
+
+        Args:
+            endpoint (str): The api endpoint.
+        """
+
+        entry = self.entries.pop(endpoint, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def invalidate(self, *prefixes: str) -> int:
+        """Remove the cached responses of every endpoint that starts with one of the prefixes.
+
+        Args:
+            *prefixes (str): Endpoint prefixes, such as the path of a job. Leading slashes are ignored.
+
+        Returns:
+            int: The number of responses that were removed.
+        """
+
+        stripped = tuple(prefix.lstrip("/") for prefix in prefixes)
+        endpoints = [
+            endpoint
+            for endpoint in self.entries
+            if endpoint.lstrip("/").startswith(stripped)
+        ]
+        for endpoint in endpoints:
+            self.discard(endpoint)
+
+        return len(endpoints)
+
+    @property
+    def info(self) -> str:
+        """A summary of the cache that is written to the debug log.
+
+        Returns:
+            str: The hits, misses and size of the cache.
+        """
+
+        return f"hits={self.hits} stale={self.stale_hits} misses={self.misses} evictions={self.evictions} entries={len(self.entries)} size={self.size / 1024:.0f}/{self.max_bytes / 1024:.0f}KiB"
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True)
+class Field:
+    """A field of a Jenkins tree query."""
+
+    name: str
+    fields: tuple[Field, ...] = ()
+    start: int | None = None
+    end: int | None = None
+
+    def __str__(self) -> str:
+        query = self.name
+        if self.fields:
+            query += f"[{','.join(str(field) for field in self.fields)}]"
+        if self.start is not None or self.end is not None:
+            query += f"{{{self.start or 0},{'' if self.end is None else self.end}}}"
+        return query
+
+    def __getitem__(self, items: slice) -> Field:
+        """Request a range of the items of a list field, such as builds[0:20] for the 20 most recent builds.
+
+        Args:
+            items (slice): The range of items. The start is included and the end isn't, like a slice of a list.
+
+        Returns:
+            Field: A copy of the field that requests the range.
+        """
+
+        if not isinstance(items, slice) or items.step is not None:
+            raise TypeError("A field can only be sliced with [start:end]")
+
+        return replace(self, start=items.start, end=items.stop)
+
+    def extend(self, *fields: str | Field) -> Field:
+        """Request more fields from the value of this field.
+
+        Args:
+            *fields (str | Field): The fields to add.
+
+        Returns:
+            Field: A copy of the field with the extra fields.
+        """
+
+        return replace(self, fields=self.fields + _fields(fields))
+
+
+def _fields(fields: tuple[str | Field, ...]) -> tuple[Field, ...]:
+    return tuple(Field(field) if isinstance(field, str) else field for field in fields)
+
+
+def field(name: str, *fields: str | Field) -> Field:
+    """Create a field of a tree query.
+
+    Args:
+        name (str): The name of the field, or * for every field.
+        *fields (str | Field): The fields that are requested from the value of the field.
+
+    Returns:
+        Field: The field.
+    """
+
+    return Field(name, _fields(fields))
+
+
+def tree(*fields: str | Field) -> str:
+    """Build a tree query.
+
+    Args:
+        *fields (str | Field): The top level fields.
+
+    Returns:
+        str: The value of the tree parameter, such as name,builds[number,result]{0,20}.
+    """
+
+    return ",".join(str(field) for field in _fields(fields))
+
+
+# The fields that are requested by each part of the client. A field is only added when something reads it, because every field is sent for every node, queue item and build
+
+# Read by get_running_builds
+NODE_EXECUTORS = field(
+    "computer",
+    "displayName",
+    field(
+        "executors",
+        "idle",
+        "progress",
+        field("currentExecutable", "fullDisplayName", "number", "timestamp"),
+    ),
+)
+
+# Counted and compared by ExecutorStatusWidget
+QUEUE_ITEMS = field("items", "id", "inQueueSince", field("task", "name"))
+
+# Read by JobView, BuildWithParametersView and FullTextIndex
+JOB_DETAILS = (
+    "name",
+    "displayName",
+    "description",
+    field("actions", field("parameterDefinitions", "*")),
+    field(
+        "property",
+        field("parameterDefinitions", "*", field("defaultParameterValue", "*")),
+    ),
+    field("healthReport", "description"),
+)
+
+# Compared by Jenkins.job_changed
+JOB_STATUS = ("nextBuildNumber", "color", field("lastBuild", "number", "result"))
+
+# Read by JobDetailsWidget and FullTextIndex. Changes are left out because they are only shown for the selected build, see BUILD_CHANGES
+BUILD_DETAILS = field(
+    "builds",
+    "number",
+    "status",
+    "description",
+    "timestamp",
+    "id",
+    "result",
+    "duration",
+)
+
+# Read by BuildChangesRenderable. Pipelines list their changes in changeSets and freestyle jobs in changeSet
+CHANGE_ITEMS = field(
+    "items", "commitId", "msg", "timestamp", field("author", "fullName")
+)
+BUILD_CHANGES = (
+    "result",
+    field("changeSets", "kind", CHANGE_ITEMS),
+    field("changeSet", "kind", CHANGE_ITEMS),
+    field("culprits", "fullName"),
+)
+
+# Enough to tell which builds are missing from the build cache
+BUILD_SUMMARY = field("builds", "number", "result")
+
+# builds only lists the 100 most recent builds, older pages of the build history come from allBuilds
+ALL_BUILD_DETAILS = replace(BUILD_DETAILS, name="allBuilds")
+ALL_BUILD_SUMMARY = replace(BUILD_SUMMARY, name="allBuilds")
+
+# Read by the job tree
+JOB_TREE = field("jobs", "url", "color", "name")
+
+
+def job_tree(depth: int = 0) -> Field:
+    """Build the field for a job tree with nested folders.
+
+    Args:
+        depth (int): The number of levels of nested jobs below the first. Defaults to 0.
+
+    Returns:
+        Field: The jobs field.
+    """
+
+    jobs = JOB_TREE
+    for _ in range(depth):
+        jobs = JOB_TREE.extend(jobs)
+
+    return jobs
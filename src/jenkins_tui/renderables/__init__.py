@@ -1,17 +1,23 @@
+from .build_changes import BuildChangesRenderable
 from .build_history_table import BuildHistoryTableRenderable
+from .build_stages import BuildStagesRenderable
 from .button import ButtonRenderable
 from .executor_status_table import ExecutorStatusTableRenderable
 from .figlet_text import FigletTextRenderable
 from .help import HelpRenderable
 from .paginated_table import PaginatedTableRenderable
 from .text import TextRenderable
+from .virtual_tree import VirtualTreeRenderable
 
 __all__ = (
     "PaginatedTableRenderable",
     "BuildHistoryTableRenderable",
+    "BuildChangesRenderable",
+    "BuildStagesRenderable",
     "ButtonRenderable",
     "FigletTextRenderable",
     "ExecutorStatusTableRenderable",
     "TextRenderable",
     "HelpRenderable",
+    "VirtualTreeRenderable",
 )
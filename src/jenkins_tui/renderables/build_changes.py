@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Any
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.text import Text
+
+from .. import styles
+
+
+class BuildChangesRenderable:
+    """A renderable that displays the commits and culprits of a build."""
+
+    def __init__(
+        self,
+        build: dict[str, Any] | None,
+        changes: dict[str, Any] | None,
+        height: int,
+    ) -> None:
+        """A renderable that displays the commits and culprits of a build.
+
+        Args:
+            build (dict[str, Any] | None): The selected build, or None when no build is selected.
+            changes (dict[str, Any] | None): The changes of the build, see Jenkins.get_build_changes. None while they are loading.
+            height (int): The number of lines to fill. Commits that don't fit are counted on the last line.
+        """
+
+        self.build = build
+        self.changes = changes
+        self.height = height
+
+    def lines(self) -> list[Text]:
+        """Build the lines of the renderable.
+
+        Returns:
+            list[Text]: One line per commit, followed by the culprits.
+        """
+
+        if self.build is None:
+            return [Text("select a build to see its changes", style=styles.GREY)]
+
+        header = Text(f"#{self.build['number']} ", style=f"{styles.GREY} bold")
+        if self.changes is None:
+            return [header + Text("loading changes...", style=styles.GREY)]
+
+        commits = [
+            item
+            for change_set in self.changes.get("changeSets", [])
+            for item in (change_set or {}).get("items") or []
+        ]
+        culprits = [
+            culprit.get("fullName", "") for culprit in self.changes.get("culprits", [])
+        ]
+
+        if not commits:
+            return [header + Text("no changes", style=styles.GREY)]
+
+        lines = [header + Text(f"{len(commits)} commits", style=styles.GREY)]
+        if culprits:
+            lines[0].append(f" by {', '.join(culprits)}", style=styles.GREY)
+
+        room = max(self.height - 1, 1)
+        shown = commits if len(commits) <= room else commits[: room - 1]
+        for commit in shown:
+            line = Text(f"{(commit.get('commitId') or '')[:8]} ", style=styles.ORANGE)
+            line.append(f"{(commit.get('author') or {}).get('fullName', '')}: ")
+            line.append(
+                (commit.get("msg") or "").splitlines()[0] if commit.get("msg") else ""
+            )
+            lines.append(line)
+
+        if len(shown) < len(commits):
+            lines.append(
+                Text(f"... {len(commits) - len(shown)} more", style=styles.GREY)
+            )
+
+        return lines
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+
+        for line in self.lines()[: self.height]:
+            line.no_wrap = True
+            line.overflow = "ellipsis"
+            yield line
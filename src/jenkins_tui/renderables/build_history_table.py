@@ -43,7 +43,7 @@ class BuildHistoryTableRenderable(PaginatedTableRenderable):
         """Returns a style for a given result.
 
         Args:
-            result (str): Result of the current build. It can be one of [SUCCESS, FAILURE, ABORTED, IN PROGRESS, NOT BUILT]
+            result (str): Result of the current build. It can be one of [SUCCESS, FAILURE, ABORTED, UNSTABLE, IN PROGRESS, NOT BUILT]
 
         Returns:
             str | Style: A Rich Style object or a string repesenting a color
@@ -54,11 +54,12 @@ class BuildHistoryTableRenderable(PaginatedTableRenderable):
             "SUCCESS": styles.GREEN,
             "FAILURE": styles.RED,
             "ABORTED": styles.ORANGE,
+            "UNSTABLE": styles.ORANGE,
             "IN PROGRESS": styles.ORANGE,
             "NOT BUILT": "",
         }
 
-        return result_style_map[result]
+        return result_style_map.get(result, "")
 
     def renderables(self, start_index: int, end_index: int) -> list[dict[str, Any]]:
         """Generate a list of renderables.
@@ -83,18 +84,24 @@ class BuildHistoryTableRenderable(PaginatedTableRenderable):
 
         for build in renderables:
 
-            timestamp = datetime.fromtimestamp(int(build["timestamp"]) / 1000).strftime(
-                "%Y-%m-%d %H:%M:%S"
+            timestamp = (
+                datetime.fromtimestamp(int(build["timestamp"]) / 1000).strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                )
+                if build.get("timestamp")
+                else ""
             )
 
-            result_text = build["result"] if build["result"] else "IN PROGRESS"
+            result_text = build.get("result") or "IN PROGRESS"
 
             result = Text(
                 text=result_text,
                 style=self._get_style_from_result(result_text),
             )
 
-            table.add_row(f"{build['number']}", build["description"], result, timestamp)
+            table.add_row(
+                f"{build['number']}", build.get("description"), result, timestamp
+            )
 
     def render_columns(self, table: Table) -> None:
         """Renders columns for the table.
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Any
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.table import Table
+from rich.text import Text
+
+from .. import styles
+
+STATUS_STYLES = {
+    "SUCCESS": styles.GREEN,
+    "FAILED": styles.RED,
+    "UNSTABLE": styles.ORANGE,
+    "ABORTED": styles.ORANGE,
+    "IN_PROGRESS": f"{styles.ORANGE} bold",
+    "PAUSED_PENDING_INPUT": f"{styles.ORANGE} bold",
+}
+
+
+def format_duration(millis: int | None) -> str:
+    """Format a duration from the pipeline stage api.
+
+    Args:
+        millis (int | None): The duration in milliseconds.
+
+    Returns:
+        str: The duration, such as 1h 2m, 3m 12s or 12s.
+    """
+
+    seconds = int(millis or 0) // 1000
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+class BuildStagesRenderable:
+    """A renderable that displays the stages of a pipeline build."""
+
+    def __init__(
+        self,
+        run: dict[str, Any] | None,
+        stages: dict[str, dict[str, Any]],
+        height: int,
+        loaded: bool = True,
+    ) -> None:
+        """A renderable that displays the stages of a pipeline build.
+
+        The steps of stages that are running or have failed are listed below them, the other stages only show how many steps they had.
+
+        Args:
+            run (dict[str, Any] | None): The pipeline run, see Jenkins.get_pipeline_run. None if the build isn't a pipeline.
+            stages (dict[str, dict[str, Any]]): The stages that have been loaded with their steps by id, see Jenkins.get_pipeline_stage.
+            height (int): The number of lines to fill. Stages and steps that don't fit are counted on the last line.
+            loaded (bool): False while the run is loading. Defaults to True.
+        """
+
+        self.run = run
+        self.stages = stages
+        self.height = height
+        self.loaded = loaded
+
+    def _status(self, status: str | None) -> Text:
+        status = status or ""
+        return Text(
+            status.lower().replace("_", " "), style=STATUS_STYLES.get(status, "")
+        )
+
+    def rows(self) -> list[tuple[Text, Text, str]]:
+        """Build the rows of the renderable.
+
+        Returns:
+            list[tuple[Text, Text, str]]: The name, status and duration of each stage and of the steps that are shown.
+        """
+
+        rows = []
+        for summary in (self.run or {}).get("stages", []):
+            stage = self.stages.get(summary["id"])
+            steps = (stage or {}).get("stageFlowNodes") or []
+
+            name = Text(summary.get("name", ""), style="bold")
+            if stage is None:
+                name.append(" loading...", style=styles.GREY)
+            elif steps:
+                name.append(f" {len(steps)} steps", style=styles.GREY)
+
+            rows.append(
+                (
+                    name,
+                    self._status(summary.get("status")),
+                    format_duration(summary.get("durationMillis")),
+                )
+            )
+
+            if summary.get("status") not in ("IN_PROGRESS", "FAILED"):
+                continue
+
+            for step in steps:
+                label = step.get("parameterDescription") or ""
+                text = Text(f"  {step.get('name', '')}", style=styles.GREY)
+                if label:
+                    text.append(f": {label.splitlines()[0]}", style=styles.GREY)
+                rows.append(
+                    (
+                        text,
+                        self._status(step.get("status")),
+                        format_duration(step.get("durationMillis")),
+                    )
+                )
+
+        return rows
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+
+        if not self.loaded:
+            yield Text("loading stages...", style=styles.GREY)
+            return
+
+        if self.run is None:
+            yield Text(
+                "this build isn't a pipeline, so it has no stages", style=styles.GREY
+            )
+            return
+
+        rows = self.rows()
+        if not rows:
+            yield Text("no stages", style=styles.GREY)
+            return
+
+        # One line is taken by the header
+        room = max(self.height - 1, 1)
+        shown = rows if len(rows) <= room else rows[: room - 1]
+
+        table = Table(box=None, expand=True, show_footer=False)
+        table.add_column(
+            "stage", header_style=f"{styles.GREY} bold", no_wrap=True, ratio=40
+        )
+        table.add_column("status", header_style=f"{styles.GREY} bold", no_wrap=True)
+        table.add_column(
+            "duration",
+            header_style=f"{styles.GREY} bold",
+            no_wrap=True,
+            justify="right",
+        )
+        for name, status, duration in shown:
+            table.add_row(name, status, duration)
+
+        if len(shown) < len(rows):
+            table.add_row(Text(f"... {len(rows) - len(shown)} more", style=styles.GREY))
+
+        yield table
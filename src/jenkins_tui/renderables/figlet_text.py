@@ -1,15 +1,56 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
 from pyfiglet import Figlet
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.text import Text
 
 
+@lru_cache(maxsize=32)
+def render_figlet(text: str, width: int, height: int) -> str:
+    """Render text with the largest figlet font that fits in an area. Loading a font and rendering with it is slow so the result is cached.
+
+    Args:
+        text (str): The text to render.
+        width (int): The width of the area.
+        height (int): The height of the area.
+
+    Returns:
+        str: The figlet text, or the text as it is when the area is too small for any font.
+    """
+
+    size = min(width / 2, height)
+    if size < 4:
+        return text
+
+    if size < 7:
+        font_name = "mini"
+    elif size < 8:
+        font_name = "small"
+    elif size < 10:
+        font_name = "standard"
+    else:
+        font_name = "big"
+    font = Figlet(font=font_name, width=width)
+    return font.renderText(text).rstrip("\n")
+
+
 class FigletTextRenderable:
     """A renderable to generate figlet text that adapts to fit the container.
     The class originates from here: https://github.com/willmcgugan/textual/blob/f47b3e089c681275c48c0debc7a320b66a772a50/examples/calculator.py#L27
     """
 
-    def __init__(self, text: str) -> None:
+    def __init__(self, text: str, figlet: str | None = None) -> None:
+        """A renderable to generate figlet text that adapts to fit the container.
+
+        Args:
+            text (str): The text to render.
+            figlet (str | None): Figlet text that has already been rendered, see render_figlet. Defaults to None, which renders the text to fit the container.
+        """
+
         self.text = text
+        self.figlet = figlet
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
@@ -24,17 +65,7 @@ class FigletTextRenderable:
             RenderResult: The renderable.
         """
 
-        size = min(options.max_width / 2, options.max_height)
-        if size < 4:
-            yield Text(self.text, style="bold")
-        else:
-            if size < 7:
-                font_name = "mini"
-            elif size < 8:
-                font_name = "small"
-            elif size < 10:
-                font_name = "standard"
-            else:
-                font_name = "big"
-            font = Figlet(font=font_name, width=options.max_width)
-            yield Text(font.renderText(self.text).rstrip("\n"), style="bold")
+        figlet = self.figlet
+        if figlet is None:
+            figlet = render_figlet(self.text, options.max_width, options.max_height)
+        yield Text(figlet, style="bold")
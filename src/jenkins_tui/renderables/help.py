@@ -28,6 +28,10 @@ class HelpRenderable:
         "search": {
             "cycle suggestions": Keys.Tab,
             "complete suggestion": f"{RIGHT}",
+            "select result": f"{UP} {DOWN}",
+            "search builds": "b:",
+            "search descriptions": "d:",
+            "search parameters": "p:",
             "search": Keys.Enter,
         },
         "jobs": {
@@ -39,6 +43,7 @@ class HelpRenderable:
             "last page": "l",
             "next row": f"{DOWN}",
             "previous row": f"{UP}",
+            "open build": Keys.Enter,
         },
     }
 
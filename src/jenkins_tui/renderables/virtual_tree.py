@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.segment import Segment
+from rich.text import Text
+
+
+class VirtualTreeRenderable:
+    """A renderable that only renders the rows of a tree that are inside a window. Rows outside of the window are rendered as blank lines so the height of the tree doesn't change."""
+
+    def __init__(
+        self,
+        total_rows: int,
+        start: int,
+        end: int,
+        render_row: Callable[[int], Text],
+    ) -> None:
+        """A renderable that only renders the rows of a tree that are inside a window.
+
+        Args:
+            total_rows (int): The total number of rows in the tree.
+            start (int): The index of the first row that will be rendered.
+            end (int): The index after the last row that will be rendered.
+            render_row (Callable[[int], Text]): A callable that returns the Text for a row index.
+        """
+
+        self.total_rows = total_rows
+        self.start = max(0, start)
+        self.end = min(total_rows, end)
+        self.render_row = render_row
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        """Build the lines of the tree.
+
+        Args:
+            console (Console): The console to render to.
+            options (ConsoleOptions): The options to render with.
+
+        Yields:
+            RenderResult: The segments of each line.
+        """
+
+        new_line = Segment.line()
+        row_options = options.update(height=1)
+
+        for _ in range(self.start):
+            yield new_line
+
+        for index in range(self.start, self.end):
+            lines = console.render_lines(self.render_row(index), row_options, pad=False)
+            yield from lines[0]
+            yield new_line
+
+        for _ in range(self.end, self.total_rows):
+            yield new_line
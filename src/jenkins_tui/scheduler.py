@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+# A poll returns False when nothing has changed since the last poll, anything else counts as a change
+PollCallback = Callable[[], Awaitable[Optional[bool]]]
+
+
+@dataclass
+class Poller:
+    """A callback that is polled by the scheduler."""
+
+    name: str
+    callback: PollCallback
+    interval: float
+    fast_interval: float | None = None
+    max_interval: float = 300.0
+    cost: int = 1
+    owner: Any = None
+    next_run: float = 0.0
+    fast: bool = False
+    paused: bool = False
+    running: bool = False
+    errors: int = 0
+    unchanged: int = 0
+    polls: int = 0
+    throttled: int = 0
+    last_error: Exception | None = field(default=None, repr=False)
+
+
+class Scheduler:
+    """Owns every poller in the app and decides when each of them runs."""
+
+    def __init__(
+        self,
+        budget: int | None = None,
+        jitter: float | None = None,
+    ) -> None:
+        """Owns every poller in the app and decides when each of them runs.
+
+        Pollers back off exponentially after errors and more gently while their responses don't change, poll at their fast interval while builds they show are running, and are paused while the widget that owns them is hidden.
+        Every poll takes its cost from a token bucket that refills at budget requests per minute, so the app never makes more than that many polling requests to the controller however many pollers there are.
+
+        Args:
+            budget (int | None): The maximum number of polling requests per minute. Defaults to 60.
+            jitter (float | None): The fraction that each interval is randomly stretched or shrunk by so that many clients don't poll in step. Defaults to 0.1.
+        """
+
+        self.budget = budget or 60
+        self.jitter = 0.1 if jitter is None else jitter
+        self.pollers: list[Poller] = []
+        self.tokens = float(self.budget)
+        self.refilled = time.monotonic()
+        self.log: Callable[[str], Any] = lambda message: None
+
+        self._task: asyncio.Future[None] | None = None
+        self._wake: asyncio.Event | None = None
+
+    def add(
+        self,
+        name: str,
+        callback: PollCallback,
+        interval: float,
+        owner: Any = None,
+        fast_interval: float | None = None,
+        max_interval: float | None = None,
+        cost: int = 1,
+    ) -> Poller:
+        """Add a poller. Its first poll is one interval from now.
+
+        Args:
+            name (str): The name of the poller that is used in the debug log.
+            callback (PollCallback): The coroutine function to poll. It returns False when nothing has changed.
+            interval (float): Seconds between polls.
+            owner (Any): The widget that the poller belongs to. The poller is paused, resumed and cancelled along with it and the views that contain it. Defaults to None.
+            fast_interval (float | None): Seconds between polls while the poller is set to fast. Defaults to None, which keeps the interval.
+            max_interval (float | None): The longest that backing off can make the interval. Defaults to 8 times the interval, up to 300 seconds.
+            cost (int): The number of requests that a poll makes. Defaults to 1.
+
+        Returns:
+            Poller: The poller.
+        """
+
+        poller = Poller(
+            name=name,
+            callback=callback,
+            interval=interval,
+            fast_interval=fast_interval,
+            max_interval=max_interval or max(interval, min(interval * 8, 300.0)),
+            cost=cost,
+            owner=owner,
+        )
+        poller.next_run = time.monotonic() + self.delay(poller)
+        self.pollers.append(poller)
+        self.wake()
+        return poller
+
+    def owned_by(self, owner: Any) -> list[Poller]:
+        """Get the pollers that belong to a widget or to any widget within it.
+
+        Args:
+            owner (Any): A widget or view.
+
+        Returns:
+            list[Poller]: The pollers.
+        """
+
+        owned = []
+        for poller in self.pollers:
+            node = poller.owner
+            while node is not None:
+                if node is owner:
+                    owned.append(poller)
+                    break
+                node = getattr(node, "_parent", None)
+
+        return owned
+
+    def pause(self, owner: Any) -> None:
+        """Pause the pollers of a widget that is hidden.
+
+        Args:
+            owner (Any): A widget or view.
+        """
+
+        for poller in self.owned_by(owner):
+            poller.paused = True
+
+    def resume(self, owner: Any) -> None:
+        """Resume the pollers of a widget that is shown again. They poll straight away because their data is out of date.
+
+        Args:
+            owner (Any): A widget or view.
+        """
+
+        now = time.monotonic()
+        for poller in self.owned_by(owner):
+            if poller.paused:
+                poller.paused = False
+                poller.next_run = now
+
+        self.wake()
+
+    def cancel(self, owner: Any) -> None:
+        """Remove the pollers of a widget that has been discarded.
+
+        Args:
+            owner (Any): A widget or view.
+        """
+
+        owned = self.owned_by(owner)
+        self.pollers = [poller for poller in self.pollers if poller not in owned]
+
+    def delay(self, poller: Poller) -> float:
+        """Work out the seconds until the next poll.
+
+        Args:
+            poller (Poller): The poller.
+
+        Returns:
+            float: The delay, including jitter.
+        """
+
+        interval = poller.interval
+        if poller.fast and poller.fast_interval:
+            interval = poller.fast_interval
+
+        if poller.errors:
+            interval *= 2 ** min(poller.errors, 8)
+        elif poller.unchanged:
+            interval *= min(1.5**poller.unchanged, 4.0)
+
+        interval = min(interval, poller.max_interval)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def take(self, cost: int) -> bool:
+        """Take tokens from the request budget.
+
+        Args:
+            cost (int): The number of tokens to take.
+
+        Returns:
+            bool: True if there were enough tokens.
+        """
+
+        now = time.monotonic()
+        self.tokens = min(
+            float(self.budget), self.tokens + (now - self.refilled) * self.budget / 60
+        )
+        self.refilled = now
+
+        if self.tokens < cost:
+            return False
+
+        self.tokens -= cost
+        return True
+
+    def wake(self) -> None:
+        """Wake the scheduler so that it looks at the pollers again."""
+
+        if self._wake is not None:
+            self._wake.set()
+
+    def start(self, log: Callable[[str], Any] | None = None) -> None:
+        """Start running pollers.
+
+        Args:
+            log (Callable[[str], Any] | None): Writes messages to the debug log. Defaults to None.
+        """
+
+        if log is not None:
+            self.log = log
+
+        if self._task is None:
+            self._wake = asyncio.Event()
+            self._task = asyncio.ensure_future(self.run())
+
+    def stop(self) -> None:
+        """Stop running pollers."""
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self) -> None:
+        """Run each poller when it is due and there is enough budget, until stopped."""
+
+        assert self._wake is not None
+        while True:
+            now = time.monotonic()
+            wait = 60.0
+
+            for poller in list(self.pollers):
+                if poller.paused or poller.running:
+                    continue
+
+                if poller.next_run > now:
+                    wait = min(wait, poller.next_run - now)
+                    continue
+
+                if not self.take(poller.cost):
+                    # The poll waits for the budget to refill rather than being skipped
+                    poller.throttled += 1
+                    wait = min(wait, (poller.cost - self.tokens) * 60 / self.budget)
+                    continue
+
+                poller.running = True
+                asyncio.ensure_future(self.poll(poller))
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=max(wait, 0.01))
+            except asyncio.TimeoutError:
+                pass
+
+    async def poll(self, poller: Poller) -> None:
+        """Run a poller once and schedule its next poll.
+
+        Args:
+            poller (Poller): The poller.
+        """
+
+        try:
+            changed = await poller.callback()
+        except Exception as error:
+            poller.errors += 1
+            poller.unchanged = 0
+            poller.last_error = error
+            self.log(
+                f"Poller {poller.name} failed ({poller.errors} in a row): {error!r}"
+            )
+        else:
+            poller.errors = 0
+            poller.unchanged = poller.unchanged + 1 if changed is False else 0
+        finally:
+            poller.polls += 1
+            poller.running = False
+            poller.next_run = time.monotonic() + self.delay(poller)
+            self.wake()
+
+    @property
+    def info(self) -> str:
+        """A summary of the pollers that is written to the debug log.
+
+        Returns:
+            str: The state of each poller and the remaining budget.
+        """
+
+        pollers = ", ".join(
+            f"{poller.name}(polls={poller.polls} errors={poller.errors} unchanged={poller.unchanged} throttled={poller.throttled}{' paused' if poller.paused else ''}{' fast' if poller.fast else ''})"
+            for poller in self.pollers
+        )
+        return f"budget={self.tokens:.1f}/{self.budget} per minute pollers=[{pollers}]"
@@ -0,0 +1,15 @@
+from .cache import QueryCache
+from .fulltext import KINDS, Document, FullTextIndex
+from .index import SearchIndex
+from .prefix import PrefixMap
+from .trigram import TrigramIndex
+
+__all__ = (
+    "SearchIndex",
+    "QueryCache",
+    "FullTextIndex",
+    "Document",
+    "KINDS",
+    "PrefixMap",
+    "TrigramIndex",
+)
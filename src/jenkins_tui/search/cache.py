@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from textual.widgets import NodeID
+
+from .index import SearchIndex
+
+SearchResult = tuple[list[tuple[NodeID, str]], list[str]]
+
+
+class QueryCache:
+    """Caches the results of search queries until the index changes."""
+
+    def __init__(
+        self,
+        index: SearchIndex,
+        size: int = 256,
+        limit: int = 10,
+        completions: int = 50,
+    ) -> None:
+        """Caches the results of search queries until the index changes.
+
+        Each prefix of a query is cached as it is typed, so deleting characters from a query is answered straight away.
+
+        Args:
+            index (SearchIndex): The index that is searched.
+            size (int): The maximum number of queries that are cached. Defaults to 256.
+            limit (int): The maximum number of jobs that are returned for a query. Defaults to 10.
+            completions (int): The maximum number of completions that are returned for the last word of a query. Defaults to 50.
+        """
+
+        self.index = index
+        self.size = size
+        self.limit = limit
+        self.completions = completions
+        self.results: OrderedDict[str, SearchResult] = OrderedDict()
+
+        # Every add or remove counts as an update, so a different count means that cached results may be stale
+        self.generation = index.updates
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, query: str) -> bool:
+        self.validate()
+        return query in self.results
+
+    def validate(self) -> None:
+        """Drop every cached result if the index has changed since they were cached."""
+
+        if self.index.updates != self.generation:
+            self.results.clear()
+            self.generation = self.index.updates
+
+    def search(self, query: str) -> SearchResult:
+        """Search for the jobs that best match a query and complete the last word of the query.
+
+        Args:
+            query (str): The search query.
+
+        Returns:
+            SearchResult: The node id and full name of each matching job, and the completions of the last word of the query.
+        """
+
+        self.validate()
+
+        result = self.results.get(query)
+        if result is not None:
+            self.hits += 1
+            self.results.move_to_end(query)
+            return result
+
+        self.misses += 1
+        word = query.split(" ")[-1]
+        result = (
+            self.index.search(query, limit=self.limit),
+            self.index.complete(word, limit=self.completions) if word else [],
+        )
+
+        self.results[query] = result
+        if len(self.results) > self.size:
+            self.results.popitem(last=False)
+
+        return result
+
+    @property
+    def info(self) -> str:
+        """A summary of the cache that is written to the debug log.
+
+        Returns:
+            str: The number of hits, misses and cached queries.
+        """
+
+        return f"hits={self.hits} misses={self.misses} size={len(self.results)}/{self.size}"
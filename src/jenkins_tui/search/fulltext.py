@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from heapq import nlargest
+from itertools import islice
+from typing import Any
+
+from .prefix import PrefixMap
+
+WORD = re.compile(r"\w+")
+
+# The kinds of document that can be searched, by the prefix that is typed before a query
+KINDS = {"b": "builds", "d": "descriptions", "p": "parameters"}
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower case words. Words joined by underscores are also split so that DEPLOY_ENV is found by env.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        list[str]: The words of the text, in order.
+    """
+
+    tokens = []
+    for word in WORD.findall(text.lower()):
+        tokens.append(word)
+        if "_" in word:
+            tokens.extend(part for part in word.split("_") if part)
+
+    return tokens
+
+
+@dataclass
+class Document:
+    """A piece of text from a job that can be searched."""
+
+    job: str
+    kinds: str
+    title: str
+    text: str
+
+
+class FullTextIndex:
+    """An inverted index of job descriptions, builds and parameters."""
+
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        max_jobs: int | None = None,
+        max_text: int = 500,
+        max_candidates: int = 5000,
+    ) -> None:
+        """An inverted index of job descriptions, builds and parameters.
+
+        Jobs are added as their details are fetched, so only jobs that have been looked at can be found. The least recently added jobs are dropped once there are more than max_jobs of them.
+
+        Args:
+            enabled (bool | None): Nothing is indexed when False. Defaults to None, which enables the index.
+            max_jobs (int | None): The maximum number of jobs that are kept in the index. Defaults to 500.
+            max_text (int): Text beyond this many characters of a document isn't indexed. Defaults to 500.
+            max_candidates (int): The maximum number of documents that are looked at for the last word of a query. Defaults to 5000.
+        """
+
+        self.enabled = enabled is None or bool(enabled)
+        self.max_jobs = max_jobs or 500
+        self.max_text = max_text
+        self.max_candidates = max_candidates
+
+        self.documents: dict[int, Document] = {}
+        self.jobs: OrderedDict[str, list[int]] = OrderedDict()
+        self.tokens: PrefixMap[int] = PrefixMap()
+        self.lock = threading.RLock()
+        self.next_id = 0
+        self.updates = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add_job(self, name: str, job: dict[str, Any]) -> None:
+        """Replace the documents of a job with the description, builds and parameters from a job response. This is safe to run in the background executor.
+
+        Args:
+            name (str): The full name of the job.
+            job (dict[str, Any]): A job dict, see Jenkins.get_job.
+        """
+
+        if not self.enabled:
+            return
+
+        documents = list(self.documents_for(name, job))
+
+        with self.lock:
+            self.remove_job(name)
+
+            # Documents are numbered in reverse so that the first documents of the most recent job, such as its latest builds, are returned first
+            ids = []
+            for document in reversed(documents):
+                document_id = self.next_id
+                self.next_id += 1
+                self.documents[document_id] = document
+                for token in set(tokenize(f"{document.title} {document.text}")):
+                    self.tokens.add(token, document_id)
+                ids.append(document_id)
+
+            self.jobs[name] = ids
+            while len(self.jobs) > self.max_jobs:
+                self.remove_job(next(iter(self.jobs)))
+
+            self.tokens.compact()
+            self.updates += 1
+
+    def remove_job(self, name: str) -> None:
+        """Remove the documents of a job.
+
+        Args:
+            name (str): The full name of the job.
+        """
+
+        with self.lock:
+            for document_id in self.jobs.pop(name, []):
+                document = self.documents.pop(document_id)
+                for token in set(tokenize(f"{document.title} {document.text}")):
+                    self.tokens.remove(token, document_id)
+
+    def documents_for(self, name: str, job: dict[str, Any]) -> list[Document]:
+        """Build the documents for a job response.
+
+        Args:
+            name (str): The full name of the job.
+            job (dict[str, Any]): A job dict, see Jenkins.get_job.
+
+        Returns:
+            list[Document]: A document for the job description, for each build and for each parameter.
+        """
+
+        documents = []
+        description = job.get("description")
+        if description:
+            documents.append(
+                Document(name, "d", "description", description[: self.max_text])
+            )
+
+        for build in job.get("builds") or []:
+            result = build.get("result") or "RUNNING"
+            description = build.get("description") or ""
+            documents.append(
+                Document(
+                    name,
+                    "bd" if description else "b",
+                    f"#{build.get('number')} {result}",
+                    description[: self.max_text],
+                )
+            )
+
+        definitions: list[dict[str, Any]] = []
+        for entry in (job.get("property") or []) + (job.get("actions") or []):
+            definitions.extend((entry or {}).get("parameterDefinitions") or [])
+
+        seen = set()
+        for definition in definitions:
+            parameter = definition.get("name", "")
+            if parameter in seen:
+                continue
+            seen.add(parameter)
+
+            default = (definition.get("defaultParameterValue") or {}).get("value")
+            text = " ".join(
+                str(part)
+                for part in (definition.get("description"), default)
+                if part not in (None, "")
+            )
+            documents.append(Document(name, "p", parameter, text[: self.max_text]))
+
+        return documents
+
+    def search(
+        self, query: str, kind: str | None = None, limit: int = 10
+    ) -> list[Document]:
+        """Search for the documents that contain every word of a query. The last word only has to be the start of a word so that results are shown while it is typed.
+
+        Args:
+            query (str): The search query.
+            kind (str | None): Only search documents of this kind, see KINDS. Defaults to None, which searches every document.
+            limit (int): The maximum number of documents to return. Defaults to 10.
+
+        Returns:
+            list[Document]: The matching documents, most recently added first.
+        """
+
+        # Words of the query aren't split at underscores so that deploy_e is the start of deploy_env
+        words = WORD.findall(query.lower())
+        if not words:
+            return []
+
+        with self.lock:
+            matches: set[int] = set()
+            for _, document_ids in self.tokens.prefixed(words[-1]):
+                matches.update(islice(document_ids, self.max_candidates))
+                if len(matches) >= self.max_candidates:
+                    break
+
+            for word in words[:-1]:
+                matches &= self.tokens.values.get(word, set())
+
+            documents = self.documents
+            found = [
+                document_id
+                for document_id in matches
+                if kind is None or kind in documents[document_id].kinds
+            ]
+            return [documents[document_id] for document_id in nlargest(limit, found)]
+
+    @property
+    def info(self) -> str:
+        """A summary of the index that is written to the debug log.
+
+        Returns:
+            str: The number of jobs, documents and words in the index.
+        """
+
+        return f"jobs={len(self.jobs)}/{self.max_jobs} documents={len(self.documents)} words={len(self.tokens)} updates={self.updates}"
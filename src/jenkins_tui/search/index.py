@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Iterable
+
+from textual.widgets import NodeID
+
+from .trigram import TrigramIndex
+
+
+class SearchIndex:
+    """An index of the jobs in the tree that can be searched by name or by the folders they are in."""
+
+    def __init__(self) -> None:
+        """An index of the jobs in the tree that can be searched by name or by the folders they are in.
+
+        Entries are added and removed one at a time as the tree changes, so adding a folder of jobs never rebuilds the whole index.
+        Batches of entries are added from the background executor, so every method holds a lock while it uses the index.
+        """
+
+        self.trigrams = TrigramIndex()
+        self.lock = threading.RLock()
+        self.updates = 0
+        self.compact_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self.trigrams)
+
+    def add(self, node_id: NodeID, name: str, label: str) -> None:
+        """Add a job to the index.
+
+        Args:
+            node_id (NodeID): The id of the node in the tree.
+            name (str): The full name of the job.
+            label (str): The label of the job in the tree.
+        """
+
+        with self.lock:
+            self.trigrams.add(node_id, name, label)
+            self.updates += 1
+
+    def add_many(
+        self,
+        entries: Iterable[tuple[NodeID, str, str]],
+        exists: Callable[[NodeID], bool] | None = None,
+    ) -> None:
+        """Add a batch of jobs to the index and compact it. This is safe to run in the background executor.
+
+        Args:
+            entries (Iterable[tuple[NodeID, str, str]]): The node id, full name and label of each job.
+            exists (Callable[[NodeID], bool] | None): Checked for each job while the lock is held so that jobs removed from the tree before the batch ran aren't added. Defaults to None.
+        """
+
+        with self.lock:
+            for node_id, name, label in entries:
+                if exists is not None and not exists(node_id):
+                    continue
+
+                self.trigrams.add(node_id, name, label)
+                self.updates += 1
+
+            self.compact()
+
+    def remove(self, node_id: NodeID) -> None:
+        """Remove a job from the index.
+
+        Args:
+            node_id (NodeID): The id of the node in the tree.
+        """
+
+        with self.lock:
+            self.trigrams.remove(node_id)
+            self.updates += 1
+
+    def update(self, node_id: NodeID, name: str, label: str) -> None:
+        """Update the name of a job in the index.
+
+        Args:
+            node_id (NodeID): The id of the node in the tree.
+            name (str): The full name of the job.
+            label (str): The label of the job in the tree.
+        """
+
+        with self.lock:
+            self.remove(node_id)
+            self.add(node_id, name, label)
+
+    def compact(self) -> None:
+        """Merge the entries that have been added or removed since the last compaction into the sorted keys of the index."""
+
+        with self.lock:
+            start = time.perf_counter()
+            if self.trigrams.compact():
+                self.compact_time = time.perf_counter() - start
+
+    def get(self, name: str) -> NodeID | None:
+        """Get the node id of the job with a full name.
+
+        Args:
+            name (str): The full name of the job.
+
+        Returns:
+            NodeID | None: The node id, or None when there isn't a job with the name.
+        """
+
+        with self.lock:
+            return self.trigrams.paths.get(name.lower())
+
+    def complete(self, prefix: str, limit: int = 50) -> list[str]:
+        """Get the names of the jobs that start with a prefix, so that the last word of a query can be completed.
+
+        Args:
+            prefix (str): The prefix to complete.
+            limit (int): The maximum number of names to return. Defaults to 50.
+
+        Returns:
+            list[str]: A list of job names in their original case, in alphabetical order.
+        """
+
+        with self.lock:
+            return self.trigrams.complete(prefix, limit=limit)
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[NodeID, str]]:
+        """Search for the jobs that best match a query.
+
+        Args:
+            query (str): The search query.
+            limit (int): The maximum number of jobs to return. Defaults to 10.
+
+        Returns:
+            list[tuple[NodeID, str]]: The node id and full name of each matching job, best match first.
+        """
+
+        with self.lock:
+            return [
+                (node_id, self.trigrams.entries[node_id][0])
+                for node_id in self.trigrams.search(query, limit=limit)
+            ]
+
+    @property
+    def info(self) -> str:
+        """A summary of the index that is written to the debug log.
+
+        Returns:
+            str: The size of the index and the time of the last compaction.
+        """
+
+        return f"entries={len(self.trigrams)} names={len(self.trigrams.names)} folders={len(self.trigrams.folders)} trigrams={len(self.trigrams.postings)} updates={self.updates} compact={self.compact_time * 1000:.1f}ms"
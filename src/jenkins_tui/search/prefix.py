@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from heapq import merge
+from typing import Generic, Hashable, Iterator, TypeVar
+
+ValueType = TypeVar("ValueType", bound=Hashable)
+
+
+class PrefixMap(Generic[ValueType]):
+    """Maps strings to sets of values and finds the values of every string that starts with a prefix."""
+
+    def __init__(self) -> None:
+        """Maps strings to sets of values and finds the values of every string that starts with a prefix.
+
+        New keys are collected and merged into the sorted list of keys in one pass the next time the map is compacted or queried, so adding many values never sorts the whole map again.
+        """
+
+        self.values: dict[str, set[ValueType]] = {}
+        self.keys: list[str] = []
+
+        self._added: set[str] = set()
+        self._removed = False
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, key: str, value: ValueType) -> None:
+        """Add a value to a key.
+
+        Args:
+            key (str): The key.
+            value (ValueType): The value.
+        """
+
+        values = self.values.get(key)
+        if values is None:
+            self.values[key] = {value}
+            self._added.add(key)
+        else:
+            values.add(value)
+
+    def remove(self, key: str, value: ValueType) -> None:
+        """Remove a value from a key. The key is removed when it has no values left.
+
+        Args:
+            key (str): The key.
+            value (ValueType): The value.
+        """
+
+        values = self.values.get(key)
+        if values is None:
+            return
+
+        values.discard(value)
+        if not values:
+            del self.values[key]
+            self._added.discard(key)
+            self._removed = True
+
+    def compact(self) -> bool:
+        """Merge the keys that have been added since the last compaction into the sorted list of keys and drop the keys that are no longer used.
+
+        Returns:
+            bool: True if the keys were changed.
+        """
+
+        if not self._added and not self._removed:
+            return False
+
+        keys = self.keys
+        if self._removed:
+            # Keys that were removed and added again are already in self._added
+            keys = [
+                key for key in keys if key in self.values and key not in self._added
+            ]
+
+        self.keys = list(merge(keys, sorted(self._added)))
+        self._added.clear()
+        self._removed = False
+        return True
+
+    def prefixed(self, prefix: str) -> Iterator[tuple[str, set[ValueType]]]:
+        """Iterate over the keys that start with a prefix, in order, along with their values.
+
+        Args:
+            prefix (str): The prefix.
+
+        Yields:
+            Iterator[tuple[str, set[ValueType]]]: The key and its values.
+        """
+
+        self.compact()
+
+        keys = self.keys
+        index = bisect_left(keys, prefix)
+        while index < len(keys) and keys[index].startswith(prefix):
+            key = keys[index]
+            yield key, self.values[key]
+            index += 1
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from heapq import nsmallest
+from itertools import islice
+from typing import Iterable
+
+from textual.widgets import NodeID
+
+from .prefix import PrefixMap
+
+
+def trigrams(text: str) -> list[str]:
+    """Get the trigrams of a string.
+
+    Args:
+        text (str): The string.
+
+    Returns:
+        list[str]: The trigrams of the string, in order.
+    """
+
+    return [text[i : i + 3] for i in range(len(text) - 2)]
+
+
+class TrigramIndex:
+    """An index of job paths that returns a ranked list of the jobs that best match a query."""
+
+    def __init__(self, max_candidates: int = 2000) -> None:
+        """An index of job paths that returns a ranked list of the jobs that best match a query.
+
+        Job names and folder names are kept in sorted prefix maps, and every trigram of a job path points to the jobs that contain it.
+        At most max_candidates jobs are looked at in each stage of a search, so a query that matches most of a large server still returns straight away.
+
+        Args:
+            max_candidates (int): The maximum number of jobs that are looked at in each stage of a search. Defaults to 2000.
+        """
+
+        self.max_candidates = max_candidates
+        self.entries: dict[NodeID, tuple[str, str]] = {}
+        # Finds a job by its exact path without a search
+        self.paths: dict[str, NodeID] = {}
+        # The labels as they are shown in the tree, for completions
+        self.labels: dict[NodeID, str] = {}
+        self.names: PrefixMap[NodeID] = PrefixMap()
+        self.folders: PrefixMap[NodeID] = PrefixMap()
+        # Postings are arrays of node ids rather than lists because there is one entry for every trigram of every job
+        self.postings: dict[str, array[int]] = {}
+
+        # Removed jobs are left in the postings until there are enough of them to be worth dropping
+        self.garbage = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, node_id: NodeID, path: str, label: str) -> None:
+        """Add a job to the index.
+
+        Args:
+            node_id (NodeID): The id of the node in the tree.
+            path (str): The full path of the job including its folders.
+            label (str): The label of the job in the tree.
+        """
+
+        if node_id in self.entries:
+            self.remove(node_id)
+
+        self.labels[node_id] = label
+        path = path.lower()
+        label = label.lower()
+        self.entries[node_id] = (path, label)
+        self.paths[path] = node_id
+
+        self.names.add(label, node_id)
+        for folder in path.split("/")[:-1]:
+            self.folders.add(folder, node_id)
+
+        for gram in set(trigrams(path)):
+            posting = self.postings.get(gram)
+            if posting is None:
+                self.postings[gram] = array("I", (node_id,))
+            else:
+                posting.append(node_id)
+
+    def remove(self, node_id: NodeID) -> None:
+        """Remove a job from the index.
+
+        Args:
+            node_id (NodeID): The id of the node in the tree.
+        """
+
+        entry = self.entries.pop(node_id, None)
+        if entry is None:
+            return
+
+        path, label = entry
+        del self.labels[node_id]
+        if self.paths.get(path) == node_id:
+            del self.paths[path]
+        self.names.remove(label, node_id)
+        for folder in path.split("/")[:-1]:
+            self.folders.remove(folder, node_id)
+
+        self.garbage += 1
+        if self.garbage > 1000 and self.garbage > len(self.entries):
+            self.collect()
+
+    def collect(self) -> None:
+        """Drop removed jobs from the trigram postings."""
+
+        entries = self.entries
+        postings: dict[str, array[int]] = {}
+        for gram, posting in self.postings.items():
+            live = array("I", (node_id for node_id in posting if node_id in entries))
+            if live:
+                postings[gram] = live
+
+        self.postings = postings
+        self.garbage = 0
+
+    def compact(self) -> bool:
+        """Merge the job and folder names that have been added or removed since the last compaction into their sorted lists.
+
+        Returns:
+            bool: True if either list was changed.
+        """
+
+        changed = self.names.compact()
+        return self.folders.compact() or changed
+
+    def complete(self, prefix: str, limit: int = 50) -> list[str]:
+        """Get the job names that start with a prefix, ignoring case.
+
+        Args:
+            prefix (str): The prefix to complete.
+            limit (int): The maximum number of names to return. Defaults to 50.
+
+        Returns:
+            list[str]: The names as they are shown in the tree, in alphabetical order.
+        """
+
+        # Jobs in different folders can share a name, so each name is only returned once
+        names: dict[str, None] = {}
+        for _, node_ids in self.names.prefixed(prefix.lower()):
+            for label in sorted({self.labels[node_id] for node_id in node_ids}):
+                names[label] = None
+
+            if len(names) >= limit:
+                break
+
+        return list(names)[:limit]
+
+    def search(self, query: str, limit: int = 10) -> list[NodeID]:
+        """Search for the jobs that best match a query.
+
+        Every word of the query has to be part of the job path. Jobs are ranked by where the last word matches, stopping as soon as there are enough results:
+
+        1. the job name is the word
+        2. the job name starts with the word
+        3. the name of one of the folders the job is in starts with the word
+        4. the job name contains the word
+        5. the job path contains the word
+        6. when nothing contains the word, the job path shares most of the rarest trigrams of the word so that typos still find a match
+
+        Args:
+            query (str): The search query.
+            limit (int): The maximum number of jobs to return. Defaults to 10.
+
+        Returns:
+            list[NodeID]: The ids of the matching nodes, best match first.
+        """
+
+        terms = query.lower().split()
+        if not terms:
+            return []
+
+        word = terms[-1]
+        others = terms[:-1]
+        ranked: dict[NodeID, tuple[int, int, int, str]] = {}
+
+        def consider(
+            node_ids: Iterable[NodeID], tier: int, order: int, until: int | None = None
+        ) -> None:
+            for node_id in node_ids:
+                if node_id in ranked:
+                    continue
+
+                entry = self.entries.get(node_id)
+                if entry is None:
+                    continue
+
+                path, label = entry
+                if others and not all(other in path for other in others):
+                    continue
+
+                if tier == 3 and word not in label:
+                    ranked[node_id] = (4, order, len(path), path)
+                else:
+                    ranked[node_id] = (tier, order, len(path), path)
+
+                if until is not None and len(ranked) >= until:
+                    break
+
+        budget = self.max_candidates
+        for order, (name, node_ids) in enumerate(self.names.prefixed(word)):
+            consider(node_ids, 0 if name == word else 1, order)
+            budget -= len(node_ids)
+            if len(ranked) >= limit or budget <= 0:
+                break
+
+        if len(ranked) < limit:
+            budget = self.max_candidates
+            for order, (_, node_ids) in enumerate(self.folders.prefixed(word)):
+                consider(islice(node_ids, budget), 2, order)
+                budget -= len(node_ids)
+                if len(ranked) >= limit or budget <= 0:
+                    break
+
+        grams = trigrams(word)
+        if len(ranked) >= limit or not grams:
+            return nsmallest(limit, ranked, key=ranked.__getitem__)
+
+        # Looking for better matches once there are plenty of substring matches isn't worth the time
+        enough = len(ranked) + limit * 10
+        postings = sorted(
+            (self.postings.get(gram, array("I")) for gram in grams), key=len
+        )
+        entries = self.entries
+        removed = ("", "")
+        consider(
+            (
+                node_id
+                for node_id in islice(postings[0], self.max_candidates)
+                if word in entries.get(node_id, removed)[0]
+            ),
+            3,
+            0,
+            until=enough,
+        )
+
+        # Typos are only looked for when nothing contains the word. The rarest trigrams say the most about a job so only they are counted
+        if not ranked and len(grams) > 1:
+            rarest = [posting for posting in postings if posting][:4]
+            # The candidates are shared out between the postings before they are counted, so that counting costs about as much as the substring stage
+            share = self.max_candidates // max(len(rarest), 1)
+            counts: Counter[NodeID] = Counter()
+            for posting in rarest:
+                counts.update(islice(posting, share))
+
+            threshold = max(2, (len(rarest) + 1) // 2)
+            fuzzy = nsmallest(
+                limit * 10,
+                (
+                    (len(rarest) - count, node_id)
+                    for node_id, count in counts.items()
+                    if count >= threshold
+                ),
+            )
+            for missing, node_id in fuzzy:
+                consider([node_id], 5, missing)
+
+        return nsmallest(limit, ranked, key=ranked.__getitem__)
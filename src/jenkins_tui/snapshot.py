@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any
+
+from .cache_file import CacheFile
+from .executor import BackgroundExecutor
+
+
+class Snapshot:
+    """Persists the job tree of a Jenkins server so that it can be shown straight away the next time the app starts."""
+
+    version = 1
+
+    def __init__(
+        self,
+        url: str,
+        username: str | None = None,
+        enabled: bool | None = None,
+        directory: str | None = None,
+        executor: BackgroundExecutor | None = None,
+    ) -> None:
+        """Persists the job tree of a Jenkins server so that it can be shown straight away the next time the app starts.
+
+        A snapshot is kept per server url and username, see CacheFile.
+
+        Args:
+            url (str): The url of the Jenkins server.
+            username (str | None): The user that the jobs were requested by. Defaults to None.
+            enabled (bool | None): Snapshots are not loaded or saved when False. Defaults to None, which enables snapshots.
+            directory (str | None): Overrides the directory that snapshots are kept in. Defaults to None.
+            executor (BackgroundExecutor | None): Reads and writes the snapshot away from the event loop. Defaults to None, which uses the default executor of the event loop.
+        """
+
+        self.url = url
+        self.enabled = enabled is None or bool(enabled)
+        self.file = CacheFile(
+            url=url,
+            version=self.version,
+            username=username,
+            directory=directory,
+            executor=executor,
+        )
+        self.path = self.file.path
+
+    async def load(self) -> list[dict[str, Any]] | None:
+        """Load the jobs that were saved in the snapshot without blocking the event loop.
+
+        Returns:
+            list[dict[str, Any]] | None: A list of job dicts, or None when snapshots are disabled or there isn't a usable snapshot.
+        """
+
+        if not self.enabled:
+            return None
+
+        snapshot = await self.file.load()
+        return snapshot.get("jobs") if snapshot is not None else None
+
+    async def save(self, jobs: list[dict[str, Any]]) -> None:
+        """Save a list of jobs to the snapshot without blocking the event loop.
+
+        Args:
+            jobs (list[dict[str, Any]]): A list of job dicts.
+        """
+
+        if self.enabled:
+            await self.file.save({"jobs": jobs})
+
+    def clear(self) -> None:
+        """Remove the snapshot if it exists."""
+
+        self.file.clear()
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from functools import lru_cache
 from typing import Any
-from urllib.parse import unquote
+from urllib.parse import unquote, urlparse
 
 from dependency_injector.wiring import Container, Provide, inject
 from rich.console import RenderableType
-from rich.text import Text
+from rich.text import Text, TextType
 from textual import events
 from textual.reactive import Reactive, watch
 from textual.widgets import NodeID, TreeClick, TreeControl, TreeNode
 
 from . import styles
 from .containers import Container
+from .executor import BackgroundExecutor
 from .jenkins import Jenkins
+from .renderables import VirtualTreeRenderable
+from .scheduler import Scheduler
+from .search import SearchIndex
+from .snapshot import Snapshot
 from .views import JobView
 
 
@@ -29,23 +36,77 @@ class JobEntry:
     jobs: str | list[dict[str, str]]
 
 
+class JobNode(TreeNode[JobEntry]):
+    """A tree node that lets the tree know when it has been expanded or collapsed."""
+
+    async def expand(self, expanded: bool = True) -> None:
+        """Overrides expand from TreeNode so that the rows of the tree are rebuilt.
+
+        Args:
+            expanded (bool): Expand the node if True and collapse it if False. Defaults to True.
+        """
+
+        control = self.control
+        assert isinstance(control, Tree)
+        control.invalidate_rows()
+        await super().expand(expanded)
+
+
 class Tree(TreeControl[JobEntry]):
 
     current_node: JobEntry
+    id: NodeID
     has_focus: Reactive[bool] = Reactive(False)
 
     @inject
-    def __init__(self, client: Jenkins = Provide[Container.client]) -> None:
+    def __init__(
+        self,
+        client: Jenkins = Provide[Container.client],
+        lazy_load: bool | None = Provide[Container.config.lazy_load],
+        prefetch_depth: int | None = Provide[Container.config.prefetch_depth],
+        refresh_interval: float | None = Provide[
+            Container.config.tree_refresh_interval
+        ],
+        virtual: bool | None = Provide[Container.config.virtual_tree],
+        snapshot: Snapshot = Provide[Container.snapshot],
+        search_index: SearchIndex = Provide[Container.search_index],
+        executor: BackgroundExecutor = Provide[Container.executor],
+        scheduler: Scheduler = Provide[Container.scheduler],
+    ) -> None:
         """Creates a directory tree struction from Jenkins jobs and builds.
         This class is a copy of textual.widgets.DirectoryTree with ammendments that allow it to be used with Jenkins Api responses.
 
         # noqa: DAR101 client
+        # noqa: DAR101 lazy_load
+        # noqa: DAR101 prefetch_depth
+        # noqa: DAR101 refresh_interval
+        # noqa: DAR101 virtual
+        # noqa: DAR101 snapshot
+        # noqa: DAR101 search_index
+        # noqa: DAR101 executor
+        # noqa: DAR101 scheduler
         """
         data = JobEntry(name="root", url="", color="", type="root", jobs=[])
         name = self.__class__.__name__
         super().__init__(label="home", name=name, data=data)
 
         self.client = client
+        self.snapshot = snapshot
+        self.search_index = search_index
+        self.executor = executor
+        self.scheduler = scheduler
+        self.lazy_load = bool(lazy_load)
+        self.prefetch_depth = prefetch_depth or 0
+
+        # Without lazy loading a refresh downloads the whole recursive job tree, so it is only refreshed periodically when asked to
+        if refresh_interval is None:
+            refresh_interval = 60.0 if self.lazy_load else 0.0
+        self.refresh_interval = refresh_interval
+        self.refreshing = False
+
+        # Jobs are added to the tree in chunks so that the event loop isn't blocked while a large server is mapped
+        self.chunk_size = 500
+
         self.color_map = {
             "aborted": "❌",
             "aborted_anime": "❌",
@@ -68,6 +129,25 @@ class Tree(TreeControl[JobEntry]):
             "hudson.model.FreeStyleProject": "freestyle",
         }
 
+        # Maps job urls to their node so that loaded jobs can be found without walking the tree
+        self.job_index: dict[str, TreeNode[JobEntry]] = {}
+
+        # When the tree is virtual only the rows inside the visible window, plus an overscan, are rendered
+        self.virtual = bool(virtual)
+        self.overscan = 20
+        self.window_offset = 0
+        self.rendered_window = (0, 0)
+        self._rows: list[tuple[TreeNode[JobEntry], str]] | None = None
+        self._row_index: dict[NodeID, int] = {}
+
+        # Rendered labels are cached per node along with the state they were rendered with
+        self.label_cache: OrderedDict[NodeID, tuple[tuple[Any, ...], Text]] = (
+            OrderedDict()
+        )
+        self.label_cache_size = 1024 * 32
+        self.label_cache_hits = 0
+        self.label_cache_misses = 0
+
         self.root.tree.guide_style = styles.BLACK
         self.current_node = self.root.data
         self.padding = (0, 0)
@@ -77,10 +157,25 @@ class Tree(TreeControl[JobEntry]):
 
         watch(self.app, "search_node", self.action_click_label)
 
+        # When there is a snapshot from a previous run it is shown straight away and then refreshed in the background
+        start = time.perf_counter()
+        jobs = await self.snapshot.load()
+        if jobs:
+            self.root.data.jobs = jobs
+
         await self.load_jobs(self.root)
         self.cursor = self.root.id
         self.show_cursor = True
 
+        if jobs:
+            self.log(f"Loaded tree from snapshot in {time.perf_counter() - start:.3f}s")
+            asyncio.ensure_future(self.refresh_tree())
+
+        if self.refresh_interval > 0:
+            self.scheduler.add(
+                "tree", self.refresh_tree, interval=self.refresh_interval, owner=self
+            )
+
     def on_focus(self) -> None:
         """Sets has_focus to true when the item is clicked."""
         self.has_focus = True
@@ -112,6 +207,130 @@ class Tree(TreeControl[JobEntry]):
                 await cursor_node.toggle()
                 self.refresh(layout=True)
 
+    async def add(self, node_id: NodeID, label: TextType, data: JobEntry) -> None:
+        """Overrides add from TreeControl so that nodes are created as JobNodes.
+
+        Args:
+            node_id (NodeID): The id of the parent node.
+            label (TextType): The label of the new node.
+            data (JobEntry): The data of the new node.
+        """
+
+        parent = self.nodes[node_id]
+        self.id = NodeID(self.id + 1)
+        child_tree = parent.tree.add(label)
+        child_node = JobNode(parent, self.id, self, child_tree, label, data)
+        parent.children.append(child_node)
+        child_tree.label = child_node
+        self.nodes[self.id] = child_node
+
+        self.invalidate_rows()
+
+    def invalidate_rows(self) -> None:
+        """Mark the rows of the tree as changed so that they are rebuilt on the next render."""
+
+        self._rows = None
+
+    @property
+    def rows(self) -> list[tuple[TreeNode[JobEntry], str]]:
+        """The visible rows of the tree in display order, along with the guide for each row.
+
+        Returns:
+            list[tuple[TreeNode[JobEntry], str]]: A list of nodes and their guides.
+        """
+
+        if self._rows is not None:
+            return self._rows
+
+        rows: list[tuple[TreeNode[JobEntry], str]] = [(self.root, "")]
+        stack: list[tuple[TreeNode[JobEntry], str, bool]] = []
+
+        def push_children(node: TreeNode[JobEntry], indent: str) -> None:
+            if node.expanded:
+                last = len(node.children) - 1
+                for index in range(last, -1, -1):
+                    stack.append((node.children[index], indent, index == last))
+
+        push_children(self.root, "")
+        while stack:
+            node, indent, is_last = stack.pop()
+            rows.append((node, indent + ("└── " if is_last else "├── ")))
+            push_children(node, indent + ("    " if is_last else "│   "))
+
+        self._rows = rows
+        self._row_index = {node.id: index for index, (node, _) in enumerate(rows)}
+        return rows
+
+    def find_cursor(self) -> int | None:
+        """Overrides find_cursor from TreeControl so that the row index is used when the tree is virtual.
+
+        Returns:
+            int | None: The line of the cursor node.
+        """
+
+        if not self.virtual:
+            return super().find_cursor()
+
+        self.rows
+        return self._row_index.get(self.cursor)
+
+    def scroll_window(self, offset: int) -> None:
+        """Move the visible window of a virtual tree. The tree is only rendered again when the window moves outside of the rows that have already been rendered.
+
+        Args:
+            offset (int): The index of the first visible row.
+        """
+
+        self.window_offset = offset
+        start, end = self.rendered_window
+        height = self.app.console.size.height
+
+        if self.virtual and not (start <= offset and offset + height <= end):
+            self.refresh(layout=True)
+
+    def render_row(self, index: int) -> Text:
+        """Render a single row of the tree.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            Text: The guide and label of the row.
+        """
+
+        node, guide = self.rows[index]
+        label = self.render_node(node)
+        assert isinstance(label, Text)
+
+        row = Text(
+            guide, style=self.root.tree.guide_style, no_wrap=True, overflow="ellipsis"
+        )
+        row.append_text(label)
+        return row
+
+    def render(self) -> RenderableType:
+        """Overrides render from TreeControl so that only the visible rows are rendered when the tree is virtual.
+
+        Returns:
+            RenderableType: Object to be rendered
+        """
+
+        if not self.virtual:
+            return super().render()
+
+        # The sidebar can't be taller than the terminal so it is used as the height of the window
+        height = self.app.console.size.height
+        start = max(0, self.window_offset - self.overscan)
+        end = self.window_offset + height + self.overscan
+        self.rendered_window = (start, end)
+
+        return VirtualTreeRenderable(
+            total_rows=len(self.rows),
+            start=start,
+            end=end,
+            render_row=self.render_row,
+        )
+
     def render_node(self, node: TreeNode[JobEntry]) -> RenderableType:
         """Renders a node in the tree.
 
@@ -122,20 +341,50 @@ class Tree(TreeControl[JobEntry]):
             RenderableType: A renderable object.
         """
 
-        return self.render_tree_label(
-            node,
+        is_cursor = node.is_cursor
+        state = (
+            node.label,
             node.data.type,
+            node.data.color,
             node.expanded,
-            node.is_cursor,
+            is_cursor,
             node.id == self.hover_node,
-            self.has_focus,
+            # Focus only changes the style of the cursor so other labels don't need to be rendered again
+            self.has_focus if is_cursor else False,
         )
 
-    @lru_cache(maxsize=1024 * 32)
+        cached = self.label_cache.get(node.id)
+        if cached is not None and cached[0] == state:
+            self.label_cache_hits += 1
+            self.label_cache.move_to_end(node.id)
+            return cached[1]
+
+        self.label_cache_misses += 1
+        label = self.render_tree_label(node, *state[1:])
+        assert isinstance(label, Text)
+
+        self.label_cache[node.id] = (state, label)
+        self.label_cache.move_to_end(node.id)
+        if len(self.label_cache) > self.label_cache_size:
+            self.label_cache.popitem(last=False)
+
+        return label
+
+    @property
+    def label_cache_info(self) -> str:
+        """A summary of the label cache that is written to the debug log.
+
+        Returns:
+            str: The hits, misses and size of the label cache.
+        """
+
+        return f"hits={self.label_cache_hits} misses={self.label_cache_misses} size={len(self.label_cache)}/{self.label_cache_size}"
+
     def render_tree_label(
         self,
         node: TreeNode[JobEntry],
         type: str,
+        color: str,
         expanded: bool,
         is_cursor: bool,
         is_hover: bool,
@@ -146,6 +395,7 @@ class Tree(TreeControl[JobEntry]):
         Args:
             node (TreeNode[JobEntry]): [description]
             type (str): [description]
+            color (str): [description]
             expanded (bool): [description]
             is_cursor (bool): [description]
             is_hover (bool): [description]
@@ -158,7 +408,7 @@ class Tree(TreeControl[JobEntry]):
         meta = {
             "@click": f"click_label({node.id})",
             "tree_node": node.id,
-            "cursor": node.is_cursor,
+            "cursor": is_cursor,
         }
 
         label = Text(node.label) if isinstance(node.label, str) else node.label
@@ -167,7 +417,7 @@ class Tree(TreeControl[JobEntry]):
             label.stylize("underline")
 
         if is_cursor:
-            style = "reverse" if self.has_focus else "on black"
+            style = "reverse" if has_focus else "on black"
             label.stylize(style)
 
         if type == "root":
@@ -184,7 +434,7 @@ class Tree(TreeControl[JobEntry]):
 
         else:
             label.stylize(styles.GREY)
-            icon = self.color_map.get(node.data.color, "?")
+            icon = self.color_map.get(color, "?")
 
         icon_label = Text(f"{icon} ", no_wrap=True, overflow="ellipsis") + label
         icon_label.apply_meta(meta)
@@ -202,52 +452,264 @@ class Tree(TreeControl[JobEntry]):
         self.show_cursor = True
         await self.post_message(TreeClick(self, node))
 
+    async def get_jobs(self, node: TreeNode[JobEntry]) -> list[dict[str, Any]]:
+        """Get the jobs that belong to a tree node from Jenkins.
+
+        Only jobs below the node are requested. When lazy loading is enabled this is limited to the direct children of the node, along with prefetch_depth levels of nested folders.
+
+        Args:
+            node (TreeNode[JobEntry]): The node to get jobs for.
+
+        Returns:
+            list[dict[str, Any]]: A list of job dicts.
+        """
+
+        path = urlparse(node.data.url).path if node.data.type != "root" else None
+
+        if not self.lazy_load:
+            jobs = await self.client.get_jobs(path=path, recursive=True)
+        else:
+            jobs = await self.client.get_jobs(
+                path=path,
+                recursive=self.prefetch_depth > 0,
+                folder_depth=self.prefetch_depth,
+            )
+
+        return jobs
+
     async def load_jobs(self, node: TreeNode[JobEntry]):
-        """Load jobs for a tree node. If the current node is "root" then a call is made to Jenkins to retrieve a full list otherwise process jobs from the current node.
+        """Load jobs for a tree node. Jobs that are already held by the node from a previous response are used as they are, otherwise only the jobs below the node are requested from Jenkins.
 
         Args:
             node (TreeNode[JobEntry]): [description]
         """
-        jobs = await self.client.get_jobs(recursive=True)
+        if node.data.jobs and isinstance(node.data.jobs, list):
+            jobs = node.data.jobs
+        else:
+            jobs = await self.get_jobs(node)
 
-        async def map_nodes(
-            node: TreeNode[JobEntry], jobs: list[dict[str, Any]]
-        ) -> None:
+            # The response for the root node is the job tree that is shown when the app starts
+            if node is self.root:
+                await self.snapshot.save(jobs)
 
-            if not jobs:
-                return
+        # The node is expanded first so that jobs are shown as each chunk is added
+        node.loaded = True
+        await node.expand()
+        await self.map_nodes(node, jobs)
+        self.refresh(layout=True)
 
-            for entry in jobs:
-                typeof = self.type_map.get(entry["_class"], "")
-                clean_name = unquote(entry["name"])
-                parts = entry["url"].strip("/").split("/job/")
-                full_name = "/".join(parts[1:])
+    async def map_nodes(
+        self, node: TreeNode[JobEntry], jobs: list[dict[str, Any]]
+    ) -> None:
+        """Add a list of jobs, and any jobs nested within them, to a node.
 
-                job = JobEntry(
-                    name=full_name,
-                    url=entry["url"],
-                    color=entry.get("color", "none"),
-                    type=typeof,
-                    jobs=entry.get("jobs", []),
-                )
+        Nested jobs are added breadth first without recursion. After every chunk_size jobs the tree is refreshed and control is handed back to the event loop so that the app stays responsive and the jobs that have been added so far are shown.
+        Each chunk is added to the search index by the background executor while the next chunk is added to the tree.
 
-                await node.add(clean_name, job)
-                node.loaded = True
+        Args:
+            node (TreeNode[JobEntry]): The node that the jobs belong to.
+            jobs (list[dict[str, Any]]): A list of job dicts.
+        """
 
-                if entry.get("jobs"):
-                    await map_nodes(self.nodes[self.id], entry["jobs"])
+        start = time.perf_counter()
+        count = 0
+        pending = deque((node, entry) for entry in jobs)
+        indexed: list[tuple[NodeID, str, str]] = []
+        batches: list[asyncio.Future[None]] = []
 
-        await map_nodes(node, jobs)
-        await node.expand()
+        while pending:
+            parent, entry = pending.popleft()
+
+            # The parent may have been removed by a refresh while the event loop had control
+            if parent.id not in self.nodes:
+                continue
 
-        self.app.searchable_nodes = self.nodes
+            child = await self.add_job(parent, entry)
+            pending.extend((child, job) for job in entry.get("jobs", []))
+            indexed.append((child.id, child.data.name, str(child.label)))
+
+            count += 1
+            if count % self.chunk_size == 0:
+                batches.append(asyncio.ensure_future(self.index_jobs(indexed)))
+                indexed = []
+                self.refresh(layout=True)
+                await asyncio.sleep(0)
 
-        # This sets the nodes that can be searched
         self.refresh(layout=True)
+        await asyncio.gather(*batches, self.index_jobs(indexed))
 
-    async def refresh_tree(self):
-        self.root.tree.children.clear()
-        await self.load_jobs(self.root)
+        if count:
+            elapsed = time.perf_counter() - start
+            self.log(
+                f"Mapped {count} nodes in {elapsed:.3f}s ({count / max(elapsed, 1e-9):.0f} nodes/sec)"
+            )
+
+            self.log(f"Search index: {self.search_index.info}")
+
+    async def index_jobs(self, entries: list[tuple[NodeID, str, str]]) -> None:
+        """Add a batch of jobs to the search index in the background executor.
+
+        Args:
+            entries (list[tuple[NodeID, str, str]]): The node id, full name and label of each job.
+        """
+
+        # Nodes are removed from the tree before the search index, so a job that is removed while its batch waits is skipped
+        await self.executor.run(
+            self.search_index.add_many, entries, self.nodes.__contains__
+        )
+
+    async def add_job(
+        self, node: TreeNode[JobEntry], entry: dict[str, Any]
+    ) -> TreeNode[JobEntry]:
+        """Add a job to a node. Jobs nested within the job are not added, see map_nodes.
+
+        Args:
+            node (TreeNode[JobEntry]): The node that the job belongs to.
+            entry (dict[str, Any]): A job dict.
+
+        Returns:
+            TreeNode[JobEntry]: The node that was added.
+        """
+
+        typeof = self.type_map.get(entry["_class"], "")
+        clean_name = unquote(entry["name"])
+        parts = entry["url"].strip("/").split("/job/")
+        full_name = "/".join(parts[1:])
+
+        job = JobEntry(
+            name=full_name,
+            url=entry["url"],
+            color=entry.get("color", "none"),
+            type=typeof,
+            jobs=entry.get("jobs", []),
+        )
+
+        await self.add(node.id, clean_name, job)
+        node.loaded = True
+        child = self.nodes[self.id]
+        self.job_index[job.url] = child
+
+        # Folders without a jobs key haven't been fetched yet and are loaded when expanded
+        if "jobs" in entry:
+            child.loaded = True
+
+        return child
+
+    def remove_node(self, node: TreeNode[JobEntry]) -> None:
+        """Remove a node, and all of the nodes below it, from the tree.
+
+        Args:
+            node (TreeNode[JobEntry]): The node to remove.
+        """
+
+        for child in list(node.children):
+            self.remove_node(child)
+
+        if node.parent is not None:
+            node.parent.children.remove(node)
+            node.parent.tree.children.remove(node.tree)
+            self.invalidate_rows()
+
+            if self.cursor == node.id:
+                self.cursor = node.parent.id
+                self.cursor_line = self.find_cursor() or 0
+
+        self.nodes.pop(node.id, None)
+        self.job_index.pop(node.data.url, None)
+        self.label_cache.pop(node.id, None)
+        self.search_index.remove(node.id)
+
+    async def apply_jobs(
+        self, node: TreeNode[JobEntry], jobs: list[dict[str, Any]]
+    ) -> tuple[int, list[TreeNode[JobEntry]]]:
+        """Apply the current state of a list of jobs to the children of a node.
+        Jobs that are new are added, jobs that no longer exist are removed and jobs that have a new color are updated. Nothing else is touched.
+
+        Args:
+            node (TreeNode[JobEntry]): The node that the jobs belong to.
+            jobs (list[dict[str, Any]]): A list of job dicts.
+
+        Returns:
+            tuple[int, list[TreeNode[JobEntry]]]: The number of changes that were made and a list of loaded folders whose jobs were not part of the response.
+        """
+
+        changes = 0
+        unchecked: list[TreeNode[JobEntry]] = []
+        added: list[dict[str, Any]] = []
+        urls = set()
+
+        for entry in jobs:
+            urls.add(entry["url"])
+            child = self.job_index.get(entry["url"])
+
+            if child is None:
+                added.append(entry)
+                changes += 1
+                continue
+
+            color = entry.get("color", "none")
+            if child.data.color != color:
+                child.data.color = color
+                changes += 1
+
+            if "jobs" in entry:
+                child.data.jobs = entry["jobs"]
+                if child.loaded:
+                    child_changes, child_unchecked = await self.apply_jobs(
+                        child, entry["jobs"]
+                    )
+                    changes += child_changes
+                    unchecked.extend(child_unchecked)
+                else:
+                    child.loaded = True
+                    await self.map_nodes(child, entry["jobs"])
+                    changes += 1
+
+            elif child.loaded and child.children:
+                unchecked.append(child)
+
+        for child in list(node.children):
+            if child.data.url not in urls:
+                self.remove_node(child)
+                changes += 1
+
+        await self.map_nodes(node, added)
+
+        return changes, unchecked
+
+    async def refresh_tree(self) -> bool:
+        """Refresh the tree with the current state of the jobs on the server.
+        The existing nodes are kept so that expanded folders and the cursor position are not lost. Only jobs that have been added, removed or have changed color are touched.
+
+        Returns:
+            bool: True if any jobs were changed.
+        """
+
+        if self.refreshing:
+            return False
+
+        self.refreshing = True
+        try:
+            jobs = await self.get_jobs(self.root)
+            changes, unchecked = await self.apply_jobs(self.root, jobs)
+
+            # With lazy loading the jobs in expanded folders are refreshed with their own request
+            for node in unchecked:
+                if node.expanded and node.id in self.nodes:
+                    folder_changes, _ = await self.apply_jobs(
+                        node, await self.get_jobs(node)
+                    )
+                    changes += folder_changes
+
+            self.log(f"Refreshed tree with {changes} changes")
+
+            if changes:
+                self.refresh(layout=True)
+                await self.snapshot.save(jobs)
+
+            return changes > 0
+        finally:
+            self.refreshing = False
 
     async def expand_parent_nodes(self, node: TreeNode[JobEntry]) -> None:
         """Expands the parent of a node.
@@ -272,8 +734,10 @@ class Tree(TreeControl[JobEntry]):
         if node_data.type == "job" or node_data.type == "freestyle":
             self.log("Handling JobClick message")
 
-            # if the current node is the same as the clicked node then shouldn't do anything
-            if node_data.name != self.current_node.name:
+            # if the current node is the same as the clicked node then shouldn't do anything, unless one of its builds is open
+            if node_data.name != self.current_node.name or not isinstance(
+                self.app.container.window, JobView
+            ):
                 self.current_node = node_data
                 view = JobView(url=node_data.url)
                 await self.app.container.update(view=view)
@@ -1,3 +1,10 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+
 def replace_last(string: str, find: str, replace: str) -> str:
     """Replace the last occurrence of a string.
 
@@ -13,3 +20,62 @@ def replace_last(string: str, find: str, replace: str) -> str:
     reversed = string[::-1]
     replaced = reversed.replace(find[::-1], replace[::-1], 1)
     return replaced[::-1]
+
+
+class Debouncer:
+    """Delays a call until no newer call has been made for a while."""
+
+    def __init__(self, delay: float) -> None:
+        """Delays a call until no newer call has been made for a while. A call that is replaced by a newer call is cancelled, even if it has already started.
+
+        Args:
+            delay (float): Seconds to wait for a newer call before making the latest call.
+        """
+
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = 0
+        self._task: asyncio.Future[None] | None = None
+        self._pending: Callable[[], Awaitable[Any]] | None = None
+
+    def call(self, fn: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        """Schedule a call, cancelling the previous call if it hasn't finished.
+
+        Args:
+            fn (Callable[..., Awaitable[Any]]): The coroutine function to call.
+            *args (Any): Positional arguments that are passed to the function.
+        """
+
+        self.cancel()
+        self.calls += 1
+        self._pending = partial(fn, *args)
+        self._task = asyncio.ensure_future(self._run(self._pending))
+
+    async def _run(self, pending: Callable[[], Awaitable[Any]]) -> None:
+        """Wait for the delay, then make the call.
+
+        Args:
+            pending (Callable[[], Awaitable[Any]]): The call to make.
+        """
+
+        await asyncio.sleep(self.delay)
+        self._pending = None
+        await pending()
+
+    def cancel(self) -> None:
+        """Cancel the scheduled call if it hasn't finished."""
+
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            self.cancelled += 1
+
+        self._task = None
+        self._pending = None
+
+    async def flush(self) -> None:
+        """Make the scheduled call straight away if it is still waiting for the delay."""
+
+        pending = self._pending
+        if pending is not None:
+            self.cancel()
+            await pending()
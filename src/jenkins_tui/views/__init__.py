@@ -1,3 +1,4 @@
+from .build import BuildView
 from .build_with_parameters import BuildWithParametersView
 from .home import HomeView
 from .job import JobView
@@ -7,6 +8,7 @@ from .side_bar import SideBarView
 __all__ = (
     "CustomScrollView",
     "JobView",
+    "BuildView",
     "HomeView",
     "BuildWithParametersView",
     "SideBarView",
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from urllib.parse import urlparse
+
+from dependency_injector.wiring import Provide, inject
+
+from ..containers import Container
+from ..jenkins import Jenkins
+from ..scheduler import Poller, Scheduler
+from ..widgets import BuildStagesWidget
+from .base import BaseView
+
+
+class BuildView(BaseView):
+    """A view that displays the stages of a pipeline build."""
+
+    @inject
+    def __init__(
+        self,
+        url: str,
+        number: int,
+        client: Jenkins = Provide[Container.client],
+        scheduler: Scheduler = Provide[Container.scheduler],
+    ) -> None:
+        """A view that displays the stages of a pipeline build.
+
+        The stages are loaded incrementally. Each poll gets the list of stages, then only fetches the steps of stages that are new or were still running, so a completed stage is only fetched once. Polling stops once the build has completed.
+
+        Args:
+            url (str): The url of the job.
+            number (int): The build number.
+
+        # noqa: DAR101 client
+        # noqa: DAR101 scheduler
+        """
+        super().__init__()
+        self.url = url
+        self.path = urlparse(url).path
+        self.number = number
+        self.client = client
+        self.scheduler = scheduler
+        self.poller: Poller | None = None
+        self.job_name = "/".join(url.strip("/").split("/job/")[1:])
+        self.run: dict[str, Any] | None = None
+        self.stages: dict[str, dict[str, Any]] = {}
+        self.stages_widget = BuildStagesWidget(number=number)
+
+    async def on_mount(self) -> None:
+        """Actions that are executed when the widget is mounted."""
+
+        await self.app.set_focus(self)
+        self.app.nav.title = f"{self.job_name} #{self.number}"
+
+        self.layout.add_column("col")
+        self.layout.add_row("body", min_size=20)
+        self.layout.add_areas(body="col,body")
+        self.layout.place(body=self.stages_widget)
+
+        await self.update()
+        if self.running:
+            self.poller = self.scheduler.add(
+                "build", self.update, interval=10, fast_interval=3, owner=self
+            )
+            self.poller.fast = True
+            self.poller.cost = self.cost
+
+    @property
+    def running(self) -> bool:
+        """Whether the pipeline run can still change.
+
+        Returns:
+            bool: True while the build is running or some of its stages haven't been loaded.
+        """
+
+        return self.run is not None and (
+            self.client.pipeline_running(self.run) or len(self.pending) > 0
+        )
+
+    @property
+    def pending(self) -> list[str]:
+        """The stages that are fetched on the next update, because they are new, their status has changed since they were fetched, or they are still running.
+
+        Returns:
+            list[str]: The ids of the stages.
+        """
+
+        running = self.client.pipeline_running(self.run or {})
+        pending = []
+        for summary in (self.run or {}).get("stages", []):
+            stage = self.stages.get(summary["id"])
+            if (
+                stage is None
+                or stage.get("status") != summary.get("status")
+                or (running and self.client.pipeline_running(stage, self.run))
+            ):
+                pending.append(summary["id"])
+
+        return pending
+
+    @property
+    def cost(self) -> int:
+        """The number of requests that the next poll makes, capped at the budget of the scheduler so that the poll can still run.
+
+        Returns:
+            int: One request for the run and one for each pending stage.
+        """
+
+        # Only the stages that are still running are fetched on the next poll, each with its own request
+        return min(1 + len(self.pending), self.scheduler.budget)
+
+    async def update(self) -> bool:
+        """Updates the pipeline run and the stages that can still change. The poller is cancelled once nothing can.
+
+        Returns:
+            bool: True if the run or any of its stages have changed.
+        """
+
+        run = await self.client.get_pipeline_run(path=self.path, number=self.number)
+        changed = run != self.run
+        self.run = run
+
+        pending = self.pending
+        results = await asyncio.gather(
+            *(
+                self.client.get_pipeline_stage(
+                    path=self.path, number=self.number, stage_id=stage_id, run=run
+                )
+                for stage_id in pending
+            ),
+            return_exceptions=True,
+        )
+
+        for stage_id, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                # Only errors are logged and retried on the next poll, cancellation is passed on
+                if not isinstance(result, Exception):
+                    raise result
+                self.log(f"Failed to load stage {stage_id}: {result!r}")
+            elif result != self.stages.get(stage_id):
+                self.stages[stage_id] = result
+                changed = True
+
+        await self.stages_widget.update(run=self.run, stages=self.stages)
+
+        if self.poller is not None:
+            if self.running:
+                self.poller.cost = self.cost
+            else:
+                self.log(f"Build {self.number} has completed, stopped polling")
+                self.scheduler.cancel(self)
+                self.poller = None
+
+        return changed
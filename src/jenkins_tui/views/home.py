@@ -29,6 +29,8 @@ class HomeView(BaseView):
     async def on_show(self) -> None:
         """Actions that are executed when the widget is shown."""
 
+        # Server metadata is cached on the shared client once the connection has been tested
+        await self.client.test_connection()
         server_version = self.client.version
         client_version = __version__
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from urllib.parse import urlparse
 
@@ -9,8 +10,12 @@ from textual import events
 from textual.binding import NoBinding
 
 from ..containers import Container
+from ..executor import BackgroundExecutor, Superseded
 from ..jenkins import Jenkins
+from ..scheduler import Poller, Scheduler
+from ..search import FullTextIndex
 from ..widgets import (
+    BuildClick,
     ButtonWidget,
     FlashMessageType,
     JobDetailsWidget,
@@ -18,6 +23,7 @@ from ..widgets import (
     TextWidget,
 )
 from .base import BaseView
+from .build import BuildView
 from .build_with_parameters import BuildWithParametersView
 
 
@@ -26,21 +32,40 @@ class JobView(BaseView):
 
     details: JobDetailsWidget | None = None
 
+    # Polls that only probe the status of the job before it is fetched again anyway, to pick up changes to its description, health and parameters
+    max_probes = 5
+
     @inject
-    def __init__(self, url: str, client: Jenkins = Provide[Container.client]) -> None:
+    def __init__(
+        self,
+        url: str,
+        client: Jenkins = Provide[Container.client],
+        full_text_index: FullTextIndex = Provide[Container.full_text_index],
+        executor: BackgroundExecutor = Provide[Container.executor],
+        scheduler: Scheduler = Provide[Container.scheduler],
+    ) -> None:
         """A view that contains widgets that display job information.
 
         Args:
             url (str): The url of the current job.
 
         # noqa: DAR101 client
+        # noqa: DAR101 full_text_index
+        # noqa: DAR101 executor
+        # noqa: DAR101 scheduler
         """
         super().__init__()
         self.url = url
         self.path = urlparse(url).path
         self.client = client
+        self.full_text_index = full_text_index
+        self.executor = executor
+        self.scheduler = scheduler
+        self.poller: Poller | None = None
+        self.job_name = "/".join(url.strip("/").split("/job/")[1:])
         self.buttons: dict[str, ButtonWidget] = {}
         self.job: dict[str, Any] = {}
+        self.probes = 0
         self.job_has_parameters: bool = False
 
         self.bindings.bind("h", "history", show=False)
@@ -51,10 +76,18 @@ class JobView(BaseView):
 
         await self.app.set_focus(self)
 
+        # A cached job is shown straight away, even if it has expired, and replaced once it has been refreshed
         self.log("Updating job")
-        await self.update()
+        cache = self.client.cache
+        stale_hits = cache.stale_hits if cache is not None else 0
+        await self.update(allow_stale=True)
+        if cache is not None and cache.stale_hits > stale_hits:
+            # Joins the refresh that the expired response started rather than probing first
+            asyncio.ensure_future(self.update(probe=False))
         self.log("Finished updating job")
-        self.set_interval(20, self.update)
+        self.poller = self.scheduler.add(
+            "job", self.update, interval=20, fast_interval=5, owner=self
+        )
 
         name = self.job.get("displayName")
         description = self.job.get("description")
@@ -81,7 +114,7 @@ class JobView(BaseView):
             body="col,body",
         )
 
-        self.details = JobDetailsWidget(job=self.job)
+        self.details = JobDetailsWidget(job=self.job, path=self.path)
         self.layout.place(text=TextWidget(text=description_renderable))
         self.layout.place(body=self.details)
 
@@ -91,10 +124,38 @@ class JobView(BaseView):
 
             self.layout.place(body=self.build_with_params)
 
-    async def update(self) -> None:
-        """Updates the current job"""
+    async def update(self, allow_stale: bool = False, probe: bool = True) -> bool:
+        """Updates the current job
+
+        Args:
+            allow_stale (bool): Use an expired job from the response cache while it is refreshed. Defaults to False.
+            probe (bool): Probe the status of the job before fetching it, see max_probes. Defaults to True.
 
-        self.job = await self.client.get_job(path=self.path)
+        Returns:
+            bool: True if the job has changed.
+        """
+
+        # While none of its builds are running a job only changes when a build starts, so a cheap probe of its status decides whether it is fetched
+        running = any(
+            build.get("result") is None for build in self.job.get("builds", [])
+        )
+        if (
+            self.job
+            and probe
+            and not running
+            and not allow_stale
+            and self.probes < self.max_probes
+        ):
+            self.probes += 1
+            if not await self.client.job_changed(
+                path=self.path, status=self.client.job_status(self.job)
+            ):
+                return False
+
+        self.probes = 0
+        job = await self.client.get_job(path=self.path, allow_stale=allow_stale)
+        changed = job != self.job
+        self.job = job
         if len(self.job["property"]) > 0 and self.job["property"][0].get(
             "parameterDefinitions"
         ):
@@ -104,7 +165,34 @@ class JobView(BaseView):
         if self.details:
             await self.details.update(job=self.job)
 
-        self.refresh(layout=True)
+        # The job is polled more often while one of its builds is running
+        if self.poller is not None:
+            self.poller.fast = any(
+                build.get("result") is None for build in self.job.get("builds", [])
+            )
+
+        if changed:
+            self.refresh(layout=True)
+            asyncio.ensure_future(self.index_job(self.job))
+
+        return changed
+
+    async def index_job(self, job: dict[str, Any]) -> None:
+        """Add the description, builds and parameters of the job to the full text index in the background.
+
+        Args:
+            job (dict[str, Any]): A dict of job info.
+        """
+
+        try:
+            await self.executor.run(
+                self.full_text_index.add_job,
+                self.job_name,
+                job,
+                key=f"full-text:{self.url}",
+            )
+        except Superseded:
+            pass
 
     async def press(self, key: str) -> bool:
         """Handle a key press.
@@ -133,6 +221,18 @@ class JobView(BaseView):
 
         await self.press(event.key)
 
+    async def handle_build_click(self, message: BuildClick) -> None:
+        """Handle a BuildClick message by opening the build in its own view.
+
+        Args:
+            message (BuildClick): The message to handle.
+        """
+
+        self.log("Handling BuildClick message")
+        message.stop()
+        view = BuildView(url=self.url, number=message.build["number"])
+        await self.app.container.update(view=view)
+
     async def action_history(self) -> None:
         """Actions that are executed when the history button is pressed."""
 
@@ -1,32 +1,41 @@
 from __future__ import annotations
 
+from dependency_injector.wiring import Provide, inject
 from textual.layouts.grid import GridLayout
 from textual.reactive import Reactive
 from textual.view import View
 from textual.widgets import ScrollView
 
+from ..containers import Container
+from ..scheduler import Scheduler
+
 
 class CustomScrollView(ScrollView):
     """A subclass of textual.widgets.ScrollView"""
 
     origin_view: Reactive[View]
 
+    @inject
     def __init__(
         self,
         intial_view: View = None,
         name: str | None = None,
+        scheduler: Scheduler = Provide[Container.scheduler],
     ) -> None:
         """Initialises a new custom ScrollView instance
 
         Args:
             intial_view (View): The view that will be assigned to the content area.
             name (str | None): The name of the view.
+
+        # noqa: DAR101 scheduler
         """
         _name = self.__class__.__name__ if name is None else name
         super().__init__(name=_name)
 
         self.window = intial_view
         self.origin_view = self.window
+        self.scheduler = scheduler
 
     async def update(self, view: View) -> None:
         """Update the content area of the grid view that backs ScrollView.
@@ -39,6 +48,14 @@ class CustomScrollView(ScrollView):
         widgets = self.layout.widgets
 
         del widgets[self.window]
+
+        # The origin view is shown again later so its pollers are only paused, other views are discarded
+        if self.window is self.origin_view:
+            self.scheduler.pause(self.window)
+        else:
+            self.scheduler.cancel(self.window)
+        self.scheduler.resume(view)
+
         self.window = view
         self.layout.place(content=view)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from rich.style import Style
+from textual.reactive import watch
 from textual.widgets import ScrollView
 
 from ..tree import Tree
@@ -32,6 +33,11 @@ class SideBarView(BaseView):
         )
         self.scroll_view.vscroll = ScrollBarWidget()
 
+        async def scroll_tree(y: float) -> None:
+            self.tree.scroll_window(round(y))
+
+        watch(self.scroll_view, "y", scroll_tree)
+
         self.layout.place(
             head=FigletTextWidget(
                 text=self.app.title, name="header", style=Style(color="green")
@@ -1,12 +1,14 @@
+from .build_stages import BuildStagesWidget
 from .button import ButtonWidget
 from .executor_status import ExecutorStatusWidget
 from .figlet_text_widget import FigletTextWidget
 from .flash import FlashMessageType, FlashWidget, ShowFlashNotification
 from .help import HelpWidget
-from .job_details import JobDetailsWidget
+from .job_details import BuildClick, JobDetailsWidget
 from .nav import NavWidget
 from .scroll_bar import ScrollBarWidget
 from .search import SearchWidget
+from .search_results import SearchResultsWidget
 from .text import TextWidget
 from .text_input_field import TextInputFieldWidget
 
@@ -15,6 +17,8 @@ __all__ = (
     "ScrollBarWidget",
     "ButtonWidget",
     "JobDetailsWidget",
+    "BuildClick",
+    "BuildStagesWidget",
     "TextInputFieldWidget",
     "FigletTextWidget",
     "FlashWidget",
@@ -24,4 +28,5 @@ __all__ = (
     "NavWidget",
     "HelpWidget",
     "SearchWidget",
+    "SearchResultsWidget",
 )
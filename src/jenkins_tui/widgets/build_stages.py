@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+from rich.console import RenderableType
+from rich.panel import Panel
+from rich.style import Style
+from textual.widget import Widget
+
+from .. import styles
+from ..renderables import BuildStagesRenderable
+from ..renderables.build_stages import format_duration
+
+
+class BuildStagesWidget(Widget):
+    """A build stages widget. Used to display the stages of a pipeline build."""
+
+    def __init__(self, number: int) -> None:
+        """A build stages widget. Used to display the stages of a pipeline build.
+
+        Args:
+            number (int): The build number.
+        """
+
+        name = self.__class__.__name__
+        super().__init__(name=name)
+        self.number = number
+        self.run: dict[str, Any] | None = None
+        self.stages: dict[str, dict[str, Any]] = {}
+        self.loaded = False
+
+    async def update(
+        self, run: dict[str, Any] | None, stages: dict[str, dict[str, Any]]
+    ) -> None:
+        """Updates the widget with the pipeline run and its stages.
+
+        Args:
+            run (dict[str, Any] | None): The pipeline run, see Jenkins.get_pipeline_run. None if the build isn't a pipeline.
+            stages (dict[str, dict[str, Any]]): The stages that have been loaded by id, see Jenkins.get_pipeline_stage.
+        """
+
+        self.run = run
+        self.stages = stages
+        self.loaded = True
+        self.refresh()
+
+    def render(self) -> RenderableType:
+        """Render the widget.
+
+        Returns:
+            RenderableType: Object to be rendered
+        """
+
+        title = f"#{self.number}"
+        if self.run is not None:
+            status = (self.run.get("status") or "").lower().replace("_", " ")
+            title += f" {status} {format_duration(self.run.get('durationMillis'))}"
+
+        return Panel(
+            renderable=BuildStagesRenderable(
+                run=self.run,
+                stages=self.stages,
+                height=self.size.height - 2,
+                loaded=self.loaded,
+            ),
+            title=f"[{styles.GREY}]( {title} )[/]",
+            border_style=Style(color=styles.PURPLE),
+            expand=True,
+            box=styles.BOX,
+        )
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import statistics
+import time
+from collections import deque
 from typing import Any
 
 from dependency_injector.wiring import Provide, inject
@@ -14,6 +18,7 @@ from .. import styles
 from ..containers import Container
 from ..jenkins import Jenkins
 from ..renderables import ExecutorStatusTableRenderable
+from ..scheduler import Poller, Scheduler
 
 
 class ExecutorStatusWidget(Widget):
@@ -23,19 +28,29 @@ class ExecutorStatusWidget(Widget):
     row: int = 0
 
     @inject
-    def __init__(self, client: Jenkins = Provide[Container.client]) -> None:
+    def __init__(
+        self,
+        client: Jenkins = Provide[Container.client],
+        scheduler: Scheduler = Provide[Container.scheduler],
+    ) -> None:
         """An executor status widget. Used to display running builds on the server.
 
         # noqa: DAR101 client
+        # noqa: DAR101 scheduler
         """
 
         name = self.__class__.__name__
         super().__init__(name=name)
         self.client = client
+        self.scheduler = scheduler
+        self.poller: Poller | None = None
         self.running_builds: list[dict[str, Any]] = []
         self.queued_builds: list[dict[str, Any]] = []
         self.running_builds_count: int = 0
         self.queued_builds_count: int = 0
+        self.running_builds_failed = False
+        self.queued_builds_failed = False
+        self.latency: deque[float] = deque(maxlen=100)
         self.renderable: ExecutorStatusTableRenderable | None = None
 
     def on_key(self, event: events.Key) -> None:
@@ -74,22 +89,93 @@ class ExecutorStatusWidget(Widget):
             row=self.row,
         )
 
-    async def _update(self) -> None:
-        """Update the current renderable object."""
+    async def _update(self) -> bool:
+        """Update the current renderable object.
 
-        self.running_builds = await self.client.get_running_builds()
-        self.queued_builds = await self.client.get_queued_jobs()
+        Returns:
+            bool: True if the running or queued builds have changed.
+        """
+
+        # The executors and the queue are fetched at the same time. When one of them fails the other is still shown, along with the last known value of the one that failed
+        start = time.perf_counter()
+        running_result: list[dict[str, Any]] | BaseException
+        queued_result: list[dict[str, Any]] | BaseException
+        running_result, queued_result = await asyncio.gather(
+            self.client.get_running_builds(),
+            self.client.get_queued_jobs(),
+            return_exceptions=True,
+        )
+        self.latency.append(time.perf_counter() - start)
+        self.log(
+            f"Updated executor status in {self.latency[-1] * 1000:.1f}ms, p50={statistics.median(self.latency) * 1000:.1f}ms over the last {len(self.latency)} updates"
+        )
+
+        for result in (running_result, queued_result):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+        # The poller only backs off when both fail
+        if isinstance(running_result, BaseException) and isinstance(
+            queued_result, BaseException
+        ):
+            raise running_result
+
+        running_builds = self.running_builds
+        self.running_builds_failed = isinstance(running_result, BaseException)
+        if isinstance(running_result, BaseException):
+            self.log(f"Failed to get running builds: {running_result!r}")
+        else:
+            running_builds = running_result
+
+        queued_builds = self.queued_builds
+        self.queued_builds_failed = isinstance(queued_result, BaseException)
+        if isinstance(queued_result, BaseException):
+            self.log(f"Failed to get queued builds: {queued_result!r}")
+        else:
+            queued_builds = queued_result
+
+        changed = (
+            running_builds != self.running_builds or queued_builds != self.queued_builds
+        )
+
+        self.running_builds = running_builds
+        self.queued_builds = queued_builds
         self.running_builds_count = len(self.running_builds)
         self.queued_builds_count = len(self.queued_builds)
 
+        # Executors are polled more often while builds are running
+        if self.poller is not None:
+            self.poller.fast = bool(self.running_builds or self.queued_builds)
+
         self.refresh(layout=True)
+        return changed
 
     async def on_mount(self) -> None:
         """Actions that are executed when the widget is mounted."""
 
         await self._update()
         self.render_executor_status_table()
-        self.set_interval(10, self._update)
+        self.poller = self.scheduler.add(
+            "executor status",
+            self._update,
+            interval=10,
+            fast_interval=3,
+            owner=self,
+            cost=2,
+        )
+
+    @staticmethod
+    def failed_marker(failed: bool) -> str:
+        """Mark a count in the title that couldn't be updated.
+
+        Args:
+            failed (bool): Whether the last update of the count failed.
+
+        Returns:
+            str: A marker, or an empty string if the update didn't fail.
+        """
+
+        return f"[{styles.RED}]?[/]" if failed else ""
 
     def render(self) -> RenderableType:
         """Render the widget.
@@ -106,7 +192,7 @@ class ExecutorStatusWidget(Widget):
         assert isinstance(self.renderable, ExecutorStatusTableRenderable)
         return Panel(
             renderable=self.renderable,
-            title=f"[{styles.GREY}](queued: [{styles.ORANGE}]{self.queued_builds_count}[/] / running [green]{self.running_builds_count}[/])[/]",
+            title=f"[{styles.GREY}](queued: [{styles.ORANGE}]{self.queued_builds_count}[/]{self.failed_marker(self.queued_builds_failed)} / running [green]{self.running_builds_count}[/]{self.failed_marker(self.running_builds_failed)})[/]",
             border_style=Style(color=styles.PURPLE),
             padding=(1),
             expand=True,
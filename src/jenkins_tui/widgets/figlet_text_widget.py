@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+
+from dependency_injector.wiring import Provide, inject
 from rich.align import Align
 from rich.console import RenderableType
 from rich.style import Style
 from textual.reactive import Reactive
 from textual.widget import Widget
 
+from ..containers import Container
+from ..executor import BackgroundExecutor, Superseded
 from ..renderables import FigletTextRenderable
+from ..renderables.figlet_text import render_figlet
 
 
 class FigletTextWidget(Widget):
@@ -15,12 +21,14 @@ class FigletTextWidget(Widget):
     has_focus = Reactive(False)
     mouse_over: bool = Reactive(False)
 
+    @inject
     def __init__(
         self,
         text: str,
         name: str | None = None,
         style: Style | None = None,
         layout_size: int = 8,
+        executor: BackgroundExecutor = Provide[Container.executor],
     ) -> None:
         """A widget that will generate and display figlet text.
 
@@ -29,12 +37,19 @@ class FigletTextWidget(Widget):
             name (str | None): The name of the widget. Defaults to the name of the class.
             style (Style | None): The style of the widget.
             layout_size (int): The size of the widget. Defaults to 10.
+
+        # noqa: DAR101 executor
         """
 
         super().__init__(name=name or self.__class__.__name__)
         self.text = text
         self.layout_size = layout_size
         self.style = style
+        self.executor = executor
+
+        # Figlet text is rendered by the background executor for each size of the widget, the plain text is shown until it is ready
+        self.figlets: dict[tuple[int, int], str] = {}
+        self.pending: tuple[int, int] | None = None
 
     def on_enter(self) -> None:
         self.mouse_over = True
@@ -48,6 +63,26 @@ class FigletTextWidget(Widget):
     def on_blur(self) -> None:
         self.has_focus = False
 
+    async def render_figlet(self, width: int, height: int) -> None:
+        """Render the figlet text for a size of the widget in the background, then refresh the widget. A resize before it is ready supersedes it.
+
+        Args:
+            width (int): The width of the widget.
+            height (int): The height of the widget.
+        """
+
+        self.pending = (width, height)
+        try:
+            figlet = await self.executor.run(
+                render_figlet, self.text, width, height, key=f"figlet-{id(self)}"
+            )
+        except Superseded:
+            return
+
+        self.figlets[(width, height)] = figlet
+        self.pending = None
+        self.refresh()
+
     def render(self) -> RenderableType:
         """Render the widget.
 
@@ -55,8 +90,13 @@ class FigletTextWidget(Widget):
             RenderableType: Object to be rendered
         """
 
+        width, height = self.size
+        figlet = self.figlets.get((width, height))
+        if figlet is None and self.pending != (width, height):
+            asyncio.ensure_future(self.render_figlet(width, height))
+
         return Align.left(
-            renderable=FigletTextRenderable(text=self.text),
+            renderable=FigletTextRenderable(text=self.text, figlet=figlet or self.text),
             vertical="middle",
             style=self.style or "",
             pad=False,
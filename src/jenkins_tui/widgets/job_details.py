@@ -1,19 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from dependency_injector.wiring import Provide, inject
-from rich.console import RenderableType
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 from rich.style import Style
 from textual import events
 from textual.keys import Keys
+from textual.message import Message, MessageTarget
 from textual.widget import Widget
 
 from .. import styles
 from ..containers import Container
 from ..jenkins import Jenkins
-from ..renderables import BuildHistoryTableRenderable
+from ..renderables import BuildChangesRenderable, BuildHistoryTableRenderable
+from ..util import Debouncer
+
+
+class BuildClick(Message):
+    """A message that is sent when a build is opened from the build history."""
+
+    def __init__(self, sender: MessageTarget, build: dict[str, Any]) -> None:
+        """A message that is sent when a build is opened from the build history.
+
+        Args:
+            sender (MessageTarget): The sender of the message.
+            build (dict[str, Any]): The build that was opened.
+        """
+
+        self.build = build
+        super().__init__(sender)
 
 
 class JobDetailsWidget(Widget):
@@ -22,14 +40,27 @@ class JobDetailsWidget(Widget):
     page: int = 1
     row: int = 0
 
+    # The minimum number of older builds that are requested at a time
+    fetch_size: int = 25
+
+    # Lines below the history that show the changes of the selected build
+    changes_height: int = 6
+
     @inject
     def __init__(
-        self, job: dict[str, Any], client: Jenkins = Provide[Container.client]
+        self,
+        job: dict[str, Any],
+        path: str | None = None,
+        client: Jenkins = Provide[Container.client],
     ) -> None:
         """A job details widget. Used to display builds within a job.
 
+        The most recent builds come with the job and are kept up to date by the job view. Older builds are loaded a page at a time as the history is paged through, always one page ahead of the current page, and aren't refreshed because they have completed.
+        The changes of a build are only loaded when its row is selected, once the selection has settled.
+
         Args:
             job (dict[str, Any]): A dict of job info.
+            path (str | None): The path to the job, used to load older builds. Defaults to None, which only shows the builds of the job.
 
         # noqa: DAR101 client
         """
@@ -37,14 +68,22 @@ class JobDetailsWidget(Widget):
         name = self.__class__.__name__
         super().__init__(name=name)
         self.job = job
+        self.path = path
         self.client = client
         self.builds: list[dict[str, Any]] = []
+        self.older_builds: list[dict[str, Any]] = []
+        self.exhausted = path is None
+        self.loading: asyncio.Future[None] | None = None
+        self.selected: dict[str, Any] | None = None
+        self.changes: dict[int, dict[str, Any]] = {}
+        self.changes_debouncer = Debouncer(0.2)
         self.renderable: BuildHistoryTableRenderable | None = None
 
     async def on_mount(self) -> None:
         """Actions that are executed when the widget is mounted."""
 
         await self.app.set_focus(self)
+        self.update_history()
 
     async def update(self, job: dict[str, Any]) -> None:
         """Updates the widget with new job info.
@@ -54,8 +93,19 @@ class JobDetailsWidget(Widget):
         """
 
         self.job = job
+        self.update_history()
         self.refresh(layout=True)
 
+    async def on_resize(self, event: events.Resize) -> None:
+        """Fit the page of the build history to the new size of the widget.
+
+        Args:
+            event (events.Resize): A resize event.
+        """
+
+        self.update_history()
+        self.refresh()
+
     def on_key(self, event: events.Key) -> None:
         """Handle a key press.
 
@@ -79,21 +129,143 @@ class JobDetailsWidget(Widget):
             self.renderable.previous_row()
         elif key == Keys.Down:
             self.renderable.next_row()
+        elif key == Keys.Enter and self.selected is not None:
+            self.emit_no_wait(BuildClick(self, build=self.selected))
 
+        self.prefetch()
+        self.select_build()
         self.refresh()
 
-    def render_history_table(self) -> None:
-        """Renders the build history table."""
+    @property
+    def history(self) -> list[dict[str, Any]]:
+        """The builds of the job followed by the older builds that have been loaded.
+
+        Returns:
+            list[dict[str, Any]]: A list of builds, newest first.
+        """
+
+        builds = self.job.get("builds", [])
+        if not builds:
+            return self.older_builds
+
+        # Builds that have moved off the first page since they were loaded are kept, builds that are still on it come from the job
+        oldest = builds[-1]["number"]
+        return builds + [
+            build for build in self.older_builds if build["number"] < oldest
+        ]
+
+    def wants_more(self) -> bool:
+        """Whether the page after the current page has builds that haven't been loaded yet.
+
+        Returns:
+            bool: True if more builds should be loaded.
+        """
+
+        if self.exhausted or self.renderable is None:
+            return False
+
+        page_size = self.renderable.page_size
+        return (
+            page_size > 0 and len(self.builds) < (self.renderable.page + 1) * page_size
+        )
+
+    def prefetch(self) -> None:
+        """Load older builds in the background if the next page needs them."""
+
+        if self.wants_more() and (self.loading is None or self.loading.done()):
+            self.loading = asyncio.ensure_future(self.load_more())
+
+    async def load_more(self) -> None:
+        """Load older builds until the page after the current page is full or the history runs out."""
+
+        while self.wants_more():
+            assert self.renderable is not None
+            history = self.history
+            count = max(self.renderable.page_size, self.fetch_size)
 
-        self.builds = self.job.get("builds", [])
-        self.renderable = BuildHistoryTableRenderable(
-            builds=self.builds,
+            try:
+                builds = await self.client.get_builds(
+                    path=self.path, start=len(history), end=len(history) + count
+                )
+            except Exception as e:
+                self.log(f"Failed to load older builds: {e!r}")
+                return
+
+            loaded = {build["number"] for build in history}
+            new_builds = [build for build in builds if build["number"] not in loaded]
+            self.older_builds.extend(new_builds)
+            self.exhausted = len(builds) < count
+            self.update_history()
+            if not new_builds:
+                # Every build was already loaded because new builds moved the history along, the next update tries again
+                return
+
+            self.refresh()
+
+    def select_build(self) -> None:
+        """Load the changes of the build in the selected row, if the selection has changed."""
+
+        selected = None
+        if self.renderable is not None and self.renderable.row > 0:
+            index = self.renderable.start_index() + self.renderable.row - 1
+            if index < len(self.builds):
+                selected = self.builds[index]
+
+        number = selected["number"] if selected else None
+        previous = self.selected["number"] if self.selected else None
+        self.selected = selected
+        if selected is None or number == previous or self.path is None:
+            return
+
+        # The changes of a running build can still grow, so they are loaded again each time it is selected
+        if number in self.changes and selected.get("result") is not None:
+            self.changes_debouncer.cancel()
+        else:
+            self.changes_debouncer.call(self.load_changes, number)
+
+    async def load_changes(self, number: int) -> None:
+        """Load the changes of a build.
+
+        Args:
+            number (int): The build number.
+        """
+
+        try:
+            changes = await self.client.get_build_changes(path=self.path, number=number)
+        except Exception as e:
+            self.log(f"Failed to load the changes of build {number}: {e!r}")
+            return
+
+        self.changes[number] = changes
+        self.refresh()
+
+    def history_table(self) -> BuildHistoryTableRenderable:
+        """Build the build history table from the builds that have been loaded and the size of the widget, keeping the current page and row.
+
+        Returns:
+            BuildHistoryTableRenderable: The build history table.
+        """
+
+        if self.renderable is not None:
+            self.page = self.renderable.page
+            self.row = self.renderable.row
+
+        return BuildHistoryTableRenderable(
+            builds=self.history,
             title="history",
-            page_size=self.size.height - 5,
+            page_size=self.size.height - 5 - self.changes_height,
             page=self.page,
             row=self.row,
         )
 
+    def update_history(self) -> None:
+        """Rebuild the build history table, then load older builds and the changes of the selected build if they are needed."""
+
+        self.renderable = self.history_table()
+        self.builds = self.renderable.builds
+        self.prefetch()
+        self.select_build()
+
     def render(self) -> RenderableType:
         """Render the widget.
 
@@ -101,15 +273,17 @@ class JobDetailsWidget(Widget):
             RenderableType: Object to be rendered
         """
 
-        if self.renderable is not None:
-            self.page = self.renderable.page
-            self.row = self.renderable.row
-
-        self.render_history_table()
-        assert isinstance(self.renderable, BuildHistoryTableRenderable)
+        # The table is kept up to date by update_history, so that rendering doesn't start any loading
+        history = self.renderable or self.history_table()
+        number = self.selected["number"] if self.selected else None
+        changes = BuildChangesRenderable(
+            build=self.selected,
+            changes=self.changes.get(number) if number is not None else None,
+            height=self.changes_height,
+        )
         return Panel(
-            renderable=self.renderable,
-            title=f"[{styles.GREY}]( {self.renderable.title} )[/]",
+            renderable=Group(history, changes),
+            title=f"[{styles.GREY}]( {history.title} )[/]",
             border_style=Style(color=styles.PURPLE),
             expand=True,
             box=styles.BOX,
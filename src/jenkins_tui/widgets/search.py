@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import time
 from itertools import cycle
-from typing import Any
 
-from fast_autocomplete import AutoComplete
+from dependency_injector.wiring import Provide, inject
 from rich import box
 from rich.console import RenderableType
 from rich.padding import Padding
@@ -12,12 +12,14 @@ from rich.style import Style
 from rich.text import Text
 from textual import events
 from textual.keys import Keys
-from textual.reactive import Reactive, watch
-from textual.widgets import NodeID, TreeNode
+from textual.reactive import Reactive
+from textual.widgets import NodeID
 from textual_inputs.events import InputOnChange
 
 from .. import styles
-from ..util import replace_last
+from ..containers import Container
+from ..search import KINDS, FullTextIndex, QueryCache, SearchIndex
+from ..util import Debouncer, replace_last
 from ..widgets import FlashMessageType, ShowFlashNotification
 from .text_input_field import TextInputFieldWidget
 
@@ -25,14 +27,26 @@ from .text_input_field import TextInputFieldWidget
 class SearchWidget(TextInputFieldWidget):
     """A custom search widget."""
 
-    autocompleter: AutoComplete = None
     value: Reactive[str] = Reactive("")
     predictions: cycle[str] = cycle([])
     current_prediction: Reactive[str] = Reactive("")
     last_word: Reactive[str] = Reactive("")
 
-    def __init__(self) -> None:
-        """A custom search widget."""
+    @inject
+    def __init__(
+        self,
+        search_index: SearchIndex = Provide[Container.search_index],
+        full_text_index: FullTextIndex = Provide[Container.full_text_index],
+        debounce: float | None = Provide[Container.config.search_debounce],
+    ) -> None:
+        """A custom search widget.
+
+        Queries that start with one of the prefixes in KINDS, such as b: for builds, search the full text index instead of job names.
+
+        # noqa: DAR101 search_index
+        # noqa: DAR101 full_text_index
+        # noqa: DAR101 debounce
+        """
 
         name = "search"
         title = Text("🔍 search")
@@ -42,23 +56,82 @@ class SearchWidget(TextInputFieldWidget):
             name=name, title=title, border_style=border_style, required=required
         )
 
+        self.search_index = search_index
+        self.full_text_index = full_text_index
+        self.queries = QueryCache(search_index)
+        self.debouncer = Debouncer(0.05 if debounce is None else debounce)
         self.visible = False
 
-    async def on_mount(self) -> None:
-        """Actions that are executed when the widget is mounted."""
+    async def handle_input_on_change(self) -> None:
+        """Handle an InputOnChange message."""
 
-        async def map(nodes: dict[NodeID, TreeNode]):
-            searchable_words, synonyms = self.map_nodes(nodes=nodes)
-            self.autocompleter = AutoComplete(words=searchable_words, synonyms=synonyms)
-            self.log("Searchable nodes have been mapped")
+        self.refresh()
 
-        watch(self.app, "searchable_nodes", map)
+    async def watch_value(self, value: str) -> None:
+        """Watch value and search once typing pauses. Queries that have already been searched, such as after a backspace, are answered straight away.
 
-    async def handle_input_on_change(self) -> None:
-        """Handle an InputOnChange message."""
+        Args:
+            value (str): The search query.
+        """
+
+        if value in self.queries:
+            self.debouncer.cancel()
+            await self.update_search(value)
+        else:
+            self.debouncer.call(self.update_search, value)
+
+    async def update_search(self, value: str) -> None:
+        """Update the search results and the predictions for the last word of a query.
+
+        Args:
+            value (str): The search query.
+        """
+
+        start = time.perf_counter()
+        if value[1:2] == ":" and value[:1] in KINDS:
+            results, details = self.search_full_text(value[2:], kind=value[0])
+            predictions: list[str] = []
+        else:
+            results, predictions = self.queries.search(value)
+            details = None
+
+        self.log(
+            f"Found {len(results)} results for {value} in {(time.perf_counter() - start) * 1000:.3f}ms"
+        )
+
+        self.app.search_results.update_results(results, details)
+
+        if predictions:
+            self.predictions = cycle(predictions)
+            self.current_prediction = predictions[0]
 
         self.refresh()
 
+    def search_full_text(
+        self, query: str, kind: str
+    ) -> tuple[list[tuple[NodeID, str]], list[str]]:
+        """Search the descriptions, builds or parameters of the jobs that have been looked at.
+
+        Args:
+            query (str): The search query without its prefix.
+            kind (str): The kind of document to search, see KINDS.
+
+        Returns:
+            tuple[list[tuple[NodeID, str]], list[str]]: The node id and full name of the job of each matching document, and the text that matched.
+        """
+
+        results = []
+        details = []
+        for document in self.full_text_index.search(query, kind=kind):
+            node_id = self.search_index.get(document.job)
+            if node_id is None:
+                continue
+
+            results.append((node_id, document.job))
+            details.append(f"{document.title} {document.text}".strip())
+
+        return results, details
+
     async def on_key(self, event: events.Key) -> None:
         """Handle a key press.
 
@@ -67,15 +140,19 @@ class SearchWidget(TextInputFieldWidget):
         """
 
         await self.toggle_field_status(valid=True)
-        search_string = self.value.split(" ")[-1]
 
         if event.key == Keys.Enter:
             event.stop()
 
+            # A search that is waiting for typing to pause is made now so that the results match the query
+            await self.debouncer.flush()
+
             self.log(f"Searching for {self.value}")
-            word = self.autocompleter.words.get(self.value.strip().lower(), None)
+            node_id = self.app.search_results.selected_node
+            if node_id is None:
+                node_id = self.search_index.get(self.value.strip().lower())
 
-            if not word:
+            if node_id is None:
                 self.log(f"No word match found for {self.value}")
                 await self.toggle_field_status(valid=False)
                 await self.post_message_from_child(
@@ -87,9 +164,13 @@ class SearchWidget(TextInputFieldWidget):
                 )
                 return
 
-            node_id = word["id"]
             self.app.search_node = node_id
 
+        elif event.key == Keys.Up or event.key == Keys.Down:
+            event.stop()
+            self.app.search_results.select(-1 if event.key == Keys.Up else 1)
+            return
+
         elif event.key == "ctrl+i":
             self.current_prediction = next(self.predictions)
 
@@ -98,28 +179,13 @@ class SearchWidget(TextInputFieldWidget):
 
             if self._cursor_position != len(self.value):
                 self._cursor_position = self._cursor_position + 1
-            else:
+            elif self.current_prediction.lower().startswith(self.last_word.lower()):
                 self.value = replace_last(
                     self.value, self.last_word, self.current_prediction
                 )
                 self._cursor_position = len(self.value)
                 self.last_word = self.current_prediction
 
-        else:
-
-            if not search_string:
-                return
-
-            search_result = self.autocompleter.get_tokens_flat_list(
-                word=search_string,
-            )
-
-            if not search_result:
-                return
-
-            self.predictions = cycle(search_result)
-            self.current_prediction = search_result[0]
-
         await self.post_message(InputOnChange(self))
 
     def _render_text_with_cursor(self) -> list[str | tuple[str, Style]]:
@@ -145,8 +211,10 @@ class SearchWidget(TextInputFieldWidget):
                 else:
                     self.last_word = self.value
 
+                # The ghost text is the rest of a prediction that starts with the last word, predictions for an earlier query are left out
                 if (
-                    self.current_prediction != self.last_word
+                    self.current_prediction.lower().startswith(self.last_word.lower())
+                    and self.current_prediction != self.last_word
                     and not self.value.endswith(" ")
                 ):
                     prediction = Text(
@@ -168,34 +236,6 @@ class SearchWidget(TextInputFieldWidget):
 
         return segments
 
-    def map_nodes(
-        self, nodes: dict[NodeID, TreeNode]
-    ) -> tuple[dict[str, Any], dict[str, list[str]]]:
-        """Build a map of nodes and synonyms.
-
-        Args:
-            nodes (dict[NodeID, TreeNode]): A dictionary of nodes.
-
-        Returns:
-            tuple[dict[str, Any], dict[str, list[str]]]: A tuple containing searchable_words and synonyms.
-        """
-
-        searchable_words: dict[str, Any] = {}
-        synonyms: dict[str, list[str]] = {}
-        for id, node in nodes.items():
-
-            name = node.data.name.lower()
-            label = node.label.lower()
-            parts = name.split("/")
-            clean_name = "/".join(parts[1 : len(parts) - 1] + [label])
-
-            if name != "root":
-                searchable_words[clean_name] = {"id": id}
-                # Pretty sure this isn't the best but it's a start!..
-                synonyms[clean_name] = parts[1 : len(parts) - 1] + [label]
-
-        return searchable_words, synonyms
-
     def render(self) -> RenderableType:
         """Render the widget.
 
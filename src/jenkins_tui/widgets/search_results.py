@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from rich.console import RenderableType
+from rich.padding import Padding
+from rich.panel import Panel
+from rich.text import Text
+from textual.reactive import Reactive
+from textual.widget import Widget
+from textual.widgets import NodeID
+
+from .. import styles
+
+
+class SearchResultsWidget(Widget):
+    """A list of the jobs that match the search query."""
+
+    results: Reactive[list[tuple[NodeID, str]]] = Reactive([])
+    selected: Reactive[int] = Reactive(0)
+
+    def __init__(self) -> None:
+        """A list of the jobs that match the search query."""
+
+        name = self.__class__.__name__
+        super().__init__(name=name)
+        self.visible = False
+        self.details: list[str] = []
+
+    def update_results(
+        self, results: list[tuple[NodeID, str]], details: list[str] | None = None
+    ) -> None:
+        """Show a new list of results with the first result selected.
+
+        Args:
+            results (list[tuple[NodeID, str]]): The node id and full path of each matching job, best match first.
+            details (list[str] | None): Text shown after each result, such as the build that matched a full text search. Defaults to None.
+        """
+
+        self.details = details or []
+        self.results = results
+        self.selected = 0
+        self.visible = bool(results)
+        self.refresh()
+
+    def select(self, step: int) -> None:
+        """Move the selection up or down the list of results.
+
+        Args:
+            step (int): The number of rows to move by. Negative values move up the list.
+        """
+
+        if self.results:
+            self.selected = (self.selected + step) % len(self.results)
+
+    @property
+    def selected_node(self) -> NodeID | None:
+        """The node id of the selected result.
+
+        Returns:
+            NodeID | None: The node id, or None when there aren't any results.
+        """
+
+        if not self.results:
+            return None
+
+        return self.results[self.selected][0]
+
+    def render(self) -> RenderableType:
+        """Render the widget.
+
+        Returns:
+            RenderableType: Object to be rendered
+        """
+
+        lines = []
+        for index, (_, path) in enumerate(self.results):
+            folder, _, name = path.rpartition("/")
+            line = Text(no_wrap=True, overflow="ellipsis")
+            if folder:
+                line.append(f"{folder}/", style=styles.GREY)
+            line.append(name, style="bold")
+            if index < len(self.details):
+                line.append(f"  {self.details[index]}", style=styles.GREY)
+
+            if index == self.selected:
+                line.stylize("reverse")
+
+            lines.append(line)
+
+        return Padding(
+            Panel(
+                Text("\n").join(lines),
+                border_style=styles.PURPLE,
+                box=styles.BOX,
+            ),
+            pad=(0, 1),
+        )
@@ -0,0 +1,248 @@
+"""
+Helpers shared by the benchmarks in this directory: a small, local stand-in for a Jenkins controller so that they can run without a real instance, and the timing of samples.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+from jenkins_tui.jenkins import Jenkins
+
+from .fixtures import project
+
+Route = Callable[[str, dict[str, list[str]]], Any]
+
+
+class StandInJenkins:
+    """A threaded http server that answers a handful of Jenkins api endpoints."""
+
+    def __init__(self, routes: dict[str, Route] | None = None) -> None:
+        """A threaded http server that answers a handful of Jenkins api endpoints.
+
+        Args:
+            routes (dict[str, Route] | None): Extra routes keyed by the path suffix they answer. Defaults to None.
+        """
+
+        self.routes: dict[str, Route] = {
+            "crumbIssuer/api/json": lambda path, query: {
+                "crumb": "stand-in-crumb",
+                "crumbRequestField": "Jenkins-Crumb",
+            },
+            "api/json": lambda path, query: {"description": "stand-in", "jobs": []},
+        }
+        self.routes.update(routes or {})
+        self.requests = 0
+        self.connections = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        """The base url of the running server.
+
+        Returns:
+            str: The base url.
+        """
+
+        assert self._server is not None
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def respond(self, method: str, target: str) -> tuple[int, dict[str, str], bytes]:
+        """Build a response for a request.
+
+        Args:
+            method (str): The http method.
+            target (str): The request target including the query string.
+
+        Returns:
+            tuple[int, dict[str, str], bytes]: The status, headers and body.
+        """
+
+        with self._lock:
+            self.requests += 1
+
+        parts = urlsplit(target)
+        path = parts.path.lstrip("/")
+        query = parse_qs(parts.query)
+
+        if method == "POST":
+            return 201, {"Location": f"{self.url}/queue/item/{self.requests}/"}, b""
+
+        # The longest matching suffix wins so that specific routes beat "api/json"
+        for suffix in sorted(self.routes, key=len, reverse=True):
+            if path.endswith(suffix):
+                body = json.dumps(self.routes[suffix](path, query)).encode("utf-8")
+                return 200, {"Content-Type": "application/json"}, body
+
+        return 404, {}, b""
+
+    def __enter__(self) -> StandInJenkins:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                with stand_in._lock:
+                    stand_in.connections += 1
+                super().setup()
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                if length:
+                    self.rfile.read(length)
+
+                status, headers, body = stand_in.respond(self.command, self.path)
+                with stand_in._lock:
+                    stand_in.bytes_sent += len(body)
+
+                self.send_response(status)
+                self.send_header("X-Jenkins", "2.0-stand-in")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _handle
+            do_POST = _handle
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        assert self._server is not None
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def stand_in_client(server: StandInJenkins, **kwargs: Any) -> Jenkins:
+    """Create a Jenkins client for a stand-in server.
+
+    Args:
+        server (StandInJenkins): The running stand-in server.
+        **kwargs (Any): Extra arguments for the client, such as builds or executor.
+
+    Returns:
+        Jenkins: The client. It has to be closed.
+    """
+
+    return Jenkins(url=server.url, username="admin", password="admin", **kwargs)
+
+
+def tree_route(body: Callable[[], Any] | Any) -> Route:
+    """Create a route that answers with a body projected by the tree query of the request, the way Jenkins does.
+
+    Args:
+        body (Callable[[], Any] | Any): The full response body, or a function that builds it for each request.
+
+    Returns:
+        Route: The route.
+    """
+
+    def route(path: str, query: dict[str, list[str]]) -> Any:
+        value = body() if callable(body) else body
+        return project(value, query.get("tree", ["*"])[0])
+
+    return route
+
+
+def slow(route: Route, latency: float) -> Route:
+    """Delay the answers of a route, like a real controller that has to walk its jobs before it can respond.
+
+    Args:
+        route (Route): The route.
+        latency (float): Seconds to wait before answering.
+
+    Returns:
+        Route: The delayed route.
+    """
+
+    def delayed(path: str, query: dict[str, list[str]]) -> Any:
+        time.sleep(latency)
+        return route(path, query)
+
+    return delayed
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the given percentile of a list of samples.
+
+    Args:
+        samples (list[float]): The samples.
+        pct (float): The percentile between 0 and 100.
+
+    Returns:
+        float: The percentile value.
+    """
+
+    if not samples:
+        return 0.0
+
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summary(name: str, samples: list[float], elapsed: float | None = None) -> str:
+    """Format a one line summary of latency samples in milliseconds.
+
+    Args:
+        name (str): The name of the measurement.
+        samples (list[float]): Latency samples in seconds.
+        elapsed (float | None): Wall time for all samples, used to report throughput. Defaults to None.
+
+    Returns:
+        str: A summary line.
+    """
+
+    line = (
+        f"{name:<28} n={len(samples):<6} "
+        f"p50={percentile(samples, 50) * 1000:8.3f}ms "
+        f"p99={percentile(samples, 99) * 1000:8.3f}ms "
+        f"mean={statistics.fmean(samples) * 1000 if samples else 0:8.3f}ms"
+    )
+
+    if elapsed:
+        line += f" {len(samples) / elapsed:10.1f} req/s"
+
+    return line
+
+
+class Samples(list[float]):
+    """Latency samples in seconds."""
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Add the time that the body of a with block takes as a sample. The body may await."""
+
+        start = time.perf_counter()
+        yield
+        self.append(time.perf_counter() - start)
+
+    def summary(self, name: str, elapsed: float | None = None) -> str:
+        """Format a one line summary of the samples, see summary.
+
+        Args:
+            name (str): The name of the measurement.
+            elapsed (float | None): Wall time for all samples, used to report throughput. Defaults to None.
+
+        Returns:
+            str: A summary line.
+        """
+
+        return summary(name, self, elapsed)
@@ -0,0 +1,89 @@
+"""
+Compare a new httpx.AsyncClient per request (the old behaviour) with the pooled client owned by Jenkins.
+
+    python -m tools.benchmarks.connection_pool --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from jenkins_tui.jenkins import Jenkins
+
+from ._common import Route, Samples, StandInJenkins, stand_in_client
+
+
+async def per_request_client(client: Jenkins, endpoint: str) -> httpx.Response:
+    async with httpx.AsyncClient(
+        timeout=client.timeout, auth=client.auth, base_url=client.url
+    ) as http:
+        response = await http.request(method="GET", url=endpoint)
+        response.raise_for_status()
+        return response
+
+
+async def measure(
+    name: str, send: Callable[[], Awaitable[Any]], requests: int, concurrency: int
+) -> str:
+    samples = Samples()
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(i)
+
+    async def worker() -> None:
+        while not queue.empty():
+            queue.get_nowait()
+            with samples.measure():
+                await send()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return samples.summary(name, time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    endpoint = "/computer/api/json"
+    routes: dict[str, Route] = {
+        "computer/api/json": lambda path, query: {"computer": []}
+    }
+
+    with StandInJenkins(routes=routes) as server:
+        client = stand_in_client(server)
+
+        before = server.connections
+        print(
+            await measure(
+                "new client per request",
+                lambda: per_request_client(client, endpoint),
+                requests,
+                concurrency,
+            )
+        )
+        print(f"{'':<28} connections={server.connections - before}")
+
+        before = server.connections
+        print(
+            await measure(
+                "pooled client",
+                lambda: client._request_async(endpoint),
+                requests,
+                concurrency,
+            )
+        )
+        print(f"{'':<28} connections={server.connections - before}")
+        await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pooled Jenkins http client."
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
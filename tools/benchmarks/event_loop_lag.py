@@ -0,0 +1,126 @@
+"""
+Measure how long the event loop is blocked by the heavy work of the app, first on the event loop and then in the background executor.
+Lag is how late a 10ms sleep wakes up while the work runs, which is how late a key press would be handled.
+
+    python -m tools.benchmarks.event_loop_lag --jobs 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable
+
+import httpx
+
+from jenkins_tui.executor import BackgroundExecutor
+from jenkins_tui.jenkins import Jenkins
+from jenkins_tui.renderables.figlet_text import render_figlet
+from jenkins_tui.search import SearchIndex
+
+from ._common import summary
+from .fixtures import flatten, synthetic_jobs
+
+
+async def measure(
+    name: str, executor: BackgroundExecutor, work: Callable[[], Awaitable[None]]
+) -> None:
+    executor.lag.clear()
+    monitor = asyncio.ensure_future(executor.monitor_lag(interval=0.01))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+
+    # The monitor has to wake up once more to see a block that lasted until the end of the work
+    await asyncio.sleep(0.05)
+    monitor.cancel()
+    samples = list(executor.lag)
+    print(
+        f"{summary(name, samples)} max={max(samples) * 1000:8.3f}ms total={elapsed * 1000:8.1f}ms"
+    )
+
+
+async def main(total: int, chunk_size: int, processes: int) -> None:
+    executor = BackgroundExecutor(
+        process_workers=processes, process_threshold=Jenkins.decode_threshold
+    )
+
+    tree = synthetic_jobs("http://jenkins", total=total)
+    names = [(id, name, label) for id, (name, label) in enumerate(flatten(tree))]
+
+    # The response is built up front so that only decoding it is measured
+    response = httpx.Response(200, content=json.dumps({"jobs": tree}).encode())
+    print(f"{len(names)} jobs, {len(response.content) / 1024 / 1024:.1f}MiB response")
+
+    inline = Jenkins(url="http://jenkins", username="admin", password="admin")
+    background = Jenkins(
+        url="http://jenkins", username="admin", password="admin", executor=executor
+    )
+
+    async def decode_inline() -> None:
+        await inline._decode(response)
+
+    async def decode_background() -> None:
+        await background._decode(response)
+
+    await measure("decode (event loop)", executor, decode_inline)
+    await measure(
+        "decode (processes)" if processes else "decode (threads)",
+        executor,
+        decode_background,
+    )
+
+    async def index_inline() -> None:
+        index = SearchIndex()
+        for start in range(0, len(names), chunk_size):
+            for node_id, name, label in names[start : start + chunk_size]:
+                index.add(node_id, name, label)
+            await asyncio.sleep(0)
+        index.compact()
+
+    async def index_background() -> None:
+        index = SearchIndex()
+        for start in range(0, len(names), chunk_size):
+            await executor.run(index.add_many, names[start : start + chunk_size])
+
+    await measure("index (event loop)", executor, index_inline)
+    await measure("index (executor)", executor, index_background)
+
+    async def figlet_inline() -> None:
+        for width in range(30, 40):
+            render_figlet("Jenkins", width, 8)
+
+    async def figlet_background() -> None:
+        for width in range(40, 50):
+            await executor.run(render_figlet, "Jenkins", width, 8)
+
+    await measure("figlet (event loop)", executor, figlet_inline)
+    await measure("figlet (executor)", executor, figlet_background)
+
+    print(f"executor: {executor.lag_info}")
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark event loop lag with and without the background executor."
+    )
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=500,
+        help="Jobs added to the search index between yields to the event loop.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="Decode responses in a process pool of this size instead of in threads.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.jobs, args.chunk_size, args.processes))
@@ -0,0 +1,406 @@
+"""
+Synthetic Jenkins job trees, builds, nodes and queues for the benchmarks in this directory, and the projection of tree queries that the stand-in server answers with.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Iterator
+
+FOLDER = "com.cloudbees.hudson.plugins.folder.Folder"
+MULTIBRANCH = "org.jenkinsci.plugins.workflow.multibranch.WorkflowMultiBranchProject"
+FREESTYLE = "hudson.model.FreeStyleProject"
+PIPELINE = "org.jenkinsci.plugins.workflow.job.WorkflowJob"
+
+COLORS = ["blue", "red", "yellow", "notbuilt", "disabled", "aborted", "blue_anime"]
+
+
+def synthetic_jobs(
+    base_url: str, total: int = 50_000, folders: int = 50, sub_folders: int = 10
+) -> list[dict[str, Any]]:
+    """Build a nested job tree made of folders, sub folders, multibranch projects and jobs.
+
+    Args:
+        base_url (str): The url of the server the jobs belong to.
+        total (int): The approximate number of leaf jobs. Defaults to 50_000.
+        folders (int): The number of top level folders. Defaults to 50.
+        sub_folders (int): The number of folders within each top level folder. Defaults to 10.
+
+    Returns:
+        list[dict[str, Any]]: A list of job dicts as returned by the Jenkins api.
+    """
+
+    per_folder = max(1, total // (folders * sub_folders))
+    tree: list[dict[str, Any]] = []
+    count = 0
+
+    for f in range(folders):
+        folder_url = f"{base_url}/job/team-{f}/"
+        children: list[dict[str, Any]] = []
+
+        for s in range(sub_folders):
+            sub_url = f"{folder_url}job/service-{s}/"
+            is_multibranch = s % 2 == 0
+            jobs = []
+            for j in range(per_folder):
+                name = f"branch-{j}" if is_multibranch else f"deploy-{j}"
+                jobs.append(
+                    {
+                        "_class": PIPELINE if is_multibranch else FREESTYLE,
+                        "name": name,
+                        "url": f"{sub_url}job/{name}/",
+                        "color": COLORS[count % len(COLORS)],
+                    }
+                )
+                count += 1
+
+            children.append(
+                {
+                    "_class": MULTIBRANCH if is_multibranch else FOLDER,
+                    "name": f"service-{s}",
+                    "url": sub_url,
+                    "jobs": jobs,
+                }
+            )
+
+        tree.append(
+            {"_class": FOLDER, "name": f"team-{f}", "url": folder_url, "jobs": children}
+        )
+
+    return tree
+
+
+def flatten(jobs: list[dict[str, Any]]) -> Iterator[tuple[str, str]]:
+    """Walk a job tree.
+
+    Args:
+        jobs (list[dict[str, Any]]): A list of job dicts with their nested jobs.
+
+    Yields:
+        Iterator[tuple[str, str]]: The full name and the name of each job.
+    """
+
+    stack = list(jobs)
+    while stack:
+        entry = stack.pop()
+        parts = entry["url"].strip("/").split("/job/")
+        yield "/".join(parts[1:]), entry["name"]
+        stack.extend(entry.get("jobs", []))
+
+
+def truncate(jobs: list[dict[str, Any]], depth: int) -> list[dict[str, Any]]:
+    """Drop nested jobs below the given depth, like a Jenkins tree query would.
+
+    Args:
+        jobs (list[dict[str, Any]]): A list of job dicts.
+        depth (int): The number of nested levels to keep. 0 keeps only the given level.
+
+    Returns:
+        list[dict[str, Any]]: The truncated list of job dicts.
+    """
+
+    truncated = []
+    for job in jobs:
+        copy = {key: value for key, value in job.items() if key != "jobs"}
+        if "jobs" in job and depth > 0:
+            copy["jobs"] = truncate(job["jobs"], depth - 1)
+        truncated.append(copy)
+
+    return truncated
+
+
+def jobs_route(tree: list[dict[str, Any]]):
+    """Create a stand in route that answers get_jobs queries for a job tree.
+
+    Args:
+        tree (list[dict[str, Any]]): The job tree to serve.
+
+    Returns:
+        Route: A route for StandInJenkins.
+    """
+
+    def route(path: str, query: dict[str, list[str]]) -> dict[str, Any]:
+        jobs = tree
+        for name in re.findall(r"job/([^/]+)", path):
+            jobs = next(job for job in jobs if job["name"] == name).get("jobs", [])
+
+        depth = query.get("tree", [""])[0].count("jobs[") - 1
+        return {"jobs": truncate(jobs, depth)}
+
+    return route
+
+
+def parse_tree(tree: str) -> dict[str, Any]:
+    """Parse a Jenkins tree query into nested field sets.
+
+    Args:
+        tree (str): A tree query, such as "name,builds[number,result]{0,20}".
+
+    Returns:
+        dict[str, Any]: The requested fields, each mapped to a tuple of its nested fields (or None) and its range (or None).
+    """
+
+    def parse(position: int) -> tuple[dict[str, Any], int]:
+        fields: dict[str, Any] = {}
+        while position < len(tree) and tree[position] != "]":
+            end = position
+            while end < len(tree) and tree[end] not in ",[]{":
+                end += 1
+            name = tree[position:end]
+            position = end
+
+            nested = None
+            if position < len(tree) and tree[position] == "[":
+                nested, position = parse(position + 1)
+                position += 1
+
+            bounds = None
+            if position < len(tree) and tree[position] == "{":
+                end = tree.index("}", position)
+                lower, _, upper = tree[position + 1 : end].partition(",")
+                if "," not in tree[position + 1 : end]:
+                    lower, upper = "", lower
+                bounds = (int(lower or 0), int(upper) if upper else None)
+                position = end + 1
+
+            if name:
+                fields[name] = (nested, bounds)
+            if position < len(tree) and tree[position] == ",":
+                position += 1
+
+        return fields, position
+
+    return parse(0)[0]
+
+
+def project(value: Any, tree: str | dict[str, Any]) -> Any:
+    """Keep only the fields of a response that a tree query asks for, like Jenkins does.
+
+    Args:
+        value (Any): The full response.
+        tree (str | dict[str, Any]): A tree query, or one parsed by parse_tree.
+
+    Returns:
+        Any: The projected response.
+    """
+
+    fields = parse_tree(tree) if isinstance(tree, str) else tree
+    if isinstance(value, list):
+        return [project(item, fields) for item in value]
+    if not isinstance(value, dict) or "*" in fields and len(fields) == 1:
+        return value
+
+    projected = {}
+    for name, item in value.items():
+        if name not in fields and "*" not in fields:
+            continue
+
+        nested, bounds = fields.get(name, (None, None))
+        if bounds is not None and isinstance(item, list):
+            item = item[bounds[0] : bounds[1]]
+        projected[name] = project(item, nested) if nested else item
+
+    return projected
+
+
+def synthetic_builds(
+    total: int = 100, running: int = 1, changes: int = 3
+) -> list[dict[str, Any]]:
+    """Build a history of builds, newest first, like the builds of a job response.
+
+    Args:
+        total (int): The number of builds. Defaults to 100.
+        running (int): The number of newest builds that haven't completed. Defaults to 1.
+        changes (int): The number of commits in the change set of each build. Defaults to 3.
+
+    Returns:
+        list[dict[str, Any]]: A list of build dicts.
+    """
+
+    builds = []
+    for number in range(total, 0, -1):
+        done = total - number >= running
+        builds.append(
+            {
+                "_class": "hudson.model.FreeStyleBuild",
+                "number": number,
+                "id": str(number),
+                "result": (
+                    ["SUCCESS", "FAILURE", "UNSTABLE"][number % 3] if done else None
+                ),
+                "description": f"build {number} of release-{number // 10}",
+                "timestamp": 1_600_000_000_000 + number * 60_000,
+                "duration": 45_000 + number * 10 if done else 0,
+                "changeSets": [
+                    {
+                        "_class": "hudson.plugins.git.GitChangeSetList",
+                        "kind": "git",
+                        "items": [
+                            {
+                                "_class": "hudson.plugins.git.GitChangeSet",
+                                "commitId": f"{number:08x}{change:032x}",
+                                "msg": f"Fix the thing that broke in build {number - 1}",
+                                "author": {"fullName": f"dev-{change}"},
+                                "affectedPaths": [f"src/module_{change}.py"],
+                                "timestamp": 1_600_000_000_000 + number * 60_000,
+                            }
+                            for change in range(changes)
+                        ],
+                    }
+                ],
+            }
+        )
+
+    return builds
+
+
+def synthetic_nodes(total: int = 300, executors: int = 2) -> list[dict[str, Any]]:
+    """Build a list of agents with monitor data and executors, some of them busy, like the computer response of a large controller.
+
+    Args:
+        total (int): The number of agents. Defaults to 300.
+        executors (int): The number of executors of each agent. Defaults to 2.
+
+    Returns:
+        list[dict[str, Any]]: A list of node dicts.
+    """
+
+    nodes = []
+    for n in range(total):
+        name = f"agent-{n}"
+        nodes.append(
+            {
+                "_class": "hudson.slaves.SlaveComputer",
+                "displayName": name,
+                "description": f"Build agent {n} in pool {n % 8}",
+                "icon": "symbol-computer",
+                "iconClassName": "symbol-computer",
+                "idle": n % 3 != 0,
+                "jnlpAgent": True,
+                "launchSupported": False,
+                "manualLaunchAllowed": True,
+                "numExecutors": executors,
+                "offline": n % 50 == 0,
+                "offlineCauseReason": "",
+                "temporarilyOffline": False,
+                "assignedLabels": [
+                    {"name": name},
+                    {"name": f"pool-{n % 8}"},
+                    {"name": "linux"},
+                ],
+                "actions": [{}, {}],
+                "monitorData": {
+                    "hudson.node_monitors.SwapSpaceMonitor": {
+                        "availablePhysicalMemory": 8_000_000_000 + n,
+                        "availableSwapSpace": 2_000_000_000,
+                        "totalPhysicalMemory": 16_000_000_000,
+                        "totalSwapSpace": 2_000_000_000,
+                    },
+                    "hudson.node_monitors.TemporarySpaceMonitor": {
+                        "timestamp": 1_600_000_000_000 + n,
+                        "path": "/tmp",
+                        "size": 50_000_000_000,
+                    },
+                    "hudson.node_monitors.DiskSpaceMonitor": {
+                        "timestamp": 1_600_000_000_000 + n,
+                        "path": "/home/jenkins",
+                        "size": 100_000_000_000,
+                    },
+                    "hudson.node_monitors.ArchitectureMonitor": "Linux (amd64)",
+                    "hudson.node_monitors.ResponseTimeMonitor": {
+                        "timestamp": 1_600_000_000_000,
+                        "average": 40 + n % 10,
+                    },
+                    "hudson.node_monitors.ClockMonitor": {"diff": n % 7},
+                },
+                "executors": [
+                    {
+                        "_class": "hudson.model.Executor",
+                        "idle": idle,
+                        "likelyStuck": False,
+                        "number": e,
+                        "progress": -1 if idle else (n * 7 + e) % 100,
+                        "currentExecutable": (
+                            None
+                            if idle
+                            else {
+                                "_class": "hudson.model.FreeStyleBuild",
+                                "building": True,
+                                "description": None,
+                                "displayName": f"#{n * 10 + e}",
+                                "duration": 0,
+                                "estimatedDuration": 120_000,
+                                "fullDisplayName": f"team-{n % 50} » service-{e} » deploy #{n * 10 + e}",
+                                "id": str(n * 10 + e),
+                                "keepLog": False,
+                                "number": n * 10 + e,
+                                "queueId": 1000 + n,
+                                "result": None,
+                                "timestamp": 1_600_000_000_000 + n * 1000,
+                                "url": f"https://jenkins/job/team-{n % 50}/job/service-{e}/job/deploy/{n * 10 + e}/",
+                                "builtOn": name,
+                                "changeSet": {
+                                    "_class": "hudson.scm.EmptyChangeLogSet",
+                                    "items": [],
+                                    "kind": None,
+                                },
+                                "culprits": [
+                                    {
+                                        "absoluteUrl": "https://jenkins/user/dev",
+                                        "fullName": "dev",
+                                    }
+                                ],
+                            }
+                        ),
+                    }
+                    for e in range(executors)
+                    for idle in [(n + e) % 3 != 0]
+                ],
+            }
+        )
+
+    return nodes
+
+
+def synthetic_queue(total: int = 50) -> list[dict[str, Any]]:
+    """Build a list of queue items waiting for an executor.
+
+    Args:
+        total (int): The number of queue items. Defaults to 50.
+
+    Returns:
+        list[dict[str, Any]]: A list of queue item dicts.
+    """
+
+    return [
+        {
+            "_class": "hudson.model.Queue$BuildableItem",
+            "actions": [
+                {
+                    "_class": "hudson.model.CauseAction",
+                    "causes": [{"shortDescription": "Started by an SCM change"}],
+                },
+                {
+                    "_class": "hudson.model.ParametersAction",
+                    "parameters": [{"name": "DEPLOY_ENV", "value": "staging"}],
+                },
+            ],
+            "blocked": False,
+            "buildable": True,
+            "id": 5000 + i,
+            "inQueueSince": 1_600_000_000_000 + i * 1000,
+            "params": "\nDEPLOY_ENV=staging",
+            "stuck": False,
+            "task": {
+                "_class": "hudson.model.FreeStyleProject",
+                "name": f"deploy-{i}",
+                "url": f"https://jenkins/job/team-{i % 50}/job/deploy-{i}/",
+                "color": "blue",
+            },
+            "url": f"queue/item/{5000 + i}/",
+            "why": "Waiting for next available executor on ‘linux’",
+            "buildableStartMilliseconds": 1_600_000_000_000 + i * 1000,
+            "pending": False,
+        }
+        for i in range(total)
+    ]
@@ -0,0 +1,119 @@
+"""
+Poll the details of one job the way JobView does and measure the bytes that the server sends per poll.
+A new build is started every few polls and completes a few polls later, so most polls see an idle job. Without the build cache every poll downloads every build with its change sets, with it only new and running builds are downloaded.
+With the status probe an idle job isn't fetched at all, only its next build number, color and last build are.
+
+    python -m tools.benchmarks.job_polling --polls 100 --builds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Any
+
+from jenkins_tui.jenkins import BuildCache
+from jenkins_tui.views.job import JobView
+
+from ._common import StandInJenkins, stand_in_client, tree_route
+from .fixtures import synthetic_builds
+
+
+async def poll(
+    server: StandInJenkins,
+    builds: BuildCache | None,
+    probe: bool,
+    polls: int,
+    every: int,
+    duration: int,
+) -> tuple[list[int], str]:
+    history = server.history  # type: ignore[attr-defined]
+    client = stand_in_client(server, builds=builds)
+
+    sizes = []
+    job: dict[str, Any] = {}
+    probes = 0
+    for count in range(polls):
+        if count % every == 0:
+            history.insert(0, synthetic_builds(history[0]["number"] + 1)[0])
+        elif count % every == duration:
+            history[0]["result"] = "SUCCESS"
+
+        before = server.bytes_sent
+
+        # The same decision that JobView.update makes
+        running = any(build.get("result") is None for build in job.get("builds", []))
+        if probe and job and not running and probes < JobView.max_probes:
+            probes += 1
+            if not await client.job_changed(
+                path="/job/service/", status=client.job_status(job)
+            ):
+                sizes.append(server.bytes_sent - before)
+                continue
+
+        probes = 0
+        job = await client.get_job(path="/job/service/")
+        assert [build["number"] for build in job["builds"]] == [
+            build["number"] for build in history[: len(job["builds"])]
+        ]
+        sizes.append(server.bytes_sent - before)
+
+    await client.close()
+    return sizes, client.probe_info
+
+
+async def main(polls: int, total: int, every: int, duration: int, changes: int) -> None:
+    def job() -> dict[str, Any]:
+        history = server.history  # type: ignore[attr-defined]
+        return {
+            "_class": "hudson.model.FreeStyleProject",
+            "name": "service",
+            "displayName": "service",
+            "description": "Deploys the service",
+            "nextBuildNumber": history[0]["number"] + 1,
+            "color": "blue_anime" if history[0]["result"] is None else "blue",
+            "lastBuild": history[0],
+            "healthReport": [{"description": "Build stability: 1 out of the last 5"}],
+            "actions": [],
+            "property": [],
+            "builds": history,
+        }
+
+    for name, builds, probe in (
+        ("without build cache", None, False),
+        ("with build cache", BuildCache(url="stand-in", persist=False), False),
+        ("with build cache and probe", BuildCache(url="stand-in", persist=False), True),
+    ):
+        with StandInJenkins(routes={"api/json": tree_route(job)}) as server:
+            server.history = synthetic_builds(total, running=0, changes=changes)  # type: ignore[attr-defined]
+            sizes, probe_info = await poll(
+                server, builds, probe, polls, every, duration
+            )
+            print(
+                f"{name:<32} requests={server.requests:<5} total={sum(sizes) / 1024:8.1f}KiB "
+                f"per poll={sum(sizes) / len(sizes) / 1024:6.2f}KiB max={max(sizes) / 1024:6.2f}KiB {probe_info}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the bytes downloaded per job poll with and without the build cache and the status probe."
+    )
+    parser.add_argument("--polls", type=int, default=100)
+    parser.add_argument(
+        "--builds", type=int, default=20, help="Builds in the history of the job."
+    )
+    parser.add_argument(
+        "--every", type=int, default=10, help="Polls between each new build."
+    )
+    parser.add_argument(
+        "--duration", type=int, default=2, help="Polls that each build runs for."
+    )
+    parser.add_argument(
+        "--changes",
+        type=int,
+        default=3,
+        help="Commits in the change set of each build.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.polls, args.builds, args.every, args.duration, args.changes))
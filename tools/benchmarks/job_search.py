@@ -0,0 +1,77 @@
+"""
+Micro-benchmarks for ranked job search: index build time, index memory and query latency for each kind of query.
+
+    python -m tools.benchmarks.job_search --jobs 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from jenkins_tui.search import SearchIndex
+
+from ._common import Samples
+from .fixtures import flatten, synthetic_jobs
+
+QUERIES = {
+    "one character": ["d", "b", "s", "t"],
+    "job name prefix": ["dep", "deploy-1", "branch-4", "branch-19"],
+    "exact job name": ["deploy-12", "branch-99", "deploy-0", "branch-150"],
+    "folder prefix": ["team-4", "service-3", "team-12", "service-9"],
+    "substring": ["loy-19", "anch-7", "ice-2/dep", "m-3/serv"],
+    "multiple words": ["team-3 deploy-4", "service-2 branch", "team-4 7", "t s d"],
+    "full path": [
+        "team-49/service-9/deploy-199",
+        "team-0/service-0/branch-0",
+        "team-12/service-3/deploy-45",
+        "team-7/service-8/branch-3",
+    ],
+    "typo": ["deplyo-12", "brnach-4", "servce-2/deply", "taem-4"],
+    "no match": ["zzz", "xyz-123", "nothing here", "q"],
+}
+
+
+def main(total: int, repeat: int, limit: int) -> None:
+    names = list(flatten(synthetic_jobs("http://jenkins", total=total)))
+    print(f"{len(names)} jobs")
+
+    def build() -> SearchIndex:
+        index = SearchIndex()
+        for id, (name, label) in enumerate(names):
+            index.add(id, name, label)
+        index.compact()
+        return index
+
+    start = time.perf_counter()
+    index = build()
+    elapsed = time.perf_counter() - start
+
+    # The index is built a second time to measure memory because tracing slows the build down
+    tracemalloc.start()
+    traced = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced
+
+    print(f"{'build':<28} {elapsed * 1000:9.1f}ms")
+    print(f"{'memory':<28} {size / 1024 / 1024:9.1f}MiB")
+
+    for name, queries in QUERIES.items():
+        samples = Samples()
+        for _ in range(repeat):
+            for query in queries:
+                with samples.measure():
+                    index.search(query, limit=limit)
+
+        print(samples.summary(name))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ranked job search.")
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=250)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    main(args.jobs, args.repeat, args.limit)
@@ -0,0 +1,73 @@
+"""
+Compare loading the whole job tree with lazy, per folder loading against a synthetic job tree.
+
+    python -m tools.benchmarks.lazy_jobs --jobs 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from ._common import Samples, StandInJenkins, stand_in_client
+from .fixtures import jobs_route, synthetic_jobs
+
+
+def count(jobs: list[dict[str, Any]]) -> int:
+    return sum(1 + count(job.get("jobs", [])) for job in jobs)
+
+
+async def measure(
+    name: str,
+    server: StandInJenkins,
+    fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+    repeat: int,
+) -> None:
+    samples = Samples()
+    for _ in range(repeat):
+        before = server.bytes_sent
+        with samples.measure():
+            jobs = await fetch()
+        size = server.bytes_sent - before
+
+    best = min(samples) * 1000
+    print(f"{name:<32} {best:9.1f}ms {size / 1024:10.1f}KiB {count(jobs):8} nodes")
+
+
+async def main(total: int, repeat: int) -> None:
+    with StandInJenkins() as server:
+        tree = synthetic_jobs(server.url, total=total)
+        server.routes["api/json"] = jobs_route(tree)
+        client = stand_in_client(server)
+
+        await measure(
+            "eager (folder_depth=10)",
+            server,
+            lambda: client.get_jobs(recursive=True),
+            repeat,
+        )
+        await measure("lazy root", server, lambda: client.get_jobs(), repeat)
+        await measure(
+            "lazy root (prefetch_depth=1)",
+            server,
+            lambda: client.get_jobs(recursive=True, folder_depth=1),
+            repeat,
+        )
+        await measure(
+            "lazy folder expansion",
+            server,
+            lambda: client.get_jobs(path="/job/team-3/job/service-1/"),
+            repeat,
+        )
+        await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark eager and lazy job tree loading."
+    )
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.jobs, args.repeat))
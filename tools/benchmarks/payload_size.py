@@ -0,0 +1,107 @@
+"""
+Measure the bytes that the server sends for each query of the client against a large controller, and compare them with the wildcard queries that were used before each query had its own field set.
+The benchmark fails when a query sends more than its budget so that a field added to a query without need is noticed.
+
+    python -m tools.benchmarks.payload_size --agents 300 --queue 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import Any
+
+from ._common import StandInJenkins, stand_in_client, tree_route
+from .fixtures import synthetic_builds, synthetic_nodes, synthetic_queue
+
+# The queries that were used before each consumer had its own field set
+WILDCARD_QUERIES = {
+    "nodes": "computer/api/json?tree=*,computer[*,executors[*,currentExecutable[*]]]",
+    "queue": "queue/api/json?tree=items[*,task[*]]",
+}
+
+# The most bytes that each query may send per agent, queue item or build before the benchmark fails
+BUDGETS = {"nodes": 250, "queue": 100, "job": 1200}
+
+
+async def main(agents: int, queue: int, builds: int) -> int:
+    nodes = synthetic_nodes(agents)
+    items = synthetic_queue(queue)
+    history = synthetic_builds(builds, running=0)
+
+    routes = {
+        "computer/api/json": tree_route({"computer": nodes, "busyExecutors": 0}),
+        "queue/api/json": tree_route({"items": items}),
+        "api/json": tree_route(
+            {
+                "name": "deploy",
+                "displayName": "deploy",
+                "description": "Deploys the service",
+                "nextBuildNumber": builds + 1,
+                "color": "blue",
+                "lastBuild": history[0],
+                "actions": [],
+                "property": [],
+                "healthReport": [
+                    {"description": "Build stability: no recent builds failed."}
+                ],
+                "builds": history,
+            }
+        ),
+    }
+
+    failed = 0
+    with StandInJenkins(routes=routes) as server:
+        client = stand_in_client(server)
+
+        async def measure(call) -> int:
+            before = server.bytes_sent
+            await call
+            return server.bytes_sent - before
+
+        sizes = {
+            "nodes": (
+                await measure(client.get_nodes()),
+                await measure(client._get(WILDCARD_QUERIES["nodes"])),
+                agents,
+            ),
+            "queue": (
+                await measure(client.get_queued_jobs()),
+                await measure(client._get(WILDCARD_QUERIES["queue"])),
+                queue,
+            ),
+            "job": (
+                await measure(client.get_job(path="/job/deploy/")),
+                None,
+                builds,
+            ),
+        }
+        await client.close()
+
+    for name, (size, wildcard, count) in sizes.items():
+        per_item = size / max(count, 1)
+        line = f"{name:<8} {size / 1024:9.1f}KiB {per_item:8.0f}B/item"
+        if wildcard is not None:
+            line += f"  wildcard {wildcard / 1024:9.1f}KiB ({wildcard / max(size, 1):.0f}x larger)"
+        if per_item > BUDGETS[name]:
+            line += f"  OVER BUDGET ({BUDGETS[name]}B/item)"
+            failed += 1
+        print(line)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the payload size of the node, queue and job queries."
+    )
+    parser.add_argument("--agents", type=int, default=300)
+    parser.add_argument(
+        "--queue", type=int, default=50, help="Items waiting in the build queue."
+    )
+    parser.add_argument(
+        "--builds", type=int, default=20, help="Builds in the history of the job."
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.agents, args.queue, args.builds)))
@@ -0,0 +1,66 @@
+"""
+Simulate bursts of UI activity that ask for the same data at once, such as several widgets reading the executors or a user flipping between two jobs, and count the requests that reach the server.
+
+    python -m tools.benchmarks.request_coalescing --bursts 50 --callers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable
+
+from ._common import Route, Samples, StandInJenkins, slow, stand_in_client
+
+
+async def main(bursts: int, callers: int, latency: float) -> None:
+    routes: dict[str, Route] = {
+        "computer/api/json": slow(lambda path, query: {"computer": []}, latency),
+        "queue/api/json": slow(lambda path, query: {"items": []}, latency),
+        "api/json": slow(
+            lambda path, query: {"name": "job", "builds": [], "property": []}, latency
+        ),
+    }
+
+    with StandInJenkins(routes=routes) as server:
+        client = stand_in_client(server)
+
+        samples = Samples()
+        start = time.perf_counter()
+        for burst in range(bursts):
+            path = f"/job/job-{burst % 2}/"
+            calls: list[Awaitable[Any]] = []
+            for caller in range(callers):
+                calls.append(client.get_running_builds())
+                calls.append(client.get_queued_jobs())
+                calls.append(client.get_job(path=path))
+
+            with samples.measure():
+                await asyncio.gather(*calls)
+
+        elapsed = time.perf_counter() - start
+        await client.close()
+
+    print(samples.summary("burst", elapsed))
+    print(
+        f"calls={bursts * callers * 3} server requests={server.requests} {client.coalesce_info}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark coalescing of identical in-flight requests."
+    )
+    parser.add_argument("--bursts", type=int, default=50)
+    parser.add_argument(
+        "--callers", type=int, default=8, help="Widgets asking for the same data."
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Seconds the stand-in server takes to answer.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.bursts, args.callers, args.latency))
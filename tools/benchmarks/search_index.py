@@ -0,0 +1,82 @@
+"""
+Compare rebuilding an AutoComplete over every job, which is what happened on every tree change, with updating the incremental search index.
+
+    python -m tools.benchmarks.search_index --jobs 40000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+from fast_autocomplete import AutoComplete
+
+from jenkins_tui.search import SearchIndex
+
+from ._common import Samples
+from .fixtures import flatten, synthetic_jobs
+
+
+def rebuild_autocomplete(names: list[tuple[str, str]]) -> AutoComplete:
+    words: dict[str, Any] = {}
+    synonyms: dict[str, list[str]] = {}
+    for id, (name, label) in enumerate(names):
+        parts = name.lower().split("/")
+        tokens = parts[1 : len(parts) - 1] + [label.lower()]
+        key = "/".join(tokens)
+        words[key] = {"id": id}
+        synonyms[key] = tokens
+    return AutoComplete(words=words, synonyms=synonyms)
+
+
+def main(total: int, folder: int, queries: int) -> None:
+    names = list(flatten(synthetic_jobs("http://jenkins", total=total)))
+    extra = [(f"team-x/new/deploy-{i}", f"deploy-{i}") for i in range(folder)]
+    print(f"{len(names)} jobs, expanding a folder of {folder} jobs")
+
+    start = time.perf_counter()
+    rebuild_autocomplete(names + extra)
+    rebuild = time.perf_counter() - start
+    print(f"{'AutoComplete rebuild':<28} {rebuild * 1000:9.1f}ms")
+
+    index = SearchIndex()
+    start = time.perf_counter()
+    for id, (name, label) in enumerate(names):
+        index.add(id, name, label)
+    index.compact()
+    print(f"{'SearchIndex build':<28} {(time.perf_counter() - start) * 1000:9.1f}ms")
+
+    start = time.perf_counter()
+    for id, (name, label) in enumerate(extra, start=len(names)):
+        index.add(id, name, label)
+    index.compact()
+    print(
+        f"{'SearchIndex folder update':<28} {(time.perf_counter() - start) * 1000:9.1f}ms"
+    )
+
+    start = time.perf_counter()
+    for id in range(len(names), len(names) + folder):
+        index.remove(id)
+    index.compact()
+    print(
+        f"{'SearchIndex folder removal':<28} {(time.perf_counter() - start) * 1000:9.1f}ms"
+    )
+
+    samples = Samples()
+    prefixes = ["d", "dep", "deploy-1", "service-3/", "branch-4", "missing"]
+    for i in range(queries):
+        with samples.measure():
+            index.complete(prefixes[i % len(prefixes)])
+    print(samples.summary("SearchIndex complete"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark rebuilding and incrementally updating the search index."
+    )
+    parser.add_argument("--jobs", type=int, default=40_000)
+    parser.add_argument("--folder", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=1_000)
+    args = parser.parse_args()
+    main(args.jobs, args.folder, args.queries)
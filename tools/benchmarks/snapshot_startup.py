@@ -0,0 +1,60 @@
+"""
+Compare a cold start, where the job tree is requested from Jenkins, with a warm start, where the job tree is read from a snapshot.
+Mapping the jobs into the tree costs the same in both cases so only the time until the jobs are available is measured.
+
+    python -m tools.benchmarks.snapshot_startup --jobs 50000 --latency 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+
+from jenkins_tui.snapshot import Snapshot
+
+from ._common import Samples, StandInJenkins, slow, stand_in_client
+from .fixtures import jobs_route, synthetic_jobs
+
+
+async def main(total: int, repeat: int, latency: float) -> None:
+    with StandInJenkins() as server:
+        tree = synthetic_jobs(server.url, total=total)
+        server.routes["api/json"] = slow(jobs_route(tree), latency)
+        client = stand_in_client(server)
+
+        with tempfile.TemporaryDirectory() as directory:
+            snapshot = Snapshot(url=server.url, username="admin", directory=directory)
+
+            cold_samples = Samples()
+            for _ in range(repeat):
+                with cold_samples.measure():
+                    jobs = await client.get_jobs(recursive=True)
+
+            await snapshot.save(jobs)
+
+            warm_samples = Samples()
+            for _ in range(repeat):
+                with warm_samples.measure():
+                    await snapshot.load()
+
+        await client.close()
+
+    print(cold_samples.summary("cold (request jobs)"))
+    print(warm_samples.summary("warm (load snapshot)"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark cold and warm startup of the job tree."
+    )
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.5,
+        help="Seconds the stand-in server waits before answering a job tree request.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.jobs, args.repeat, args.latency))
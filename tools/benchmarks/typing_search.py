@@ -0,0 +1,126 @@
+"""
+Simulate typing into the search box and measure the time spent on the event loop for each keystroke.
+Every keystroke is searched straight away in the eager run, while the debounced run waits for typing to pause and answers repeated queries from the cache.
+
+    python -m tools.benchmarks.typing_search --jobs 100000 --interval 0.03
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Iterator
+
+from jenkins_tui.search import QueryCache, SearchIndex
+from jenkins_tui.util import Debouncer
+
+from ._common import Samples
+from .fixtures import flatten, synthetic_jobs
+
+PHRASES = [
+    "team-12/service-3/deploy-45",
+    "branch-19",
+    "service-2 deploy",
+    "deplyo-12",
+]
+
+
+def keystrokes(phrases: list[str], backspaces: int) -> Iterator[tuple[str, bool]]:
+    """Yield the value of the search box after each keystroke. Each phrase is typed, partly deleted and typed again.
+
+    Args:
+        phrases (list[str]): The phrases to type.
+        backspaces (int): The number of characters deleted from the end of each phrase.
+
+    Yields:
+        Iterator[tuple[str, bool]]: The value of the search box, and whether typing pauses after the keystroke to read the results.
+    """
+
+    for phrase in phrases:
+        for end in range(1, len(phrase) + 1):
+            yield phrase[:end], end == len(phrase)
+
+        for end in range(len(phrase) - 1, len(phrase) - backspaces - 1, -1):
+            yield phrase[:end], False
+
+        for end in range(len(phrase) - backspaces + 1, len(phrase) + 1):
+            yield phrase[:end], end == len(phrase)
+
+        yield "", False
+
+
+async def main(
+    total: int, interval: float, delay: float, backspaces: int, pause: float
+) -> None:
+    index = SearchIndex()
+    for id, (name, label) in enumerate(
+        flatten(synthetic_jobs("http://jenkins", total=total))
+    ):
+        index.add(id, name, label)
+    index.compact()
+
+    values = list(keystrokes(PHRASES, backspaces))
+    print(f"{len(index)} jobs, {len(values)} keystrokes {interval * 1000:.0f}ms apart")
+
+    eager = Samples()
+    for value, paused in values:
+        with eager.measure():
+            index.search(value)
+            word = value.split(" ")[-1]
+            if word:
+                index.complete(word)
+        await asyncio.sleep(pause if paused else interval)
+
+    queries = QueryCache(index)
+    debouncer = Debouncer(delay)
+    debounced = Samples()
+    searches = Samples()
+
+    async def update_search(value: str) -> None:
+        with searches.measure():
+            queries.search(value)
+
+    for value, paused in values:
+        with debounced.measure():
+            if value in queries:
+                debouncer.cancel()
+                await update_search(value)
+            else:
+                debouncer.call(update_search, value)
+        await asyncio.sleep(pause if paused else interval)
+
+    await asyncio.sleep(delay * 2)
+
+    print(eager.summary("eager keystroke") + f" searches={len(values)}")
+    print(debounced.summary("debounced keystroke") + f" searches={len(searches)}")
+    print(searches.summary("debounced search"))
+    print(
+        f"cache: {queries.info}, debouncer: calls={debouncer.calls} cancelled={debouncer.cancelled}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-keystroke latency of the search box."
+    )
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument(
+        "--interval", type=float, default=0.03, help="Seconds between keystrokes."
+    )
+    parser.add_argument(
+        "--delay", type=float, default=0.05, help="Seconds the search is debounced by."
+    )
+    parser.add_argument(
+        "--pause",
+        type=float,
+        default=0.5,
+        help="Seconds typing pauses after each phrase to read the results.",
+    )
+    parser.add_argument(
+        "--backspaces",
+        type=int,
+        default=3,
+        help="Characters deleted and typed again at the end of each phrase.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.jobs, args.interval, args.delay, args.backspaces, args.pause))
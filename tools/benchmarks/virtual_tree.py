@@ -0,0 +1,72 @@
+"""
+Compare frame times of a fully rendered tree with a virtual tree while scrolling through an expanded tree.
+
+    python -m tools.benchmarks.virtual_tree --rows 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+
+from rich.console import Console
+from rich.text import Text
+from rich.tree import Tree
+
+from jenkins_tui.renderables import VirtualTreeRenderable
+
+from ._common import Samples
+
+
+def label(index: int, cursor: int) -> Text:
+    text = Text(f"🔵 deploy-{index}", no_wrap=True, overflow="ellipsis")
+    if index == cursor:
+        text.stylize("reverse")
+    return text
+
+
+def main(rows: int, frames: int, height: int) -> None:
+    console = Console(file=io.StringIO(), width=40, height=height)
+    options = console.options.update(width=40, height=None)
+    folders = 20
+    per_folder = rows // folders
+    step = max(1, rows // frames)
+
+    full_samples = Samples()
+    for frame in range(frames):
+        cursor = frame * step
+        with full_samples.measure():
+            tree = Tree("home", guide_style="black")
+            for f in range(folders):
+                branch = tree.add(f"📂 folder-{f}")
+                for j in range(per_folder):
+                    branch.add(label(f * per_folder + j, cursor))
+
+            console.render_lines(tree, options)
+
+    virtual_samples = Samples()
+    for frame in range(frames):
+        cursor = frame * step
+        with virtual_samples.measure():
+            renderable = VirtualTreeRenderable(
+                total_rows=rows,
+                start=cursor - 20,
+                end=cursor + height + 20,
+                render_row=lambda index: Text("├── ", style="black")
+                + label(index, cursor),
+            )
+            console.render_lines(renderable, options)
+
+    print(full_samples.summary(f"full tree ({rows} rows)"))
+    print(virtual_samples.summary(f"virtual tree ({rows} rows)"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark full and virtual tree rendering."
+    )
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--height", type=int, default=50)
+    args = parser.parse_args()
+    main(args.rows, args.frames, args.height)